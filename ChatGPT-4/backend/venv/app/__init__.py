@@ -0,0 +1,64 @@
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from flask_cors import CORS
+from dotenv import load_dotenv
+import os
+from app.cache import ProductCache
+from app.images import ImageService
+from app.metrics import Metrics
+
+db = SQLAlchemy()
+product_cache = ProductCache()
+image_service = ImageService()
+metrics = Metrics()
+
+# config overrides the settings read from the environment; see wsgi.py
+def create_app(config=None):
+    load_dotenv()
+    app = Flask(__name__)
+    CORS(app, expose_headers=["X-Next-Cursor"])
+
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv("DATABASE_URL")
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    if not (app.config['SQLALCHEMY_DATABASE_URI'] or "").startswith("sqlite"):
+        # Connection pool settings; pre-ping drops connections the server
+        # has closed before they are handed out
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+            "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", 30)),
+            "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+            "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+        }
+    # The memory cache is per process, so set "redis" when running several
+    # workers (see cache.py)
+    app.config['PRODUCT_CACHE_BACKEND'] = os.getenv("PRODUCT_CACHE_BACKEND", "memory")
+    app.config['PRODUCT_CACHE_TTL'] = int(os.getenv("PRODUCT_CACHE_TTL", 60))
+    app.config['REDIS_URL'] = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    app.config['SLOW_QUERY_THRESHOLD_MS'] = int(os.getenv("SLOW_QUERY_THRESHOLD_MS", 200))
+    app.config['PROFILING_ENABLED'] = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+    # Set by gunicorn.conf.py when running more than one worker
+    app.config['METRICS_MULTIPROC_DIR'] = os.getenv("METRICS_MULTIPROC_DIR")
+    app.config['PASSWORD_HASH_METHOD'] = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    app.config.from_mapping(config or {})
+
+    db.init_app(app)
+    product_cache.init_app(app)
+    image_service.init_app(app)
+    metrics.init_app(app)
+
+    # Import and register blueprints here
+    from app.routes.auth_routes import auth_bp
+    from app.routes.product_routes import product_bp
+    from app.routes.cart_routes import cart_bp
+    from app.routes.checkout_routes import checkout_bp
+    from app.routes.order_routes import order_bp
+    
+    app.register_blueprint(order_bp)
+    app.register_blueprint(checkout_bp)
+    app.register_blueprint(cart_bp)
+    app.register_blueprint(auth_bp)
+    app.register_blueprint(product_bp)
+
+
+    return app
@@ -0,0 +1,404 @@
+import cProfile
+import glob
+import io
+import json
+import logging
+import os
+import pstats
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from flask import Response, current_app, g, has_app_context, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds (the prometheus_client defaults)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+# Prometheus-style histogram keyed by a tuple of label values
+class Histogram:
+    def __init__(self, name, help_text, label_names=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series["buckets"][i] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    # Series as JSON-friendly [labels, series] pairs
+    def snapshot(self):
+        with self._lock:
+            return [[list(labels), {**series, "buckets": list(series["buckets"])}]
+                    for labels, series in self._series.items()]
+
+    def reset(self):
+        with self._lock:
+            self._series = {}
+
+    # Render this process's series plus those in other processes' snapshots
+    def render(self, snapshots=()):
+        merged = {}
+        for pairs in [self.snapshot(), *snapshots]:
+            _merge_series(merged, pairs)
+
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(merged.items()):
+            pairs = [f'{n}="{_escape(v)}"' for n, v in zip(self.label_names, labels)]
+            for bound, count in zip(self.buckets, series["buckets"]):
+                lines.append(f"{self.name}_bucket{_format_labels(pairs, bound)} {count}")
+            lines.append(f"{self.name}_bucket{_format_labels(pairs, '+Inf')} {series['count']}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {series['sum']}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {series['count']}")
+        return lines
+
+# Add snapshot [labels, series] pairs into a dict keyed by label tuples
+def _merge_series(merged, pairs):
+    for labels, series in pairs:
+        total = merged.setdefault(tuple(labels), {"buckets": [0] * len(series["buckets"]), "sum": 0.0, "count": 0})
+        total["buckets"] = [a + b for a, b in zip(total["buckets"], series["buckets"])]
+        total["sum"] += series["sum"]
+        total["count"] += series["count"]
+
+def _format_labels(pairs, le=None):
+    if le is not None:
+        pairs = pairs + [f'le="{le}"']
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+# Timing of the current request. It is kept in the WSGI environ rather than
+# on g because a streamed body runs after the view's app context is gone,
+# and stream_with_context may give it a new app context with a new g.
+REQUEST_STATS_KEY = "metrics.request_stats"
+
+class RequestStats:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.query_count = 0
+        self.query_time = 0.0
+
+def _request_stats():
+    return request.environ.get(REQUEST_STATS_KEY) if has_request_context() else None
+
+# Raised by query_budget() when a block runs more statements than allowed
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+# Statement counters opened by query_budget(), shared by all threads
+_budget_counters = []
+
+# Fail when the wrapped block runs more than `limit` SQL statements, e.g.
+#
+#     with query_budget(3):
+#         client.get("/api/orders?userEmail=a@b.c")
+#
+# so N+1 regressions fail in CI instead of in production.
+@contextmanager
+def query_budget(limit):
+    statements = []
+    _budget_counters.append(statements)
+    try:
+        yield statements
+    finally:
+        _budget_counters.remove(statements)
+    if len(statements) > limit:
+        raise QueryBudgetExceeded(
+            f"{len(statements)} queries run, budget is {limit}:\n" + "\n".join(statements)
+        )
+
+# Multiprocess mode. Under several gunicorn workers each process only sees
+# its own requests, so with METRICS_MULTIPROC_DIR set every worker writes its
+# counts to metrics-<pid>-<start>.json there and /metrics adds up all files.
+# When a worker exits the master folds its file into the archive (see
+# mark_process_dead) so totals never go down and files don't pile up.
+ARCHIVE_FILE = "archive.json"
+
+def _empty_snapshot():
+    return {"histograms": {}, "slow_queries": 0, "product_cache": {"hits": 0, "misses": 0}}
+
+def _add_snapshot(total, snapshot):
+    for name, pairs in snapshot["histograms"].items():
+        merged = {tuple(labels): series for labels, series in total["histograms"].get(name, [])}
+        _merge_series(merged, pairs)
+        total["histograms"][name] = [[list(labels), series] for labels, series in merged.items()]
+    total["slow_queries"] += snapshot["slow_queries"]
+    for name in ("hits", "misses"):
+        total["product_cache"][name] += snapshot["product_cache"][name]
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+# Replace `path` atomically so readers never see a half-written file
+def _write_json(path, data):
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+# Snapshots of all live and exited workers except the file `own_file`
+def _read_snapshots(directory, own_file):
+    snapshots = {}
+    for path in glob.glob(os.path.join(directory, "metrics-*.json")):
+        name = os.path.basename(path)
+        snapshot = _read_json(path) if name != own_file else None
+        if snapshot is not None:
+            snapshots[name] = snapshot
+
+    # Read the archive last: a worker file read above and archived since is
+    # then listed in "merged" and only counted once
+    archive = _read_json(os.path.join(directory, ARCHIVE_FILE))
+    if archive is not None:
+        for name in archive["merged"]:
+            snapshots.pop(name, None)
+        snapshots[ARCHIVE_FILE] = archive["snapshot"]
+    return list(snapshots.values())
+
+# Fold the snapshot of an exited worker into the archive. Called by the
+# gunicorn master from child_exit, so there is only ever one writer.
+def mark_process_dead(directory, pid):
+    paths = glob.glob(os.path.join(directory, f"metrics-{pid}-*.json"))
+    if not paths:
+        return
+    archive_path = os.path.join(directory, ARCHIVE_FILE)
+    archive = _read_json(archive_path) or {"snapshot": _empty_snapshot(), "merged": []}
+    for path in paths:
+        snapshot = _read_json(path)
+        if snapshot is not None:
+            _add_snapshot(archive["snapshot"], snapshot)
+
+    # Keep the names of archived files only while they still exist
+    archive["merged"] = [name for name in archive["merged"] if os.path.exists(os.path.join(directory, name))]
+    archive["merged"] += [os.path.basename(path) for path in paths]
+    _write_json(archive_path, archive)
+    for path in paths:
+        os.remove(path)
+
+# Remove the snapshots of a previous run, before any worker starts
+def clear_snapshots(directory):
+    for path in glob.glob(os.path.join(directory, "*.json")):
+        os.remove(path)
+
+# Request and SQL instrumentation with a Prometheus /metrics endpoint.
+#
+# Config:
+#   METRICS_ENABLED          register the hooks and /metrics (default True)
+#   SLOW_QUERY_THRESHOLD_MS  log statements slower than this (default 200)
+#   PROFILING_ENABLED        allow ?profile=1 to return a cProfile report
+#                            instead of the response (default False)
+#   METRICS_MULTIPROC_DIR    share counts between worker processes through
+#                            this directory (unset: this process only)
+#   METRICS_FLUSH_INTERVAL   seconds between a worker's snapshot writes
+#                            (default 1)
+class Metrics:
+    def __init__(self, app=None):
+        self.request_latency = Histogram(
+            "http_request_duration_seconds", "Request latency by endpoint",
+            ("endpoint", "method", "status")
+        )
+        self.request_queries = Histogram(
+            "http_request_db_queries", "SQL statements run per request",
+            ("endpoint",), QUERY_COUNT_BUCKETS
+        )
+        self.query_latency = Histogram("db_query_duration_seconds", "SQL statement latency")
+        self.slow_queries = 0
+        self.slow_query_threshold = 0.2
+        self.profiling_enabled = False
+        self.multiproc_dir = None
+        self.flush_interval = 1.0
+        self._app = None
+        self._snapshot_file = None
+        self._dirty = False
+        self._flusher = None
+        self._flusher_lock = threading.Lock()
+        self._fork_hook = False
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        if not app.config.get("METRICS_ENABLED", True):
+            return
+        self.slow_query_threshold = app.config.get("SLOW_QUERY_THRESHOLD_MS", 200) / 1000
+        self.profiling_enabled = app.config.get("PROFILING_ENABLED", False)
+        self.multiproc_dir = app.config.get("METRICS_MULTIPROC_DIR")
+        if self.multiproc_dir:
+            self.flush_interval = app.config.get("METRICS_FLUSH_INTERVAL", 1.0)
+            os.makedirs(self.multiproc_dir, exist_ok=True)
+            self._app = app
+            if not self._fork_hook:
+                os.register_at_fork(after_in_child=self._start_process)
+                self._fork_hook = True
+            self._start_process()
+
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.add_url_rule("/metrics", "metrics", self.render)
+        self._listen_to_engines()
+        app.extensions["metrics"] = self
+
+    def _listen_to_engines(self):
+        if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+    def _histograms(self):
+        return (self.request_latency, self.request_queries, self.query_latency)
+
+    # A forked worker starts from zero with a file of its own, so nothing
+    # the master recorded is counted twice and a reused pid never writes
+    # over an exited worker's snapshot
+    def _start_process(self):
+        for histogram in self._histograms():
+            histogram.reset()
+        self.slow_queries = 0
+        self._snapshot_file = f"metrics-{os.getpid()}-{time.time_ns()}.json"
+        self._dirty = False
+        self._flusher = None  # threads don't survive fork
+        self._flusher_lock = threading.Lock()
+
+    def _snapshot(self):
+        snapshot = _empty_snapshot()
+        snapshot["histograms"] = {h.name: h.snapshot() for h in self._histograms()}
+        snapshot["slow_queries"] = self.slow_queries
+        cache = current_app.extensions.get("product_cache") if has_app_context() else None
+        if cache is not None:
+            stats = cache.stats()
+            snapshot["product_cache"] = {"hits": stats["hits"], "misses": stats["misses"]}
+        return snapshot
+
+    # Write this process's counts to its file in METRICS_MULTIPROC_DIR. Runs
+    # every METRICS_FLUSH_INTERVAL seconds while there are new counts, and
+    # from gunicorn's worker_exit hook.
+    def flush(self):
+        if not self.multiproc_dir:
+            return
+        self._dirty = False
+        _write_json(os.path.join(self.multiproc_dir, self._snapshot_file), self._snapshot())
+
+    # Started by the first request of each process, so it runs in workers
+    # whether or not the app was preloaded in the master
+    def _start_flusher(self):
+        with self._flusher_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_periodically, name="metrics-flush", daemon=True)
+                self._flusher.start()
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self.flush_interval)
+            if self._dirty:
+                with self._app.app_context():
+                    self.flush()
+
+    def record_query(self, statement, elapsed):
+        self.query_latency.observe(elapsed)
+        self._dirty = True
+        stats = _request_stats()
+        if stats is not None:
+            stats.query_count += 1
+            stats.query_time += elapsed
+
+        if elapsed >= self.slow_query_threshold:
+            self.slow_queries += 1
+            logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement)
+
+    def _before_request(self):
+        request.environ[REQUEST_STATS_KEY] = RequestStats()
+        if self.profiling_enabled and request.args.get("profile"):
+            g.profiler = cProfile.Profile()
+            g.profiler.enable()
+
+    def _observe(self, stats, endpoint, method, status_code):
+        elapsed = time.perf_counter() - stats.start
+        self.request_latency.observe(elapsed, endpoint, method, str(status_code))
+        self.request_queries.observe(stats.query_count, endpoint)
+        if self.multiproc_dir:
+            self._dirty = True
+            if self._flusher is None:
+                self._start_flusher()
+        return elapsed
+
+    def _after_request(self, response):
+        stats = _request_stats()
+        if stats is None:
+            return response
+        endpoint = request.endpoint or "unmatched"
+        profiler = g.pop("profiler", None)
+
+        # A streamed body (NDJSON listings) is generated, queries and all,
+        # after this hook returns, so observe the request once the server
+        # closes the stream. Headers are sent before the body, so streamed
+        # responses carry no X-Query-Count or Server-Timing.
+        if response.is_streamed and profiler is None:
+            method, status_code = request.method, response.status_code
+            response.call_on_close(lambda: self._observe(stats, endpoint, method, status_code))
+            return response
+
+        elapsed = self._observe(stats, endpoint, request.method, response.status_code)
+        response.headers["X-Query-Count"] = str(stats.query_count)
+        response.headers["Server-Timing"] = \
+            f"db;dur={stats.query_time * 1000:.1f}, total;dur={elapsed * 1000:.1f}"
+
+        if profiler is not None:
+            profiler.disable()
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(40)
+            return Response(output.getvalue(), mimetype="text/plain")
+        return response
+
+    # Prometheus text exposition format, for all workers in multiprocess mode
+    def render(self):
+        snapshots = _read_snapshots(self.multiproc_dir, self._snapshot_file) if self.multiproc_dir else []
+        lines = []
+        for histogram in self._histograms():
+            lines.extend(histogram.render([s["histograms"].get(histogram.name, []) for s in snapshots]))
+        lines += [
+            "# HELP db_slow_queries_total SQL statements over the slow query threshold",
+            "# TYPE db_slow_queries_total counter",
+            f"db_slow_queries_total {self.slow_queries + sum(s['slow_queries'] for s in snapshots)}"
+        ]
+
+        cache = current_app.extensions.get("product_cache")
+        if cache is not None:
+            stats = cache.stats()
+            for name in ("hits", "misses"):
+                lines += [
+                    f"# HELP product_cache_{name}_total Product cache {name}",
+                    f"# TYPE product_cache_{name}_total counter",
+                    f"product_cache_{name}_total {stats[name] + sum(s['product_cache'][name] for s in snapshots)}"
+                ]
+
+        return Response("\n".join(lines) + "\n", mimetype="text/plain; version=0.0.4")
+
+# Engine-wide SQL timing hooks, registered once per process and reported to
+# the Metrics instance of the current app
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start_time = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_start_time
+    for statements in _budget_counters:
+        statements.append(statement)
+
+    metrics = current_app.extensions.get("metrics") if has_app_context() else None
+    if metrics is not None:
+        metrics.record_query(statement, elapsed)
@@ -0,0 +1,55 @@
+from app import db
+import uuid
+from datetime import datetime
+from app import db
+
+class MsUser(db.Model):
+    __tablename__ = 'MsUser'
+
+    email = db.Column(db.String(100), primary_key=True)
+    password = db.Column(db.String(255), nullable=False)
+    role = db.Column(db.String(15), nullable=False)
+
+class MsProduct(db.Model):
+    __tablename__ = 'MsProduct'
+
+    product_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    product_name = db.Column(db.String(50), nullable=False)
+    product_description = db.Column(db.Text)
+    product_images = db.Column(db.JSON)  # list of image URLs
+    product_price = db.Column(db.Numeric(10, 2), nullable=False)
+    product_stock = db.Column(db.Integer, nullable=False)
+    product_owner = db.Column(db.String(100), db.ForeignKey("MsUser.email"), nullable=False)
+
+class Cart(db.Model):
+    __tablename__ = 'Cart'
+    product_id = db.Column(db.String(36), db.ForeignKey("MsProduct.product_id"), primary_key=True)
+    customer = db.Column(db.String(255), db.ForeignKey("MsUser.email"), primary_key=True)
+    quantity = db.Column(db.Integer, nullable=False, default=1)
+
+class Order(db.Model):
+    __tablename__ = 'Orders'
+    __table_args__ = (
+        db.Index("ix_Orders_product_status_time", "product_id", "status", "timestamp"),
+    )
+    order_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    product_id = db.Column(db.String(36), db.ForeignKey("MsProduct.product_id"), nullable=False)
+    quantity = db.Column(db.Integer, nullable=False)
+    unit_price = db.Column(db.Numeric(10, 2), nullable=False)  # price paid, kept when the product price changes
+    customer = db.Column(db.String(255), db.ForeignKey("MsUser.email"), nullable=False)
+    status = db.Column(db.String(15), default="Pending", nullable=False)
+    timestamp = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+# Daily order totals per product and status, maintained by app/order_stats.py
+class OrderDailyStats(db.Model):
+    __tablename__ = 'OrderDailyStats'
+    __table_args__ = (
+        db.Index("ix_OrderDailyStats_seller_day", "seller", "day"),
+    )
+    product_id = db.Column(db.String(36), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    status = db.Column(db.String(15), primary_key=True)
+    seller = db.Column(db.String(100), nullable=False)
+    order_count = db.Column(db.Integer, nullable=False, default=0)
+    units = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Numeric(14, 2), nullable=False, default=0)
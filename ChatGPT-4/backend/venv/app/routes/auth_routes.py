@@ -0,0 +1,60 @@
+from functools import lru_cache
+from flask import Blueprint, current_app, request, jsonify
+from app.models import MsUser
+from app import db
+from werkzeug.security import generate_password_hash, check_password_hash
+
+auth_bp = Blueprint('auth', __name__, url_prefix="/auth")
+
+# Hash with the configured PASSWORD_HASH_METHOD, a full werkzeug method string
+# including its cost parameters such as "pbkdf2:sha256:600000"
+def hash_password(password):
+    method = current_app.config.get("PASSWORD_HASH_METHOD")
+    if method:
+        return generate_password_hash(password, method=method)
+    return generate_password_hash(password)
+
+# The method prefix werkzeug writes for `method`, which expands short forms
+# such as "pbkdf2" to "pbkdf2:sha256:1000000". Cached since it costs a hash.
+@lru_cache(maxsize=None)
+def _hash_prefix(method):
+    return generate_password_hash("", method=method).split("$", 1)[0]
+
+def needs_rehash(password_hash):
+    method = current_app.config.get("PASSWORD_HASH_METHOD")
+    return bool(method) and password_hash.split("$", 1)[0] != _hash_prefix(method)
+
+@auth_bp.route("/register", methods=["POST"])
+def register():
+    data = request.json
+    email = data.get("email")
+    password = data.get("password")
+    role = data.get("role")
+
+    if MsUser.query.filter_by(email=email).first():
+        return jsonify({"error": "Email already registered"}), 400
+
+    hashed = hash_password(password)
+    user = MsUser(email=email, password=hashed, role=role)
+    db.session.add(user)
+    db.session.commit()
+
+    return jsonify({"message": "User registered successfully"}), 201
+
+@auth_bp.route("/login", methods=["POST"])
+def login():
+    data = request.json
+    email = data.get("email")
+    password = data.get("password")
+
+    user = MsUser.query.filter_by(email=email).first()
+    if not user or not check_password_hash(user.password, password):
+        return jsonify({"error": "Invalid credentials"}), 401
+
+    # Upgrade hashes made with outdated cost parameters while the plain
+    # password is at hand
+    if needs_rehash(user.password):
+        user.password = hash_password(password)
+        db.session.commit()
+
+    return jsonify({"message": "Login successful", "role": user.role, "email": user.email}), 200
@@ -0,0 +1,73 @@
+from flask import Blueprint, current_app, request, jsonify
+from app import db, order_stats, product_cache
+from app.models import MsProduct, Cart, Order
+from datetime import datetime
+import uuid
+
+checkout_bp = Blueprint("checkout", __name__, url_prefix="/checkout")
+
+@checkout_bp.route("/", methods=["POST"])
+def checkout():
+    data = request.json
+    customer = data.get("customer")
+    payment_method = data.get("payment_method")
+    shipping_address = data.get("shipping_address")
+
+    if not all([customer, payment_method, shipping_address]):
+        return jsonify({"error": "Missing checkout fields"}), 400
+
+    # Lock the cart so a second checkout of it waits for this one and then
+    # finds the cart empty instead of ordering the same items again
+    cart_items = Cart.query.filter_by(customer=customer)\
+        .order_by(Cart.product_id).with_for_update().all()
+    if not cart_items:
+        return jsonify({"error": "Cart is empty"}), 400
+
+    # Load and lock all cart products in one query, in a stable order so
+    # concurrent checkouts can't deadlock or oversell
+    products = MsProduct.query.filter(
+        MsProduct.product_id.in_([item.product_id for item in cart_items])
+    ).order_by(MsProduct.product_id).with_for_update().all()
+    products_by_id = {p.product_id: p for p in products}
+
+    for item in cart_items:
+        product = products_by_id.get(item.product_id)
+        if not product or product.product_stock < item.quantity:
+            db.session.rollback()
+            return jsonify({"error": f"Item '{product.product_name if product else item.product_id}' is out of stock"}), 400
+
+    timestamp = datetime.utcnow()
+    orders_created = [
+        Order(
+            order_id=str(uuid.uuid4()),
+            product_id=item.product_id,
+            quantity=item.quantity,
+            unit_price=products_by_id[item.product_id].product_price,
+            customer=customer,
+            status="Pending",
+            timestamp=timestamp
+        )
+        for item in cart_items
+    ]
+    db.session.add_all(orders_created)
+
+    # Reduce stock
+    for item in cart_items:
+        products_by_id[item.product_id].product_stock -= item.quantity
+
+    # Count the orders in the sellers' summary rows
+    order_stats.record_orders(orders_created, {
+        product_id: p.product_owner for product_id, p in products_by_id.items()
+    })
+
+    # Clear cart
+    Cart.query.filter_by(customer=customer).delete(synchronize_session=False)
+
+    try:
+        db.session.commit()
+        product_cache.invalidate(*products_by_id)
+        return jsonify({"message": "Checkout successful", "orders": [o.order_id for o in orders_created]}), 200
+    except Exception:
+        current_app.logger.exception("Error during checkout")
+        db.session.rollback()
+        return jsonify({"error": "Checkout failed"}), 500
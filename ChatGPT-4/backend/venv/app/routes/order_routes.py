@@ -0,0 +1,76 @@
+from flask import Blueprint, request, jsonify
+from app import db, order_stats
+from app.models import Order, MsProduct
+
+order_bp = Blueprint("orders", __name__, url_prefix="/orders")
+
+ORDER_STATUSES = ["Pending", "Accepted", "Shipped", "Completed"]
+
+# Get orders for customer
+@order_bp.route("/customer/<email>", methods=["GET"])
+def get_customer_orders(email):
+    rows = db.session.query(Order, MsProduct)\
+        .outerjoin(MsProduct, Order.product_id == MsProduct.product_id)\
+        .filter(Order.customer == email)\
+        .order_by(Order.timestamp.desc())\
+        .all()
+    return jsonify([format_order(o, p) for o, p in rows]), 200
+
+# Get orders for seller (all products owned by them)
+@order_bp.route("/seller/<email>", methods=["GET"])
+def get_seller_orders(email):
+    rows = db.session.query(Order, MsProduct)\
+        .join(MsProduct, Order.product_id == MsProduct.product_id)\
+        .filter(MsProduct.product_owner == email)\
+        .order_by(Order.timestamp.desc())\
+        .all()
+
+    return jsonify([format_order(o, p) for o, p in rows]), 200
+
+# Dashboard aggregates for a seller, read from the precomputed summary rows
+@order_bp.route("/seller/<email>/analytics", methods=["GET"])
+def get_seller_analytics(email):
+    try:
+        days = int(request.args.get("days", order_stats.DEFAULT_WINDOW_DAYS))
+    except ValueError:
+        return jsonify({"error": "days must be an integer"}), 400
+    days = max(1, min(days, order_stats.MAX_WINDOW_DAYS))
+
+    return jsonify(order_stats.seller_analytics(email, days)), 200
+
+# Update order status
+@order_bp.route("/status", methods=["PUT"])
+def update_order_status():
+    data = request.json
+    order_id = data.get("order_id")
+    new_status = data.get("status")
+    if new_status not in ORDER_STATUSES:
+        return jsonify({"error": "Invalid status"}), 400
+
+    # Lock the order so concurrent updates move it between summary rows once
+    order = Order.query.filter_by(order_id=order_id).with_for_update().first()
+    if not order:
+        return jsonify({"error": "Order not found"}), 404
+
+    old_status = order.status
+    order.status = new_status
+    if new_status != old_status:
+        seller = db.session.query(MsProduct.product_owner)\
+            .filter(MsProduct.product_id == order.product_id)\
+            .scalar()
+        if seller:
+            order_stats.move_order(order, seller, old_status)
+    db.session.commit()
+    return jsonify({"message": f"Order updated to {new_status}"}), 200
+
+def format_order(o, product):
+    return {
+        "order_id": o.order_id,
+        "product_id": o.product_id,
+        "product_name": product.product_name if product else "",
+        "product_image": product.product_images[0] if product and product.product_images else "",
+        "quantity": o.quantity,
+        "customer": o.customer,
+        "status": o.status,
+        "timestamp": o.timestamp.isoformat(),
+    }
@@ -0,0 +1,162 @@
+from flask import Blueprint, current_app, request, jsonify
+from app import image_service, product_cache
+from app.images import InvalidImage
+from app.models import MsProduct, db
+from app.pagination import get_page_args, ndjson_response, paginate, stream_ndjson, wants_stream
+from app.search import get_search_engine, tokenize
+from sqlalchemy.exc import SQLAlchemyError
+
+product_bp = Blueprint("product", __name__, url_prefix="/products")
+
+# Thumbnail edge length used for catalog listings
+LISTING_THUMBNAIL_SIZE = 256
+
+@product_bp.route("/search", methods=["GET"])
+def search_products():
+    query = request.args.get("q", "").strip().lower()
+    limit, cursor = get_page_args()
+    products_query = MsProduct.query.filter(MsProduct.product_stock > 0)
+
+    try:
+        if tokenize(query):
+            engine = get_search_engine()
+            if wants_stream():
+                return ndjson_response(engine.iter_search(products_query, query, cursor), format_product)
+            products, next_cursor = engine.search(products_query, query, cursor, limit)
+        else:
+            if wants_stream():
+                return stream_ndjson(products_query, [MsProduct.product_id], format_product, cursor)
+            products, next_cursor = paginate(
+                products_query, [MsProduct.product_id], lambda p: [p.product_id], cursor, limit
+            )
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+
+    if not products and not cursor:
+        return jsonify({"error": "No products found"}), 404
+
+    return page_response([format_product(p) for p in products], next_cursor)
+
+@product_bp.route("/detail/<product_id>", methods=["GET"])
+def get_product_detail(product_id):
+    def load_product():
+        product = MsProduct.query.get(product_id)
+        return format_product(product) if product else None
+
+    product, etag = product_cache.get_or_load(product_id, load_product)
+    if product is None:
+        return jsonify({"error": "Product not found"}), 404
+
+    # 304 Not Modified when the client's If-None-Match still matches
+    response = jsonify(product)
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+@product_bp.route("/cache/stats", methods=["GET"])
+def get_product_cache_stats():
+    return jsonify(product_cache.stats()), 200
+
+
+@product_bp.route("/<email>", methods=["GET"])
+def get_products(email):
+    limit, cursor = get_page_args()
+    products_query = MsProduct.query.filter_by(product_owner=email)
+
+    try:
+        if wants_stream():
+            return stream_ndjson(products_query, [MsProduct.product_id], format_product, cursor)
+        products, next_cursor = paginate(
+            products_query, [MsProduct.product_id], lambda p: [p.product_id], cursor, limit
+        )
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+
+    return page_response([format_product(p) for p in products], next_cursor)
+
+# Upload an image; the returned URL goes in a product's "images" list
+@product_bp.route("/images", methods=["POST"])
+def upload_image():
+    file = request.files.get("image")
+    if not file or not file.filename:
+        return jsonify({"error": "No image provided"}), 400
+
+    try:
+        url = image_service.save_upload(file)
+    except InvalidImage as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({
+        "url": url,
+        "thumbnail": image_service.thumbnail_url(url, LISTING_THUMBNAIL_SIZE)
+    }), 201
+
+@product_bp.route("/", methods=["POST"])
+def create_product():
+    data = request.json
+    try:
+        new_product = MsProduct(
+            product_name=data["name"],
+            product_description=data.get("description", ""),
+            product_images=data.get("images", []),
+            product_price=data["price"],
+            product_stock=data["stock"],
+            product_owner=data["owner"]
+        )
+        db.session.add(new_product)
+        db.session.commit()
+        return jsonify({"message": "Product created successfully"}), 201
+    except SQLAlchemyError:
+        current_app.logger.exception("Error creating product")
+        db.session.rollback()
+        return jsonify({"error": "Failed to create product"}), 400
+
+@product_bp.route("/<product_id>", methods=["PUT"])
+def update_product(product_id):
+    data = request.json
+    product = MsProduct.query.get(product_id)
+    if not product:
+        return jsonify({"error": "Product not found"}), 404
+
+    try:
+        product.product_name = data["name"]
+        product.product_description = data.get("description", "")
+        product.product_images = data.get("images", [])
+        product.product_price = data["price"]
+        product.product_stock = data["stock"]
+        db.session.commit()
+        product_cache.invalidate(product_id)
+        return jsonify({"message": "Product updated successfully"}), 200
+    except SQLAlchemyError:
+        current_app.logger.exception("Error updating product")
+        db.session.rollback()
+        return jsonify({"error": "Failed to update product"}), 400
+
+@product_bp.route("/<product_id>", methods=["DELETE"])
+def delete_product(product_id):
+    product = MsProduct.query.get(product_id)
+    if not product:
+        return jsonify({"error": "Product not found"}), 404
+    db.session.delete(product)
+    db.session.commit()
+    product_cache.invalidate(product_id)
+    return jsonify({"message": "Product deleted"}), 200
+
+def format_product(p):
+    return {
+        "id": p.product_id,
+        "name": p.product_name,
+        "description": p.product_description,
+        "images": p.product_images or [],
+        "thumbnail": image_service.thumbnail_url(first_image(p), LISTING_THUMBNAIL_SIZE),
+        "price": str(p.product_price),
+        "stock": p.product_stock
+    }
+
+def first_image(p):
+    return p.product_images[0] if p.product_images else ""
+
+# Listing responses stay a bare list; the next page cursor goes in a header
+def page_response(items, next_cursor):
+    response = jsonify(items)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response, 200
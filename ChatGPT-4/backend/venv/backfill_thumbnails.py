@@ -0,0 +1,29 @@
+# Write the missing thumbnails of every product image, e.g. for images
+# uploaded while Pillow was not installed or whose background job failed:
+#
+#   python backfill_thumbnails.py
+#
+# Until a thumbnail exists, listings keep serving the original image.
+import sys
+from app import create_app, db, image_service, images
+from app.models import MsProduct
+
+def main():
+    if images.Image is None:
+        sys.exit("Pillow is not installed, so no thumbnails can be made")
+
+    app = create_app()
+    with app.app_context():
+        urls = sorted({
+            url
+            for (product_images,) in db.session.query(MsProduct.product_images).yield_per(1000)
+            for url in product_images or []
+        })
+        written = 0
+        for n, url in enumerate(urls, 1):
+            written += image_service.backfill(url)
+            print(f"{n}/{len(urls)} images, {written} thumbnails written", end="\r")
+        print()
+
+if __name__ == "__main__":
+    main()
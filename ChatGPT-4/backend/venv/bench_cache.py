@@ -0,0 +1,74 @@
+# Measure GET /products/detail/<id> throughput with each product cache
+# backend, many threads reading a hot set of products:
+#
+#   python bench_cache.py --products 10000
+#   python bench_cache.py --bench-only --requests 50000 --backends none memory redis
+#
+# The redis backend needs a server at REDIS_URL; without one it falls back
+# to memory and the row is labelled memory. This measures one process; for
+# HTTP numbers through gunicorn, run tools/loadtest.py against a server
+# started with each PRODUCT_CACHE_BACKEND.
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from app import create_app
+from app.models import MsProduct
+from bench_search import percentile, seed_products
+
+BACKENDS = ["none", "memory", "redis"]
+
+def run_requests(app, paths, threads):
+    local = threading.local()
+
+    def fetch(path):
+        if not hasattr(local, "client"):
+            local.client = app.test_client()
+        started = time.perf_counter()
+        status = local.client.get(path).status_code
+        return status, (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(fetch, paths))
+    return results, time.perf_counter() - started
+
+def bench(backend, hot, requests, threads):
+    os.environ["PRODUCT_CACHE_BACKEND"] = backend
+    app = create_app()
+    cache = app.extensions["product_cache"]
+    with app.app_context():
+        product_ids = [p.product_id for p in MsProduct.query.limit(hot)]
+    paths = [f"/products/detail/{product_ids[n % len(product_ids)]}" for n in range(requests)]
+
+    hits_before = cache.stats()["hits"]
+    results, elapsed = run_requests(app, paths, threads)
+    timings = sorted(ms for _, ms in results)
+    failed = sum(status != 200 for status, _ in results)
+    print(f"{cache.stats()['backend']:<8}{requests / elapsed:>10.1f}{percentile(timings, 50):>10.2f}"
+          f"{percentile(timings, 99):>10.2f}{(cache.stats()['hits'] - hits_before) / requests:>8.0%}{failed:>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark product detail throughput per cache backend")
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=10000)
+    parser.add_argument("--hot", type=int, default=200, help="distinct products requested")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=["none", "memory"])
+    parser.add_argument("--bench-only", action="store_true")
+    args = parser.parse_args()
+
+    if not args.bench_only:
+        app = create_app()
+        with app.app_context():
+            seed_products(args.products, args.batch)
+
+    print(f"{args.requests} requests over {args.hot} products, {args.threads} threads")
+    print(f'{"backend":<8}{"req/s":>10}{"p50 ms":>10}{"p99 ms":>10}{"hits":>8}{"failed":>8}')
+    for backend in args.backends:
+        bench(backend, args.hot, args.requests, args.threads)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# Compare the peak memory (RSS) and time of listing all of a seller's
+# products as one JSON array, as GET /products/<email> did before
+# pagination, with walking the keyset pages and with the NDJSON stream:
+#
+#   python bench_listing.py --products 200000
+#   python bench_listing.py --bench-only --page-size 200
+#
+# Each mode runs in a fresh process because ru_maxrss only ever grows.
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from flask import jsonify
+from app import create_app
+from app.models import MsProduct
+from app.routes.product_routes import format_product
+from bench_search import SELLER, seed_products
+
+MODES = ["unbounded", "pages", "ndjson"]
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+# All of the seller's products built and serialized in memory at once
+def list_unbounded(app, client, page_size):
+    with app.test_request_context():
+        products = MsProduct.query.filter_by(product_owner=SELLER).all()
+        body = jsonify([format_product(p) for p in products]).get_data()
+    return len(json.loads(body))
+
+def list_pages(app, client, page_size):
+    count, cursor = 0, None
+    while True:
+        params = {"limit": page_size, **({"cursor": cursor} if cursor else {})}
+        response = client.get(f"/products/{SELLER}", query_string=params)
+        count += len(response.get_json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return count
+
+def list_ndjson(app, client, page_size):
+    response = client.get(f"/products/{SELLER}?format=ndjson", buffered=False)
+    count = sum(chunk.count(b"\n") for chunk in response.response)
+    response.close()
+    return count
+
+def run_mode(mode, page_size):
+    app = create_app()
+    client = app.test_client()
+    with app.app_context():
+        client.get(f"/products/{SELLER}?limit=1")  # load modules and open the pool first
+        baseline = peak_rss_mb()
+        started = time.perf_counter()
+        count = {"unbounded": list_unbounded, "pages": list_pages, "ndjson": list_ndjson}[mode](app, client, page_size)
+        elapsed = time.perf_counter() - started
+    print(json.dumps({"count": count, "seconds": elapsed, "peak_mb": peak_rss_mb(), "extra_mb": peak_rss_mb() - baseline}))
+
+def bench(page_size):
+    print(f'{"mode":<12}{"products":>10}{"seconds":>10}{"peak MB":>10}{"+MB":>8}')
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--page-size", str(page_size)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f'{mode:<12}{result["count"]:>10}{result["seconds"]:>10.2f}'
+              f'{result["peak_mb"]:>10.1f}{result["extra_mb"]:>8.1f}')
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark memory use of full product listings")
+    parser.add_argument("--products", type=int, default=100000)
+    parser.add_argument("--batch", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--bench-only", action="store_true")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.page_size)
+        return
+
+    if not args.bench_only:
+        app = create_app()
+        with app.app_context():
+            seed_products(args.products, args.batch)
+    bench(args.page_size)
+
+if __name__ == "__main__":
+    main()
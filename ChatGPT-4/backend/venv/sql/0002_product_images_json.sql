@@ -0,0 +1,9 @@
+-- Store product images as a JSON array of URLs instead of a comma-joined
+-- string, so reads no longer have to split it (app/models.py).
+
+ALTER TABLE "MsProduct"
+    ALTER COLUMN product_images TYPE json
+    USING CASE
+        WHEN product_images IS NULL OR product_images = '' THEN '[]'::json
+        ELSE to_json(string_to_array(product_images, ','))
+    END;
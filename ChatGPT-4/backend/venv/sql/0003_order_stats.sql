@@ -0,0 +1,41 @@
+-- Seller analytics (app/order_stats.py). The backfill equals
+-- order_stats.rebuild().
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS "ix_Orders_product_status_time"
+    ON "Orders" (product_id, status, timestamp);
+
+-- Price paid per unit, so revenue does not follow later price edits.
+-- Existing orders take the current price, or 0 if the product is gone.
+ALTER TABLE "Orders" ADD COLUMN IF NOT EXISTS unit_price numeric(10, 2);
+UPDATE "Orders" o
+    SET unit_price = p.product_price
+    FROM "MsProduct" p
+    WHERE o.unit_price IS NULL AND o.product_id = p.product_id;
+UPDATE "Orders" SET unit_price = 0 WHERE unit_price IS NULL;
+ALTER TABLE "Orders" ALTER COLUMN unit_price SET NOT NULL;
+
+CREATE TABLE IF NOT EXISTS "OrderDailyStats" (
+    product_id varchar(36) NOT NULL,
+    day date NOT NULL,
+    status varchar(15) NOT NULL,
+    seller varchar(100) NOT NULL,
+    order_count integer NOT NULL DEFAULT 0,
+    units integer NOT NULL DEFAULT 0,
+    revenue numeric(14, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (product_id, day, status)
+);
+
+CREATE INDEX IF NOT EXISTS "ix_OrderDailyStats_seller_day"
+    ON "OrderDailyStats" (seller, day);
+
+DELETE FROM "OrderDailyStats";
+INSERT INTO "OrderDailyStats" (product_id, day, status, seller, order_count, units, revenue)
+SELECT o.product_id, o.timestamp::date, o.status, p.product_owner,
+       count(*), sum(o.quantity), sum(o.quantity * o.unit_price)
+FROM "Orders" o
+JOIN "MsProduct" p ON o.product_id = p.product_id
+GROUP BY 1, 2, 3, 4;
+
+COMMIT;
@@ -0,0 +1,22 @@
+import os
+import pytest
+
+# Point the app at a throwaway database before create_app() reads the
+# environment; set TEST_DATABASE_URL to run the suite against Postgres
+os.environ["DATABASE_URL"] = os.getenv("TEST_DATABASE_URL", "sqlite://")
+
+from app import create_app, db
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,58 @@
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+import pytest
+from app import db
+from app.metrics import query_budget
+from app.models import MsProduct, MsUser, Order
+
+SELLER = "seller@example.com"
+CUSTOMER = "customer@example.com"
+N = 5
+QUERY_BUDGET = 1
+
+def seed_orders(count):
+    if not db.session.get(MsUser, SELLER):
+        db.session.add_all([
+            MsUser(email=SELLER, password="x", role="Seller"),
+            MsUser(email=CUSTOMER, password="x", role="Customer"),
+        ])
+        db.session.add_all([
+            MsProduct(product_name=f"Product {n}", product_images=[f"/static/{n}.jpg"],
+                      product_price=Decimal("9.99"), product_stock=100, product_owner=SELLER)
+            for n in range(3)
+        ])
+        db.session.flush()
+
+    products = MsProduct.query.order_by(MsProduct.product_name).all()
+    now = datetime.utcnow()
+    db.session.add_all([
+        Order(
+            order_id=str(uuid.uuid4()),
+            product_id=products[n % len(products)].product_id,
+            quantity=1,
+            unit_price=Decimal("9.99"),
+            customer=CUSTOMER,
+            status="Pending",
+            timestamp=now - timedelta(minutes=n),
+        )
+        for n in range(count)
+    ])
+    db.session.commit()
+
+def get_orders(client, url):
+    with query_budget(QUERY_BUDGET) as statements:
+        response = client.get(url)
+    assert response.status_code == 200, response.json
+    return response.json, len(statements)
+
+@pytest.mark.parametrize("url", [f"/orders/customer/{CUSTOMER}", f"/orders/seller/{SELLER}"])
+def test_order_listing_runs_a_constant_number_of_queries(client, url):
+    seed_orders(N)
+    orders, queries = get_orders(client, url)
+    assert len(orders) == N
+
+    seed_orders(9 * N)
+    orders, queries_for_10n = get_orders(client, url)
+    assert len(orders) == 10 * N
+    assert queries_for_10n == queries
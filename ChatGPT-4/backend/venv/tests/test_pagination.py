@@ -0,0 +1,84 @@
+import base64
+import json
+from decimal import Decimal
+import pytest
+from app.models import MsProduct, MsUser, db
+from app.pagination import encode_cursor
+
+SELLER = "seller@example.com"
+PRODUCTS = 23
+PAGE_SIZE = 7
+
+@pytest.fixture
+def product_ids(app):
+    db.session.add(MsUser(email=SELLER, password="password", role="Seller"))
+    products = [
+        MsProduct(product_name=f"Lamp {n}", product_images=[], product_price=Decimal("9.99"),
+                  product_stock=5, product_owner=SELLER)
+        for n in range(PRODUCTS)
+    ]
+    db.session.add_all(products)
+    db.session.commit()
+    return {product.product_id for product in products}
+
+# Follow X-Next-Cursor from the first page to the last, collecting product ids
+def walk(client, path, **params):
+    seen, cursor, pages = [], None, 0
+    while True:
+        query = dict(params, limit=PAGE_SIZE, **({"cursor": cursor} if cursor else {}))
+        response = client.get(path, query_string=query)
+        assert response.status_code == 200
+        seen.extend(product["id"] for product in response.get_json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return seen, pages
+
+@pytest.mark.parametrize("path, params", [
+    (f"/products/{SELLER}", {}),
+    ("/products/search", {}),
+    ("/products/search", {"q": "lamp"}),
+])
+def test_pages_cover_every_product_once(client, product_ids, path, params):
+    seen, pages = walk(client, path, **params)
+    assert len(seen) == len(set(seen))
+    assert set(seen) == product_ids
+    assert pages == -(-PRODUCTS // PAGE_SIZE)
+
+def test_stream_resumes_after_cursor(client, product_ids):
+    first = client.get(f"/products/{SELLER}", query_string={"limit": PAGE_SIZE})
+    response = client.get(f"/products/{SELLER}", query_string={
+        "format": "ndjson", "cursor": first.headers["X-Next-Cursor"]
+    })
+    streamed = [json.loads(line)["id"] for line in response.get_data(as_text=True).splitlines()]
+    page_ids = [product["id"] for product in first.get_json()]
+    assert set(page_ids).isdisjoint(streamed)
+    assert set(page_ids) | set(streamed) == product_ids
+
+def raw_cursor(text):
+    return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    raw_cursor("not json"),
+    raw_cursor('{"id": 1}'),
+    encode_cursor([]),
+    encode_cursor([None]),
+    encode_cursor([[1]]),
+    encode_cursor(["00000000-0000-0000-0000-000000000000", 1]),
+])
+@pytest.mark.parametrize("path", [f"/products/{SELLER}", "/products/search"])
+def test_bad_cursor_is_rejected(client, product_ids, path, cursor):
+    for params in ({}, {"format": "ndjson"}):
+        response = client.get(path, query_string=dict(params, cursor=cursor))
+        assert response.status_code == 400
+        assert response.get_json() == {"error": "Invalid cursor"}
+
+@pytest.mark.parametrize("cursor", [
+    encode_cursor([None, None]),
+    encode_cursor(["-1", "not-a-uuid"]),
+    encode_cursor([-1.0]),
+])
+def test_bad_search_cursor_is_rejected(client, product_ids, cursor):
+    response = client.get("/products/search", query_string={"q": "lamp", "cursor": cursor})
+    assert response.status_code == 400
@@ -0,0 +1,21 @@
+# Production entry point: gunicorn -c gunicorn.conf.py wsgi:app
+import os
+from dotenv import load_dotenv
+from app import create_app
+
+# Read .env before the settings below, as create_app does
+load_dotenv()
+
+PRODUCTION_CONFIG = {
+    "DEBUG": False,
+    "TESTING": False,
+    # Reject oversized request bodies with 413 before they are read
+    "MAX_CONTENT_LENGTH": int(os.getenv("MAX_CONTENT_LENGTH", 16 * 1024 * 1024)),
+    # Uploaded images get unique names, so browsers may keep them a while
+    "SEND_FILE_MAX_AGE_DEFAULT": int(os.getenv("STATIC_MAX_AGE", 86400)),
+}
+
+if not os.getenv("DATABASE_URL"):
+    raise RuntimeError("Set DATABASE_URL in the environment before starting in production")
+
+app = create_app(PRODUCTION_CONFIG)
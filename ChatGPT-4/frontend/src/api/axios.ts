@@ -1,4 +1,4 @@
-import axios from "axios";
+import axios, { type AxiosInstance } from "axios";
 
 export const authApi = axios.create({
     baseURL: import.meta.env.VITE_API_BASE_URL + "/auth",
@@ -19,3 +19,23 @@ export const checkoutApi = axios.create({
 export const orderApi = axios.create({
     baseURL: import.meta.env.VITE_API_BASE_URL + "/orders",
 });
+
+export interface Page<T> {
+    items: T[];
+    nextCursor: string | null;
+}
+
+// Listings are served in keyset pages, with the next page's cursor in the
+// X-Next-Cursor header. Fetch the page after `cursor`, or the first page
+// without one; pass the returned nextCursor to load more.
+export async function getPage<T>(
+    api: AxiosInstance,
+    path: string,
+    params: Record<string, string> = {},
+    cursor?: string | null
+): Promise<Page<T>> {
+    const res = await api.get<T[]>(path, {
+        params: cursor ? { ...params, cursor } : params,
+    });
+    return { items: res.data, nextCursor: res.headers["x-next-cursor"] ?? null };
+}
@@ -1,5 +1,5 @@
 import { useEffect, useState } from "react";
-import { productApi } from "../api/axios";
+import { getPage, productApi } from "../api/axios";
 
 interface Product {
     id: string;
@@ -13,6 +13,7 @@ interface Product {
 const loggedInEmail = localStorage.getItem("email");
 export default function ProductManagement() {
     const [products, setProducts] = useState<Product[]>([]);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
     const [form, setForm] = useState<Omit<Product, "id"> & { id?: string }>({
         name: "",
         description: "",
@@ -23,9 +24,18 @@ export default function ProductManagement() {
     const [editingId, setEditingId] = useState<string | null>(null);
     const [message, setMessage] = useState("");
 
+    // Load the first page of products
     const fetchProducts = async () => {
-        const res = await productApi.get(`/${loggedInEmail}`);
-        setProducts(res.data);
+        const page = await getPage<Product>(productApi, `/${loggedInEmail}`);
+        setProducts(page.items);
+        setNextCursor(page.nextCursor);
+    };
+
+    const loadMore = async () => {
+        if (!nextCursor) return;
+        const page = await getPage<Product>(productApi, `/${loggedInEmail}`, {}, nextCursor);
+        setProducts((prev) => [...prev, ...page.items]);
+        setNextCursor(page.nextCursor);
     };
 
     useEffect(() => {
@@ -145,6 +155,14 @@ export default function ProductManagement() {
                     </div>
                 ))}
             </div>
+
+            {nextCursor && (
+                <button
+                    onClick={loadMore}
+                    className="mt-4 w-full border border-blue-600 text-blue-600 px-4 py-2 rounded">
+                    Load more
+                </button>
+            )}
         </div>
     );
 }
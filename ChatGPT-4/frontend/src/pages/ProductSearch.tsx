@@ -1,5 +1,5 @@
 import { useEffect, useState } from "react";
-import { productApi } from "../api/axios";
+import { getPage, productApi } from "../api/axios";
 import { useNavigate } from "react-router-dom";
 
 interface Product {
@@ -7,6 +7,7 @@ interface Product {
     name: string;
     description: string;
     images: string[];
+    thumbnail: string;
     price: string;
     stock: number;
 }
@@ -14,22 +15,41 @@ interface Product {
 export default function ProductSearch() {
     const [query, setQuery] = useState("");
     const [products, setProducts] = useState<Product[]>([]);
+    // Query of the listed results and the cursor of their next page
+    const [activeQuery, setActiveQuery] = useState("");
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [error, setError] = useState("");
     const navigate = useNavigate();
 
     const searchProducts = async () => {
         try {
-            const res = await productApi.get("/search", {
-                params: { q: query },
-            });
-            setProducts(res.data);
+            const page = await getPage<Product>(productApi, "/search", { q: query });
+            setProducts(page.items);
+            setNextCursor(page.nextCursor);
+            setActiveQuery(query);
             setError("");
         } catch (err: any) {
             setProducts([]);
+            setNextCursor(null);
             setError(err.response?.data?.error || "Something went wrong");
         }
     };
 
+    const loadMore = async () => {
+        if (!nextCursor) return;
+        setLoadingMore(true);
+        try {
+            const page = await getPage<Product>(productApi, "/search", { q: activeQuery }, nextCursor);
+            setProducts((prev) => [...prev, ...page.items]);
+            setNextCursor(page.nextCursor);
+        } catch (err: any) {
+            setError(err.response?.data?.error || "Something went wrong");
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     useEffect(() => {
         searchProducts();
     }, []);
@@ -57,7 +77,7 @@ export default function ProductSearch() {
                         className="border p-4 rounded cursor-pointer hover:shadow">
                         {product.images[0] && (
                             <img
-                                src={product.images[0]}
+                                src={product.thumbnail || product.images[0]}
                                 alt={product.name}
                                 className="w-full h-48 object-cover rounded mb-2"
                             />
@@ -77,6 +97,17 @@ export default function ProductSearch() {
                     </div>
                 ))}
             </div>
+
+            {nextCursor && (
+                <div className="flex justify-center mt-6">
+                    <button
+                        onClick={loadMore}
+                        disabled={loadingMore}
+                        className="bg-blue-600 text-white px-4 py-2 rounded disabled:opacity-50">
+                        {loadingMore ? "Loading..." : "Load more"}
+                    </button>
+                </div>
+            )}
         </div>
     );
 }
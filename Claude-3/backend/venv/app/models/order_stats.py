@@ -0,0 +1,19 @@
+from app import db
+
+class OrderDailyStats(db.Model):
+    __tablename__ = 'OrderDailyStats'
+    __table_args__ = (
+        db.Index('ix_OrderDailyStats_seller_day', 'SellerEmail', 'Day'),
+    )
+    
+    # One row per product, day and order status
+    ProductId = db.Column(db.String(36), primary_key=True)
+    Day = db.Column(db.Date, primary_key=True)
+    Status = db.Column(db.String(15), primary_key=True)
+    SellerEmail = db.Column(db.String(100), nullable=False)
+    OrderCount = db.Column(db.Integer, nullable=False, default=0)
+    Units = db.Column(db.Integer, nullable=False, default=0)
+    Revenue = db.Column(db.Numeric(14, 2), nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<OrderDailyStats {self.ProductId} {self.Day} {self.Status}>'
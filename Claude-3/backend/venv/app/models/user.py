@@ -0,0 +1,26 @@
+from flask import current_app
+from flask_sqlalchemy import SQLAlchemy
+from werkzeug.security import generate_password_hash, check_password_hash
+from app import db
+
+class MsUser(db.Model):
+    __tablename__ = 'MsUser'
+    
+    email = db.Column(db.String(100), primary_key=True)
+    password = db.Column(db.String(255), nullable=False)
+    role = db.Column(db.String(15), nullable=False)
+    
+    def __init__(self, email, password, role):
+        self.email = email
+        self.set_password(password)
+        self.role = role
+    
+    def set_password(self, password):
+        method = current_app.config.get('PASSWORD_HASH_METHOD')
+        if method:
+            self.password = generate_password_hash(password, method=method)
+        else:
+            self.password = generate_password_hash(password)
+        
+    def check_password(self, password):
+        return check_password_hash(self.password, password)
\ No newline at end of file
@@ -0,0 +1,98 @@
+# app/routes/auth.py
+from flask import Blueprint, current_app, request, jsonify
+from flask_jwt_extended import create_access_token, jwt_required
+from app import db
+from app.models.user import MsUser
+from app.utils.auth import current_principal, issue_tokens, load_principal, needs_rehash
+
+auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
+
+@auth_bp.route('/register', methods=['POST'])
+def register():
+    data = request.get_json()
+    
+    # Check if required fields are present
+    if not data or not all(key in data for key in ['email', 'password', 'role']):
+        return jsonify({'message': 'Missing required fields'}), 400
+    
+    # Validate role
+    if data['role'] not in ['Customer', 'Seller']:
+        return jsonify({'message': 'Role must be either Customer or Seller'}), 400
+    
+    # Check if user already exists
+    existing_user = MsUser.query.filter_by(email=data['email']).first()
+    if existing_user:
+        return jsonify({'message': 'Email already registered'}), 409
+    
+    # Create new user
+    try:
+        new_user = MsUser(
+            email=data['email'],
+            password=data['password'],
+            role=data['role']
+        )
+        
+        db.session.add(new_user)
+        db.session.commit()
+        
+        # Generate access and refresh tokens
+        return jsonify({
+            'message': 'User registered successfully',
+            **issue_tokens(new_user),
+            'role': new_user.role
+        }), 201
+        
+    except Exception:
+        current_app.logger.exception("Error registering user")
+        db.session.rollback()
+        return jsonify({'message': 'Registration failed'}), 500
+
+@auth_bp.route('/login', methods=['POST'])
+def login():
+    data = request.get_json()
+    
+    # Check if required fields are present
+    if not data or not all(key in data for key in ['email', 'password']):
+        return jsonify({'message': 'Missing email or password'}), 400
+    
+    # Find the user
+    user = MsUser.query.filter_by(email=data['email']).first()
+    
+    # Check if user exists and password is correct
+    if not user or not user.check_password(data['password']):
+        return jsonify({'message': 'Invalid email or password'}), 401
+    
+    # Upgrade hashes made with outdated cost parameters while the plain
+    # password is at hand
+    if needs_rehash(user.password):
+        user.set_password(data['password'])
+        db.session.commit()
+    
+    # Generate access and refresh tokens
+    return jsonify({
+        'message': 'Login successful',
+        **issue_tokens(user),
+        'role': user.role
+    }), 200
+
+# Exchange a refresh token for a new access token, so clients do not have to
+# log in again every time the access token expires
+@auth_bp.route('/refresh', methods=['POST'])
+@jwt_required(refresh=True)
+def refresh():
+    principal = load_principal(current_principal().email)
+    if principal is None:
+        return jsonify({'message': 'User no longer exists'}), 401
+    
+    access_token = create_access_token(
+        identity=principal.email,
+        additional_claims={'role': principal.role}
+    )
+    return jsonify({'token': access_token, 'role': principal.role}), 200
+
+# Protected route example
+@auth_bp.route('/me', methods=['GET'])
+@jwt_required()
+def get_user_profile():
+    principal = current_principal()
+    return jsonify({'email': principal.email, 'role': principal.role}), 200
\ No newline at end of file
@@ -0,0 +1,350 @@
+from flask import Blueprint, current_app, request, jsonify
+from app import db, product_cache
+from app.models.product import MsProduct, product_id_matches
+from app.models.user import MsUser
+from app.models.order import Orders
+from app.models.cart import Cart
+from app.utils import order_stats
+from sqlalchemy.orm import aliased
+from datetime import datetime
+import uuid
+
+order_bp = Blueprint('order', __name__)
+
+@order_bp.route('/api/orders', methods=['GET'])
+def get_user_orders():
+    user_email = request.args.get('userEmail')
+    
+    if not user_email:
+        return jsonify({
+            'success': False,
+            'message': 'User email is required'
+        }), 400
+    
+    try:
+        # Get all orders for the user together with their product and seller
+        # in a single joined query, newest first
+        seller = aliased(MsUser)
+        rows = db.session.query(Orders, MsProduct, seller.email)\
+            .join(MsProduct, product_id_matches(Orders.ProductId))\
+            .outerjoin(seller, MsProduct.ProductOwner == seller.email)\
+            .filter(Orders.Customer == user_email)\
+            .order_by(Orders.Timestamp.desc())\
+            .all()
+        
+        result = []
+        for order, product, seller_email in rows:
+            order_data = order.to_dict()
+            order_data['product'] = {
+                'productId': product.ProductId,
+                'productName': product.ProductName,
+                'productPrice': product.ProductPrice,
+                'productImages': product.ProductImages,
+                'sellerEmail': product.ProductOwner,
+                'sellerName': seller_email or "Unknown Seller"
+            }
+            result.append(order_data)
+        
+        return jsonify({
+            'success': True,
+            'orders': result
+        }), 200
+        
+    except Exception:
+        current_app.logger.exception("Error fetching orders")
+        return jsonify({
+            'success': False,
+            'message': 'Failed to fetch orders'
+        }), 500
+        
+@order_bp.route('/api/seller/orders', methods=['GET'])
+def get_seller_orders():
+    seller_email = request.args.get('sellerEmail')
+    status = request.args.get('status', None)  # Optional status filter
+    
+    if not seller_email:
+        return jsonify({
+            'success': False,
+            'message': 'Seller email is required'
+        }), 400
+    
+    try:
+        # Get orders for this seller's products together with the product and
+        # customer in a single joined query, newest first
+        customer = aliased(MsUser)
+        query = db.session.query(Orders, MsProduct, customer.email)\
+            .join(MsProduct, product_id_matches(Orders.ProductId))\
+            .outerjoin(customer, Orders.Customer == customer.email)\
+            .filter(MsProduct.ProductOwner == seller_email)
+        
+        # Apply status filter if provided
+        if status:
+            query = query.filter(Orders.Status == status)
+            
+        rows = query.order_by(Orders.Timestamp.desc()).all()
+        
+        result = []
+        for order, product, customer_email in rows:
+            order_data = order.to_dict()
+            order_data['product'] = {
+                'productId': product.ProductId,
+                'productName': product.ProductName,
+                'productPrice': product.ProductPrice,
+                'productImages': product.ProductImages
+            }
+            order_data['customer'] = {
+                'email': order.Customer,
+                'name': customer_email or "Unknown Customer"
+            }
+            result.append(order_data)
+        
+        return jsonify({
+            'success': True,
+            'orders': result
+        }), 200
+        
+    except Exception:
+        current_app.logger.exception("Error fetching seller orders")
+        return jsonify({
+            'success': False,
+            'message': 'Failed to fetch orders'
+        }), 500
+
+# Dashboard aggregates for a seller, read from the precomputed summary rows
+@order_bp.route('/api/seller/analytics', methods=['GET'])
+def get_seller_analytics():
+    seller_email = request.args.get('sellerEmail')
+    
+    if not seller_email:
+        return jsonify({
+            'success': False,
+            'message': 'Seller email is required'
+        }), 400
+    
+    try:
+        days = int(request.args.get('days', order_stats.DEFAULT_WINDOW_DAYS))
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'message': 'days must be an integer'
+        }), 400
+    days = max(1, min(days, order_stats.MAX_WINDOW_DAYS))
+    
+    try:
+        return jsonify({
+            'success': True,
+            'analytics': order_stats.seller_analytics(seller_email, days)
+        }), 200
+        
+    except Exception:
+        current_app.logger.exception("Error computing seller analytics")
+        return jsonify({
+            'success': False,
+            'message': 'Failed to load analytics'
+        }), 500
+
+@order_bp.route('/api/orders/update-status', methods=['POST'])
+def update_order_status():
+    data = request.json
+    order_id = data.get('orderId')
+    new_status = data.get('status')
+    user_email = data.get('userEmail')
+    
+    # Validate inputs
+    if not order_id or not new_status or not user_email:
+        return jsonify({
+            'success': False,
+            'message': 'Missing required information'
+        }), 400
+    
+    # Validate status
+    valid_statuses = ['Pending', 'Accepted', 'Shipped', 'Completed']
+    if new_status not in valid_statuses:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid status'
+        }), 400
+    
+    try:
+        # Get the order, locked so concurrent updates can't both move it
+        # between summary rows
+        order = Orders.query.filter_by(OrderId=order_id).with_for_update().first()
+        
+        if not order:
+            return jsonify({
+                'success': False,
+                'message': 'Order not found'
+            }), 404
+        
+        # Get the product to check seller
+        product = db.session.get(MsProduct, uuid.UUID(order.ProductId))
+        
+        if not product:
+            return jsonify({
+                'success': False,
+                'message': 'Product not found'
+            }), 404
+            
+        # Verify permissions
+        is_seller = product.ProductOwner == user_email
+        is_customer = order.Customer == user_email
+        
+        # For seller updates
+        if new_status in ['Accepted', 'Shipped'] and not is_seller:
+            return jsonify({
+                'success': False,
+                'message': 'Only the seller can accept or ship orders'
+            }), 403
+            
+        # For customer updates
+        if new_status == 'Completed' and not is_customer:
+            return jsonify({
+                'success': False,
+                'message': 'Only the customer can mark an order as completed'
+            }), 403
+            
+        # Check status transition
+        if new_status == 'Accepted' and order.Status != 'Pending':
+            return jsonify({
+                'success': False,
+                'message': 'Can only accept pending orders'
+            }), 400
+            
+        if new_status == 'Shipped' and order.Status != 'Accepted':
+            return jsonify({
+                'success': False,
+                'message': 'Can only ship accepted orders'
+            }), 400
+            
+        if new_status == 'Completed' and order.Status != 'Shipped':
+            return jsonify({
+                'success': False,
+                'message': 'Can only complete shipped orders'
+            }), 400
+        
+        # Update status and move the order between summary rows
+        old_status = order.Status
+        order.Status = new_status
+        order_stats.move_order(order, product.ProductOwner, old_status)
+        db.session.commit()
+        
+        return jsonify({
+            'success': True,
+            'message': f'Order status updated to {new_status}',
+            'order': order.to_dict()
+        }), 200
+        
+    except Exception:
+        current_app.logger.exception("Error updating order status")
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'message': 'Failed to update order status'
+        }), 500
+
+@order_bp.route('/api/order/checkout', methods=['POST'])
+def checkout():
+    data = request.json
+    user_email = data.get('userEmail')
+    shipping_address = data.get('shippingAddress')
+    payment_method = data.get('paymentMethod')
+    
+    if not user_email or not shipping_address or not payment_method:
+        return jsonify({
+            'success': False,
+            'message': 'Missing required information'
+        }), 400
+    
+    # Get all cart items for the user, locked so a second checkout of the
+    # same cart waits for this one and then finds the cart empty
+    cart_items = Cart.query.filter_by(Customer=user_email)\
+        .order_by(Cart.ProductId)\
+        .with_for_update()\
+        .all()
+    
+    if not cart_items:
+        return jsonify({
+            'success': False,
+            'message': 'Your cart is empty'
+        }), 400
+    
+    errors = []
+    
+    try:
+        # Load and lock every product in the cart with one query. Locking in
+        # a stable (id) order keeps concurrent checkouts that share products
+        # from deadlocking, and the row locks stop them from overselling.
+        products = MsProduct.query\
+            .filter(MsProduct.ProductId.in_([item.ProductId for item in cart_items]))\
+            .order_by(MsProduct.ProductId)\
+            .with_for_update()\
+            .all()
+        products_by_id = {product.ProductId: product for product in products}
+        
+        # Check product availability
+        for item in cart_items:
+            product = products_by_id.get(item.ProductId)
+            
+            if not product:
+                errors.append(f"Product not found: {item.ProductId}")
+                continue
+                
+            if product.ProductStock < item.Quantity:
+                errors.append(f"Not enough stock for {product.ProductName}. Available: {product.ProductStock}")
+        
+        # If there are errors, roll back and release the locks
+        if errors:
+            db.session.rollback()
+            return jsonify({
+                'success': False,
+                'message': 'Could not complete checkout',
+                'errors': errors
+            }), 400
+        
+        # Create orders and update stock; the flush sends each as one batched
+        # statement
+        timestamp = datetime.now()
+        new_orders = [
+            Orders(
+                OrderId=str(uuid.uuid4()),
+                ProductId=str(item.ProductId),
+                Quantity=item.Quantity,
+                UnitPrice=products_by_id[item.ProductId].ProductPrice,
+                Customer=user_email,
+                Status="Pending",
+                Timestamp=timestamp,
+                ShippingAddress=shipping_address,
+                PaymentMethod=payment_method
+            )
+            for item in cart_items
+        ]
+        db.session.add_all(new_orders)
+        
+        for item in cart_items:
+            products_by_id[item.ProductId].ProductStock -= item.Quantity
+        
+        # Count the orders in the sellers' summary rows
+        order_stats.record_orders(new_orders, {
+            str(product_id): product.ProductOwner for product_id, product in products_by_id.items()
+        })
+        
+        # Remove items from cart
+        Cart.query.filter_by(Customer=user_email).delete(synchronize_session=False)
+        
+        # Commit transaction
+        db.session.commit()
+        product_cache.invalidate(*products_by_id)
+        
+        return jsonify({
+            'success': True,
+            'message': 'Order placed successfully!',
+            'orderIds': [order.OrderId for order in new_orders]
+        }), 201
+        
+    except Exception:
+        current_app.logger.exception("Error during checkout")
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'message': 'Checkout failed'
+        }), 500
\ No newline at end of file
@@ -0,0 +1,275 @@
+from flask import Blueprint, current_app, request, jsonify
+from app import db, image_service, product_cache
+from app.models.product import MsProduct
+from app.utils.images import InvalidImage
+from app.utils.pagination import get_page_args, ndjson_response, paginate, stream_ndjson, wants_stream
+from app.utils.search import get_search_engine, tokenize
+import uuid
+from flask_cors import CORS
+
+# Create a blueprint for product routes
+product_bp = Blueprint('product', __name__)
+CORS(product_bp)  # Enable CORS for all routes in this blueprint
+
+# Helper function to validate product data
+def validate_product_data(data):
+    errors = []
+    required_fields = ['ProductName', 'ProductPrice', 'ProductStock']
+    
+    for field in required_fields:
+        if field not in data or not data[field]:
+            errors.append(f"{field} is required")
+    
+    if 'ProductPrice' in data:
+        try:
+            price = float(data['ProductPrice'])
+            if price < 0:
+                errors.append("Price cannot be negative")
+        except ValueError:
+            errors.append("Price must be a valid number")
+    
+    if 'ProductStock' in data:
+        try:
+            stock = int(data['ProductStock'])
+            if stock < 0:
+                errors.append("Stock cannot be negative")
+        except ValueError:
+            errors.append("Stock must be a valid integer")
+            
+    return errors
+
+# Thumbnail edge length used for catalog listings
+LISTING_THUMBNAIL_SIZE = 256
+
+# Product data for listings, with a thumbnail URL next to the original image
+def product_listing_dict(product):
+    data = product.to_dict()
+    data['ProductThumbnail'] = image_service.thumbnail_url(product.ProductImages, LISTING_THUMBNAIL_SIZE)
+    return data
+
+# Get all products, one keyset page at a time
+@product_bp.route('/api/products', methods=['GET'])
+def get_products():
+    limit, cursor = get_page_args()
+    products_query = MsProduct.query.filter_by(IsActive=True)
+    
+    try:
+        if wants_stream():
+            return stream_ndjson(products_query, [MsProduct.ProductId], product_listing_dict, cursor)
+        
+        products, next_cursor = paginate(
+            products_query, [MsProduct.ProductId], lambda p: [p.ProductId], cursor, limit
+        )
+    except ValueError:
+        return jsonify({'message': 'Invalid cursor'}), 400
+    
+    return jsonify({
+        'products': [product_listing_dict(product) for product in products],
+        'nextCursor': next_cursor,
+        'message': 'Products retrieved successfully'
+    }), 200
+
+# Get a specific product, served from the product cache
+@product_bp.route('/api/products/<product_id>', methods=['GET'])
+def get_product(product_id):
+    try:
+        product_id = uuid.UUID(product_id)
+    except ValueError:
+        return jsonify({'message': 'Invalid product ID format'}), 400
+    
+    def load_product():
+        product = MsProduct.query.filter_by(ProductId=product_id, IsActive=True).first()
+        return product.to_dict() if product else None
+    
+    product, etag = product_cache.get_or_load(product_id, load_product)
+    if product is None:
+        return jsonify({'message': 'Product not found'}), 404
+    
+    # Answer with 304 Not Modified when the client's If-None-Match matches
+    response = jsonify({
+        'product': product,
+        'message': 'Product retrieved successfully'
+    })
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+# Product cache hit/miss counters
+@product_bp.route('/api/products/cache/stats', methods=['GET'])
+def get_product_cache_stats():
+    return jsonify(product_cache.stats()), 200
+
+# Create a new product
+@product_bp.route('/api/products', methods=['POST'])
+def create_product():
+    data = request.form.to_dict()
+    
+    # Validate product data
+    errors = validate_product_data(data)
+    if errors:
+        return jsonify({'errors': errors}), 400
+    
+    # Handle image upload if provided
+    product_image = None
+    if 'ProductImage' in request.files:
+        file = request.files['ProductImage']
+        if file and file.filename:
+            try:
+                product_image = image_service.save_upload(file)
+            except InvalidImage as e:
+                return jsonify({'errors': [str(e)]}), 400
+    
+    try:
+        new_product = MsProduct(
+            ProductName=data['ProductName'],
+            ProductDescription=data.get('ProductDescription', ''),
+            ProductImages=product_image,
+            ProductPrice=float(data['ProductPrice']),
+            ProductStock=int(data['ProductStock']),
+            ProductOwner=data.get('ProductOwner', 'anonymous@example.com'),  # Default value if not provided
+            IsActive=True
+        )
+        
+        db.session.add(new_product)
+        db.session.commit()
+        
+        return jsonify({
+            'product': new_product.to_dict(),
+            'message': 'Product created successfully'
+        }), 201
+        
+    except Exception:
+        current_app.logger.exception("Error creating product")
+        db.session.rollback()
+        return jsonify({'message': 'Failed to create product'}), 500
+
+# Update an existing product
+@product_bp.route('/api/products/<product_id>', methods=['PUT'])
+def update_product(product_id):
+    try:
+        product = MsProduct.query.filter_by(ProductId=uuid.UUID(product_id), IsActive=True).first()
+        if not product:
+            return jsonify({'message': 'Product not found'}), 404
+        
+        data = request.form.to_dict()
+        
+        # Validate product data
+        errors = validate_product_data(data)
+        if errors:
+            return jsonify({'errors': errors}), 400
+        
+        # Handle image upload if provided. Images are content-addressed and
+        # may be shared with other products, so the old one is kept.
+        if 'ProductImage' in request.files:
+            file = request.files['ProductImage']
+            if file and file.filename:
+                product.ProductImages = image_service.save_upload(file)
+        
+        # Update product fields
+        product.ProductName = data['ProductName']
+        product.ProductDescription = data.get('ProductDescription', '')
+        product.ProductPrice = float(data['ProductPrice'])
+        product.ProductStock = int(data['ProductStock'])
+        
+        db.session.commit()
+        product_cache.invalidate(product.ProductId)
+        
+        return jsonify({
+            'product': product.to_dict(),
+            'message': 'Product updated successfully'
+        }), 200
+        
+    except InvalidImage as e:
+        return jsonify({'errors': [str(e)]}), 400
+    except ValueError:
+        return jsonify({'message': 'Invalid product ID format'}), 400
+    except Exception:
+        current_app.logger.exception("Error updating product")
+        db.session.rollback()
+        return jsonify({'message': 'Failed to update product'}), 500
+
+# Delete a product (soft delete)
+@product_bp.route('/api/products/<product_id>', methods=['DELETE'])
+def delete_product(product_id):
+    try:
+        product = MsProduct.query.filter_by(ProductId=uuid.UUID(product_id), IsActive=True).first()
+        if not product:
+            return jsonify({'message': 'Product not found'}), 404
+        
+        # Perform soft delete
+        product.IsActive = False
+        db.session.commit()
+        product_cache.invalidate(product.ProductId)
+        
+        return jsonify({
+            'message': 'Product deleted successfully'
+        }), 200
+        
+    except ValueError:
+        return jsonify({'message': 'Invalid product ID format'}), 400
+    except Exception:
+        current_app.logger.exception("Error deleting product")
+        db.session.rollback()
+        return jsonify({'message': 'Failed to delete product'}), 500
+
+# Toggle product status (active/inactive)
+@product_bp.route('/api/products/<product_id>/toggle-status', methods=['PUT'])
+def toggle_product_status(product_id):
+    try:
+        product = MsProduct.query.filter_by(ProductId=uuid.UUID(product_id)).first()
+        if not product:
+            return jsonify({'message': 'Product not found'}), 404
+        
+        # Toggle status
+        product.IsActive = not product.IsActive
+        db.session.commit()
+        product_cache.invalidate(product.ProductId)
+        
+        return jsonify({
+            'product': product.to_dict(),
+            'message': f'Product {"activated" if product.IsActive else "deactivated"} successfully'
+        }), 200
+        
+    except ValueError:
+        return jsonify({'message': 'Invalid product ID format'}), 400
+    except Exception:
+        current_app.logger.exception("Error toggling product status")
+        db.session.rollback()
+        return jsonify({'message': 'Failed to update product status'}), 500
+    
+@product_bp.route('/api/products/search', methods=['GET'])
+def search_products():
+    search_query = request.args.get('search', '')
+    
+    # Base query - filter only active products with stock > 0
+    products_query = MsProduct.query.filter(
+        MsProduct.IsActive == True,
+        MsProduct.ProductStock > 0
+    )
+    
+    limit, cursor = get_page_args()
+    
+    try:
+        # Rank matches through the search engine when there is a search term,
+        # otherwise list the catalog in id order
+        if tokenize(search_query):
+            engine = get_search_engine()
+            if wants_stream():
+                return ndjson_response(
+                    engine.iter_search(products_query, search_query, cursor), product_listing_dict
+                )
+            products, next_cursor = engine.search(products_query, search_query, cursor, limit)
+        else:
+            if wants_stream():
+                return stream_ndjson(products_query, [MsProduct.ProductId], product_listing_dict, cursor)
+            products, next_cursor = paginate(
+                products_query, [MsProduct.ProductId], lambda p: [p.ProductId], cursor, limit
+            )
+    except ValueError:
+        return jsonify({'message': 'Invalid cursor'}), 400
+    
+    return jsonify({
+        'products': [product_listing_dict(product) for product in products],
+        'nextCursor': next_cursor,
+        'message': 'Products retrieved successfully',
+        'count': len(products)
+    }), 200
\ No newline at end of file
@@ -0,0 +1,77 @@
+# app/utils/auth.py
+from collections import namedtuple
+from functools import lru_cache
+from flask import current_app, g
+from werkzeug.security import generate_password_hash
+from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt
+from app.utils.cache import LRUCache
+
+# The authenticated user as described by the access token's claims
+Principal = namedtuple('Principal', ['email', 'role'])
+
+# Create an access/refresh token pair. The email is the subject and the role
+# travels as a claim, so protected routes never need to load the user.
+def issue_tokens(user):
+    claims = {'role': user.role}
+    return {
+        'token': create_access_token(identity=user.email, additional_claims=claims),
+        'refreshToken': create_refresh_token(identity=user.email, additional_claims=claims)
+    }
+
+# Resolve the principal of the current request from its verified JWT, once
+# per request and without touching the database. Call it inside a
+# @jwt_required() route.
+def current_principal():
+    principal = g.get('principal')
+    if principal is None:
+        claims = get_jwt()
+        identity = claims['sub']
+        # Tokens issued before the role moved into its own claim carried a
+        # {'email', 'role'} dict as the subject
+        if isinstance(identity, dict):
+            principal = Principal(identity['email'], identity['role'])
+        else:
+            principal = Principal(identity, claims.get('role'))
+        g.principal = principal
+    return principal
+
+# Short-lived cache of principals for the few routes that must confirm the
+# user still exists, such as token refresh. USER_CACHE_TTL is in seconds;
+# 0 turns the cache off.
+_user_cache = None
+
+def _get_user_cache():
+    global _user_cache
+    ttl = current_app.config.get('USER_CACHE_TTL', 30)
+    if not ttl:
+        return None
+    if _user_cache is None or _user_cache.ttl != ttl:
+        _user_cache = LRUCache(current_app.config.get('USER_CACHE_SIZE', 4096), ttl)
+    return _user_cache
+
+# Principal for `email` as stored in the database, or None if the user is gone
+def load_principal(email):
+    from app.models.user import MsUser
+
+    cache = _get_user_cache()
+    principal = cache.get(email) if cache else None
+    if principal is None:
+        row = MsUser.query.with_entities(MsUser.email, MsUser.role).filter_by(email=email).first()
+        if row is None:
+            return None
+        principal = Principal(row.email, row.role)
+        if cache:
+            cache.set(email, principal)
+    return principal
+
+# The method prefix werkzeug writes for `method`, which expands short forms
+# such as 'pbkdf2' to 'pbkdf2:sha256:1000000'. Cached since it costs a hash.
+@lru_cache(maxsize=None)
+def _hash_prefix(method):
+    return generate_password_hash('', method=method).split('$', 1)[0]
+
+# Whether a werkzeug password hash was made with other parameters than the
+# configured PASSWORD_HASH_METHOD, e.g. a lower pbkdf2 iteration count
+def needs_rehash(password_hash):
+    method = current_app.config.get('PASSWORD_HASH_METHOD')
+    return bool(method) and password_hash.split('$', 1)[0] != _hash_prefix(method)
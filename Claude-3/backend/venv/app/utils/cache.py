@@ -0,0 +1,163 @@
+# app/utils/cache.py
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# In-process LRU cache whose entries expire after `ttl` seconds
+class LRUCache:
+    name = 'memory'
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+# Cache stored in Redis. Any client with redis-py's get/setex/delete methods
+# works, so tests can pass in a fake instead of a real server. Client errors
+# of the `errors` types are logged and treated as misses, so an unreachable
+# server slows requests down instead of failing them.
+class RedisCache:
+    name = 'redis'
+
+    def __init__(self, client, ttl=60, prefix='product:', errors=(ConnectionError, TimeoutError)):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.errors = errors
+
+    def get(self, key):
+        try:
+            raw = self.client.get(self.prefix + key)
+        except self.errors as e:
+            logger.warning('Product cache read failed: %s', e)
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value):
+        try:
+            self.client.setex(self.prefix + key, self.ttl, json.dumps(value))
+        except self.errors as e:
+            logger.warning('Product cache write failed: %s', e)
+
+    def delete(self, key):
+        try:
+            self.client.delete(self.prefix + key)
+        except self.errors as e:
+            # The stale entry expires after the TTL
+            logger.error('Product cache invalidation of %s failed: %s', key, e)
+
+# Read-through cache for serialized products, keyed by product id. Each
+# entry also stores an ETag so unchanged products can be answered with 304.
+#
+# Config:
+#   PRODUCT_CACHE_BACKEND  'memory' (default), 'redis' or 'none'. The memory
+#                          cache is per process: an update only invalidates
+#                          it in the worker that served it, so servers with
+#                          several workers should use redis. Without the
+#                          redis package or server, 'redis' falls back to
+#                          'memory' with a warning.
+#   PRODUCT_CACHE_TTL      seconds an entry stays valid (default 60)
+#   PRODUCT_CACHE_SIZE     max entries for the memory backend (default 1024)
+#   REDIS_URL              connection URL for the redis backend
+class ProductCache:
+    def __init__(self, app=None):
+        self.backend = None
+        self.hits = 0
+        self.misses = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        backend = app.config.get('PRODUCT_CACHE_BACKEND', 'memory')
+        ttl = app.config.get('PRODUCT_CACHE_TTL', 60)
+
+        self.backend = None
+        if backend == 'redis':
+            self.backend = self._connect_redis(app.config.get('REDIS_URL', 'redis://localhost:6379/0'), ttl)
+        if backend == 'memory' or (backend == 'redis' and self.backend is None):
+            self.backend = LRUCache(app.config.get('PRODUCT_CACHE_SIZE', 1024), ttl)
+
+        app.extensions['product_cache'] = self
+
+    # A RedisCache for `url`, or None if the package is missing or the server
+    # does not answer
+    def _connect_redis(self, url, ttl):
+        try:
+            import redis
+        except ImportError:
+            logger.warning('PRODUCT_CACHE_BACKEND is redis but the redis package is not installed; '
+                           'using the memory cache')
+            return None
+        client = redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=1)
+        try:
+            client.ping()
+        except redis.exceptions.RedisError as e:
+            logger.warning('Redis at %s is unavailable (%s); using the memory cache', url, e)
+            return None
+        return RedisCache(client, ttl, errors=(redis.exceptions.RedisError,))
+
+    # Return (data, etag) for a product, calling `loader` on a miss. The
+    # loader returns the serialized product, or None if it does not exist;
+    # missing products are not cached.
+    def get_or_load(self, product_id, loader):
+        key = str(product_id)
+        entry = self.backend.get(key) if self.backend else None
+        if entry is not None:
+            self.hits += 1
+            return entry['data'], entry['etag']
+
+        self.misses += 1
+        data = loader()
+        if data is None:
+            return None, None
+
+        entry = {'data': data, 'etag': make_etag(data)}
+        if self.backend:
+            self.backend.set(key, entry)
+        return entry['data'], entry['etag']
+
+    def invalidate(self, *product_ids):
+        if not self.backend:
+            return
+        for product_id in product_ids:
+            self.backend.delete(str(product_id))
+
+    def stats(self):
+        return {
+            'backend': self.backend.name if self.backend else 'none',
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+def make_etag(data):
+    raw = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha1(raw).hexdigest()
@@ -0,0 +1,272 @@
+# app/utils/images.py
+import hashlib
+import io
+import logging
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image
+except ImportError:  # thumbnails are skipped without Pillow
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+# Image formats accepted for uploads and the extension each is stored under
+IMAGE_EXTENSIONS = {'JPEG': '.jpg', 'PNG': '.png', 'GIF': '.gif', 'WEBP': '.webp'}
+
+# Raised by save_upload when the uploaded file is not an accepted image
+class InvalidImage(Exception):
+    pass
+
+# Detect the format of the image file at `path` from its content, or None
+# when it is not an image. Pillow parses and verifies the file; without it
+# only the leading signature bytes are checked.
+def detect_image_format(path):
+    if Image is not None:
+        try:
+            with Image.open(path) as image:
+                image.verify()
+                return image.format
+        except (OSError, SyntaxError, ValueError, Image.DecompressionBombError):
+            return None
+
+    with open(path, 'rb') as f:
+        header = f.read(12)
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'JPEG'
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'PNG'
+    if header[:6] in (b'GIF87a', b'GIF89a'):
+        return 'GIF'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'WEBP'
+    return None
+
+# Stores files on local disk under `root`, served from `base_url`
+class LocalStorage:
+    def __init__(self, root, base_url):
+        self.root = root
+        self.base_url = base_url.rstrip('/')
+
+    def _path(self, key):
+        return os.path.join(self.root, *key.split('/'))
+
+    def exists(self, key):
+        return os.path.exists(self._path(key))
+
+    # Move a finished temporary file into place
+    def save(self, key, source_path):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.move(source_path, path)
+
+    def open(self, key):
+        return open(self._path(key), 'rb')
+
+    def url(self, key):
+        return f'{self.base_url}/{key}'
+
+# Stores files in an S3-compatible bucket through a boto3 client
+class S3Storage:
+    def __init__(self, bucket, client, base_url):
+        self.bucket = bucket
+        self.client = client
+        self.base_url = base_url.rstrip('/')
+
+    def exists(self, key):
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except self.client.exceptions.ClientError:
+            return False
+
+    def save(self, key, source_path):
+        self.client.upload_file(source_path, self.bucket, key)
+        os.remove(source_path)
+
+    def open(self, key):
+        body = self.client.get_object(Bucket=self.bucket, Key=key)['Body']
+        return io.BytesIO(body.read())
+
+    def url(self, key):
+        return f'{self.base_url}/{key}'
+
+# Content-addressed product images. Uploads are streamed to disk while being
+# hashed, stored once per distinct content under originals/<sha256><ext>, and
+# resized to thumbnails/<size>/<sha256>.jpg by a background worker pool so
+# the upload request does not wait for image processing.
+#
+# Config:
+#   IMAGE_STORAGE           'local' (default) or 's3'
+#   IMAGE_S3_BUCKET         bucket name for the s3 backend
+#   IMAGE_S3_ENDPOINT_URL   endpoint for S3-compatible services (optional)
+#   IMAGE_BASE_URL          public URL of the bucket for the s3 backend
+#   IMAGE_THUMBNAIL_SIZES   thumbnail edge lengths in pixels
+#   IMAGE_WORKERS           background thumbnail threads
+#   IMAGE_MISSING_TTL       seconds to remember that a thumbnail is missing
+class ImageService:
+    ORIGINALS = 'originals'
+    THUMBNAILS = 'thumbnails'
+    DEFAULT_THUMBNAIL_SIZES = (128, 256, 512)
+    DEFAULT_MISSING_TTL = 30
+    # Prune expired misses once this many are remembered
+    MAX_MISSING = 10000
+
+    def __init__(self, app=None):
+        self.storage = None
+        self.executor = None
+        self.thumbnail_sizes = self.DEFAULT_THUMBNAIL_SIZES
+        self.missing_ttl = self.DEFAULT_MISSING_TTL
+        self._thumbnails_ready = set()  # thumbnail keys known to exist
+        self._thumbnails_missing = {}   # thumbnail key -> when to check again
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        if app.config.get('IMAGE_STORAGE', 'local') == 's3':
+            import boto3
+            client = boto3.client('s3', endpoint_url=app.config.get('IMAGE_S3_ENDPOINT_URL'))
+            self.storage = S3Storage(app.config['IMAGE_S3_BUCKET'], client, app.config['IMAGE_BASE_URL'])
+        else:
+            self.storage = LocalStorage(
+                os.path.join(app.static_folder, 'product_images'),
+                f'{app.static_url_path}/product_images'
+            )
+
+        self.thumbnail_sizes = tuple(app.config.get('IMAGE_THUMBNAIL_SIZES', self.DEFAULT_THUMBNAIL_SIZES))
+        self.missing_ttl = app.config.get('IMAGE_MISSING_TTL', self.DEFAULT_MISSING_TTL)
+        self.executor = ThreadPoolExecutor(
+            max_workers=app.config.get('IMAGE_WORKERS', 2),
+            thread_name_prefix='thumbnails'
+        )
+        app.extensions['image_service'] = self
+
+    # Store an uploaded werkzeug FileStorage and return the original's URL.
+    # The client's filename and content type are ignored: the file must be
+    # an image in one of IMAGE_EXTENSIONS, which also picks its extension.
+    # Raises InvalidImage otherwise.
+    def save_upload(self, file):
+        digest = hashlib.sha256()
+
+        # Stream to a temporary file in chunks, hashing as we go
+        fd, temp_path = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, 'wb') as temp:
+                for chunk in iter(lambda: file.stream.read(CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    temp.write(chunk)
+
+            ext = IMAGE_EXTENSIONS.get(detect_image_format(temp_path))
+            if ext is None:
+                raise InvalidImage('Image must be a JPEG, PNG, GIF or WebP file')
+
+            content_hash = digest.hexdigest()
+            key = f'{self.ORIGINALS}/{content_hash}{ext}'
+            if self.storage.exists(key):
+                # Same content was uploaded before
+                os.remove(temp_path)
+            else:
+                self.storage.save(key, temp_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        if Image is not None:
+            self.executor.submit(self._make_thumbnails, key, content_hash)
+        return self.storage.url(key)
+
+    def _thumbnail_key(self, content_hash, size):
+        return f'{self.THUMBNAILS}/{size}/{content_hash}.jpg'
+
+    # Storage key of a content-addressed original, or None for other URLs
+    def _original_key(self, image_url):
+        if not image_url or f'/{self.ORIGINALS}/' not in image_url:
+            return None
+        filename = image_url.rsplit('/', 1)[-1]
+        return f'{self.ORIGINALS}/{filename}'
+
+    def _content_hash(self, key):
+        return os.path.splitext(key.rsplit('/', 1)[-1])[0]
+
+    # Write the thumbnails of `key` that don't exist yet, returning how many
+    # were written
+    def _make_thumbnails(self, key, content_hash):
+        try:
+            missing = []
+            for size in self.thumbnail_sizes:
+                thumbnail_key = self._thumbnail_key(content_hash, size)
+                if self.storage.exists(thumbnail_key):
+                    self._mark_ready(thumbnail_key)
+                else:
+                    missing.append(size)
+            if not missing:
+                return 0
+
+            with self.storage.open(key) as source:
+                image = Image.open(source)
+                image.load()
+            if image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+
+            for size in missing:
+                thumbnail = image.copy()
+                thumbnail.thumbnail((size, size))
+                fd, temp_path = tempfile.mkstemp(suffix='.jpg')
+                with os.fdopen(fd, 'wb') as temp:
+                    thumbnail.save(temp, 'JPEG', quality=85, optimize=True)
+                self.storage.save(self._thumbnail_key(content_hash, size), temp_path)
+                self._mark_ready(self._thumbnail_key(content_hash, size))
+            return len(missing)
+        except Exception:
+            logger.exception('Failed to create thumbnails for %s', key)
+            return 0
+
+    def _mark_ready(self, thumbnail_key):
+        self._thumbnails_ready.add(thumbnail_key)
+        self._thumbnails_missing.pop(thumbnail_key, None)
+
+    # Remember a missing thumbnail for missing_ttl seconds so listings don't
+    # ask storage (an S3 HEAD request per product) on every render
+    def _mark_missing(self, thumbnail_key):
+        now = time.monotonic()
+        if len(self._thumbnails_missing) >= self.MAX_MISSING:
+            self._thumbnails_missing = {
+                key: expires for key, expires in self._thumbnails_missing.items() if expires > now
+            }
+        self._thumbnails_missing[thumbnail_key] = now + self.missing_ttl
+
+    # Create the missing thumbnails of an image URL returned by save_upload in
+    # the calling thread, e.g. for uploads whose background job failed or ran
+    # without Pillow. Returns how many thumbnails were written.
+    def backfill(self, image_url):
+        key = self._original_key(image_url)
+        if key is None or Image is None or not self.storage.exists(key):
+            return 0
+        return self._make_thumbnails(key, self._content_hash(key))
+
+    # URL of the thumbnail closest to `size` for an image URL returned by
+    # save_upload. The original URL is returned until that thumbnail exists:
+    # thumbnails are written in the background, and images stored before
+    # content addressing have none. Both answers are cached: hits for good,
+    # misses for missing_ttl seconds.
+    def thumbnail_url(self, image_url, size):
+        key = self._original_key(image_url)
+        if key is None:
+            return image_url
+        size = min(self.thumbnail_sizes, key=lambda s: (s < size, abs(s - size)))
+        thumbnail_key = self._thumbnail_key(self._content_hash(key), size)
+        if thumbnail_key not in self._thumbnails_ready:
+            if self._thumbnails_missing.get(thumbnail_key, 0) > time.monotonic():
+                return image_url
+            if not self.storage.exists(thumbnail_key):
+                self._mark_missing(thumbnail_key)
+                return image_url
+            self._mark_ready(thumbnail_key)
+        return self.storage.url(thumbnail_key)
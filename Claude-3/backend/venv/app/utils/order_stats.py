@@ -0,0 +1,124 @@
+# app/utils/order_stats.py
+from collections import defaultdict
+from datetime import date, timedelta
+from app import db
+from app.models.order import Orders
+from app.models.order_stats import OrderDailyStats
+from app.models.product import MsProduct, product_id_matches
+
+# Seller analytics backed by OrderDailyStats, which holds per product, day
+# and status totals. Checkout and status changes apply their deltas in the
+# same transaction as the order rows, so the dashboard reads a few summary
+# rows instead of aggregating every order of the seller.
+
+DEFAULT_WINDOW_DAYS = 30
+MAX_WINDOW_DAYS = 366
+
+def _insert(table):
+    if db.session.get_bind().dialect.name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+    return insert(table)
+
+# Add `sign` times the order to the delta of its (product, day, status) row
+def _add(deltas, order, status, seller_email, sign):
+    delta = deltas[(order.ProductId, order.Timestamp.date(), status)]
+    delta['SellerEmail'] = seller_email
+    delta['OrderCount'] += sign
+    delta['Units'] += sign * order.Quantity
+    delta['Revenue'] += sign * order.Quantity * order.UnitPrice
+
+def _new_deltas():
+    return defaultdict(lambda: {'OrderCount': 0, 'Units': 0, 'Revenue': 0})
+
+# Upsert the deltas with one INSERT ... ON CONFLICT DO UPDATE. Rows are sent
+# in key order so concurrent checkouts lock summary rows in the same order.
+def _apply(deltas):
+    if not deltas:
+        return
+    rows = [
+        {'ProductId': product_id, 'Day': day, 'Status': status, **delta}
+        for (product_id, day, status), delta in sorted(deltas.items())
+    ]
+    stmt = _insert(OrderDailyStats).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['ProductId', 'Day', 'Status'],
+        set_={
+            'OrderCount': OrderDailyStats.OrderCount + stmt.excluded.OrderCount,
+            'Units': OrderDailyStats.Units + stmt.excluded.Units,
+            'Revenue': OrderDailyStats.Revenue + stmt.excluded.Revenue
+        }
+    )
+    db.session.execute(stmt)
+
+# Count new orders; `sellers` maps each order's ProductId to the product owner
+def record_orders(orders, sellers):
+    deltas = _new_deltas()
+    for order in orders:
+        _add(deltas, order, order.Status, sellers[order.ProductId], 1)
+    _apply(deltas)
+
+# Move an order whose Status was just changed from `old_status`
+def move_order(order, seller_email, old_status):
+    deltas = _new_deltas()
+    _add(deltas, order, old_status, seller_email, -1)
+    _add(deltas, order, order.Status, seller_email, 1)
+    _apply(deltas)
+
+# Recompute every summary row from Orders, e.g. after bulk imports
+def rebuild():
+    # date() rather than CAST, which SQLite turns into just the year
+    day = db.func.date(Orders.Timestamp, type_=db.Date)
+    status = db.func.coalesce(Orders.Status, 'Pending')
+    select = db.select(
+        Orders.ProductId, day, status, MsProduct.ProductOwner,
+        db.func.count(), db.func.sum(Orders.Quantity), db.func.sum(Orders.Quantity * Orders.UnitPrice)
+    )\
+        .join(MsProduct, product_id_matches(Orders.ProductId))\
+        .group_by(Orders.ProductId, day, status, MsProduct.ProductOwner)
+
+    db.session.query(OrderDailyStats).delete(synchronize_session=False)
+    db.session.execute(db.insert(OrderDailyStats).from_select(
+        ['ProductId', 'Day', 'Status', 'SellerEmail', 'OrderCount', 'Units', 'Revenue'], select
+    ))
+
+def _totals(orders, units, revenue):
+    return {'orders': int(orders or 0), 'units': int(units or 0), 'revenue': float(revenue or 0)}
+
+# Order counts by status (all time), plus totals, per-product and per-day
+# revenue and units over the last `days` days
+def seller_analytics(seller_email, days=DEFAULT_WINDOW_DAYS):
+    since = date.today() - timedelta(days=days - 1)
+    stats = OrderDailyStats
+    sums = (db.func.sum(stats.OrderCount), db.func.sum(stats.Units), db.func.sum(stats.Revenue))
+
+    status_counts = db.session.query(stats.Status, db.func.sum(stats.OrderCount))\
+        .filter(stats.SellerEmail == seller_email)\
+        .group_by(stats.Status)\
+        .all()
+
+    products = db.session.query(stats.ProductId, MsProduct.ProductName, *sums)\
+        .outerjoin(MsProduct, product_id_matches(stats.ProductId))\
+        .filter(stats.SellerEmail == seller_email, stats.Day >= since)\
+        .group_by(stats.ProductId, MsProduct.ProductName)\
+        .order_by(db.func.sum(stats.Revenue).desc(), stats.ProductId)\
+        .all()
+
+    daily = db.session.query(stats.Day, *sums)\
+        .filter(stats.SellerEmail == seller_email, stats.Day >= since)\
+        .group_by(stats.Day)\
+        .order_by(stats.Day)\
+        .all()
+
+    return {
+        'since': since.isoformat(),
+        'days': days,
+        'statusCounts': {status: int(count) for status, count in status_counts if count},
+        'totals': _totals(*(sum(row[i] or 0 for row in daily) for i in (1, 2, 3))),
+        'products': [
+            {'productId': product_id, 'productName': name, **_totals(*values)}
+            for product_id, name, *values in products
+        ],
+        'daily': [{'date': day.isoformat(), **_totals(*values)} for day, *values in daily]
+    }
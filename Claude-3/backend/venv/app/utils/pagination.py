@@ -0,0 +1,101 @@
+# app/utils/pagination.py
+import base64
+import json
+from datetime import date, datetime
+from flask import request, Response, stream_with_context
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Rows fetched per round-trip when streaming from a server-side cursor
+STREAM_BATCH_SIZE = 500
+
+# Cursors are opaque to clients: a base64-encoded JSON list holding the
+# sort key of the last row on the previous page
+def encode_cursor(values):
+    raw = json.dumps(list(values), default=str).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+def decode_cursor(cursor):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, UnicodeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, list) or not values:
+        raise ValueError('Invalid cursor')
+    return values
+
+# Read the page size and cursor from the query string
+def get_page_args():
+    limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    return limit, request.args.get('cursor')
+
+# Whether the client asked for a streamed NDJSON response
+def wants_stream():
+    return request.args.get('format') == 'ndjson' or \
+        'application/x-ndjson' in request.headers.get('Accept', '')
+
+# JSON turns UUIDs, decimals and datetimes into strings (or floats); convert
+# a decoded cursor value back to the Python type of its sort expression.
+# Sort keys are never NULL, so a null or nested value is a forged cursor
+def _coerce(expression, value):
+    if value is None or isinstance(value, (list, dict)):
+        raise ValueError('Invalid cursor')
+    try:
+        python_type = expression.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+    if isinstance(value, python_type):
+        return value
+    try:
+        if python_type in (date, datetime):
+            return python_type.fromisoformat(value)
+        return python_type(value)
+    except (TypeError, ValueError, AttributeError, ArithmeticError):
+        raise ValueError('Invalid cursor')
+
+# Build "(col1, col2, ...) > (val1, val2, ...)" as an OR chain so it works on
+# every backend and can still use the index on the sort columns
+def _after(order_by, values):
+    if len(values) != len(order_by):
+        raise ValueError('Invalid cursor')
+    values = [_coerce(column, value) for column, value in zip(order_by, values)]
+    clauses = []
+    for i, column in enumerate(order_by):
+        terms = [c == v for c, v in zip(order_by[:i], values[:i])]
+        terms.append(column > values[i])
+        clauses.append(and_(*terms))
+    return or_(*clauses)
+
+# Restrict a query to the rows that sort after the cursor
+def apply_cursor(query, order_by, cursor):
+    if cursor:
+        query = query.filter(_after(order_by, decode_cursor(cursor)))
+    return query
+
+# Apply keyset pagination to a query. `order_by` is the list of ascending
+# sort expressions (ending with a unique column so ordering is stable) and
+# `key` returns the values of those expressions for a result row.
+def paginate(query, order_by, key, cursor=None, limit=DEFAULT_PAGE_SIZE):
+    query = apply_cursor(query, order_by, cursor)
+    
+    # Fetch one extra row to know whether there is a next page
+    rows = query.order_by(*order_by).limit(limit + 1).all()
+    next_cursor = encode_cursor(key(rows[limit - 1])) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+# Stream every row of a query as newline-delimited JSON without building the
+# full result list in memory
+def stream_ndjson(query, order_by, serialize, cursor=None):
+    query = apply_cursor(query, order_by, cursor)
+    return ndjson_response(query.order_by(*order_by).yield_per(STREAM_BATCH_SIZE), serialize)
+
+# Stream any iterable of rows as newline-delimited JSON
+def ndjson_response(rows, serialize):
+    def generate():
+        for row in rows:
+            yield json.dumps(serialize(row), default=str) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
@@ -0,0 +1,29 @@
+# backfill_thumbnails.py
+# Write the missing thumbnails of every product image, e.g. for images
+# uploaded while Pillow was not installed or whose background job failed:
+#
+#   python backfill_thumbnails.py
+#
+# Until a thumbnail exists, listings keep serving the original image.
+import sys
+from app import create_app, db, image_service
+from app.models.product import MsProduct
+from app.utils import images
+
+def main():
+    if images.Image is None:
+        sys.exit('Pillow is not installed, so no thumbnails can be made')
+
+    app = create_app()
+    with app.app_context():
+        urls = [url for (url,) in db.session.query(MsProduct.ProductImages)
+            .filter(MsProduct.ProductImages.isnot(None))
+            .distinct()]
+        written = 0
+        for n, url in enumerate(urls, 1):
+            written += image_service.backfill(url)
+            print(f'{n}/{len(urls)} images, {written} thumbnails written', end='\r')
+        print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+# bench_checkout.py
+# Measure checkout throughput with many customers buying the same products
+# at once, then check that stock and orders still add up:
+#
+#   python bench_checkout.py --customers 2000 --threads 16 --products 20
+#   python bench_checkout.py --modes legacy
+#
+# The legacy mode runs the checkout as it was before row locking, for
+# comparison: one query.get per cart item and a read-modify-write of the
+# stock in Python with no row lock, then one DELETE per cart row. Expect it
+# to oversell on Postgres.
+#
+# Run it against Postgres; SQLite ignores FOR UPDATE and serializes writers,
+# so neither the throughput nor the oversell check mean much there.
+import argparse
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from flask import jsonify, request
+from app import create_app, db, product_cache
+from app.models.cart import Cart
+from app.models.order import Orders
+from app.models.product import MsProduct
+from app.models.user import MsUser
+from app.utils import order_stats
+
+MODES = {'batched': '/api/order/checkout', 'legacy': '/bench/legacy-checkout'}
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+# Seed a seller, `products` products and `customers` customers whose carts
+# hold `items` random products each. Emails are unique per run.
+def seed(run, customers, products, items, stock):
+    seller = f'bench-{run}-seller@example.com'
+    emails = [f'bench-{run}-customer-{n}@example.com' for n in range(customers)]
+    db.session.execute(db.insert(MsUser), [{'email': seller, 'password': 'x', 'role': 'Seller'}] + [
+        {'email': email, 'password': 'x', 'role': 'Customer'} for email in emails
+    ])
+    stock_by_id = {uuid.uuid4(): stock for _ in range(products)}
+    db.session.execute(db.insert(MsProduct), [
+        {'ProductId': product_id, 'ProductName': f'Bench product {n}', 'ProductPrice': Decimal('9.99'),
+         'ProductStock': stock, 'ProductOwner': seller}
+        for n, product_id in enumerate(stock_by_id)
+    ])
+    db.session.execute(db.insert(Cart), [
+        {'ProductId': product_id, 'Customer': email, 'Quantity': random.randint(1, 3)}
+        for email in emails for product_id in random.sample(list(stock_by_id), items)
+    ])
+    db.session.commit()
+    return emails, stock_by_id
+
+# The checkout route before row locking, kept to compare against
+def legacy_checkout():
+    data = request.json
+    user_email = data.get('userEmail')
+    cart_items = Cart.query.filter_by(Customer=user_email).all()
+    if not cart_items:
+        return jsonify({'success': False, 'message': 'Your cart is empty'}), 400
+
+    orders_created = []
+    errors = []
+    sellers = {}
+    try:
+        for item in cart_items:
+            # One SELECT per item, as query.get did
+            product = db.session.get(MsProduct, item.ProductId)
+            if not product:
+                errors.append(f'Product not found: {item.ProductId}')
+                continue
+            if product.ProductStock < item.Quantity:
+                errors.append(f'Not enough stock for {product.ProductName}. Available: {product.ProductStock}')
+                continue
+
+            new_order = Orders(
+                OrderId=str(uuid.uuid4()),
+                ProductId=str(item.ProductId),
+                Quantity=item.Quantity,
+                UnitPrice=product.ProductPrice,
+                Customer=user_email,
+                Status='Pending',
+                Timestamp=datetime.now(),
+                ShippingAddress=data.get('shippingAddress'),
+                PaymentMethod=data.get('paymentMethod')
+            )
+            # Read-modify-write: the UPDATE writes the value computed here
+            product.ProductStock -= item.Quantity
+            db.session.add(new_order)
+            orders_created.append(new_order)
+            sellers[str(product.ProductId)] = product.ProductOwner
+
+        if errors:
+            db.session.rollback()
+            return jsonify({'success': False, 'message': 'Could not complete checkout', 'errors': errors}), 400
+
+        order_stats.record_orders(orders_created, sellers)
+        for item in cart_items:
+            db.session.delete(item)
+        db.session.commit()
+        product_cache.invalidate(*(item.ProductId for item in cart_items))
+        return jsonify({'success': True, 'orderIds': [order.OrderId for order in orders_created]}), 201
+    except Exception:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': 'An error occurred during checkout'}), 500
+
+def run_checkouts(app, path, emails, threads):
+    local = threading.local()
+
+    def checkout(email):
+        if not hasattr(local, 'client'):
+            local.client = app.test_client()
+        started = time.perf_counter()
+        status = local.client.post(path, json={
+            'userEmail': email, 'shippingAddress': 'Bench address', 'paymentMethod': 'Bench'
+        }).status_code
+        return status, (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(checkout, emails))
+    return results, time.perf_counter() - started
+
+# Stock sold must equal the quantity ordered, and never exceed the stock
+def check_stock(stock_by_id):
+    products = MsProduct.query.filter(MsProduct.ProductId.in_(list(stock_by_id))).all()
+    ordered = dict(db.session.query(Orders.ProductId, db.func.sum(Orders.Quantity))
+        .filter(Orders.ProductId.in_([str(product_id) for product_id in stock_by_id]))
+        .group_by(Orders.ProductId)
+        .all())
+    problems = []
+    for product in products:
+        sold = stock_by_id[product.ProductId] - product.ProductStock
+        if product.ProductStock < 0 or sold != (ordered.get(str(product.ProductId)) or 0):
+            problems.append(f'{product.ProductName}: stock {product.ProductStock}, '
+                            f'sold {sold}, ordered {ordered.get(str(product.ProductId)) or 0}')
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark concurrent checkouts')
+    parser.add_argument('--customers', type=int, default=1000)
+    parser.add_argument('--products', type=int, default=20, help='products the customers compete for')
+    parser.add_argument('--items', type=int, default=3, help='products in each cart')
+    parser.add_argument('--stock', type=int, default=1000, help='starting stock of each product')
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    args = parser.parse_args()
+
+    app = create_app()
+    app.add_url_rule(MODES['legacy'], 'legacy_checkout', legacy_checkout, methods=['POST'])
+    print(f'{args.customers} checkouts over {args.products} products, {args.threads} threads')
+    with app.app_context():
+        for mode in args.modes:
+            # Each mode gets its own customers and freshly stocked products
+            emails, stock_by_id = seed(uuid.uuid4().hex[:8], args.customers, args.products, args.items, args.stock)
+            results, elapsed = run_checkouts(app, MODES[mode], emails, args.threads)
+
+            timings = sorted(ms for _, ms in results)
+            statuses = [status for status, _ in results]
+            print(f'{mode}: {len(emails) / elapsed:.1f} checkouts/s   p50 {percentile(timings, 50):.1f} ms   '
+                  f'p99 {percentile(timings, 99):.1f} ms')
+            print(f'  placed {statuses.count(201)}, out of stock {statuses.count(400)}, '
+                  f'failed {len(statuses) - statuses.count(201) - statuses.count(400)}')
+
+            db.session.expire_all()
+            problems = check_stock(stock_by_id)
+            print('  stock check: ' + ('OK' if not problems else 'OVERSOLD\n    ' + '\n    '.join(problems)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# bench_search.py
+# Compare product search latency through the search engine with the ILIKE
+# query it replaced, on a synthetic catalog:
+#
+#   python bench_search.py --products 200000
+#   python bench_search.py --bench-only --repeat 200 --terms "red shoe" lamp
+#
+# Seeded products belong to seed-seller-0@example.com (see seed_orders.py).
+import argparse
+import random
+import time
+import uuid
+from decimal import Decimal
+from app import create_app, db
+from app.models.product import MsProduct
+from app.models.user import MsUser
+from app.utils.search import get_search_engine
+
+SELLER = 'seed-seller-0@example.com'
+ADJECTIVES = ['red', 'blue', 'green', 'black', 'wooden', 'steel', 'vintage', 'compact', 'wireless', 'organic']
+NOUNS = ['shoe', 'lamp', 'chair', 'kettle', 'backpack', 'speaker', 'jacket', 'mug', 'keyboard', 'blanket']
+WORDS = ADJECTIVES + NOUNS + ['comfortable', 'durable', 'lightweight', 'handmade', 'premium', 'classic']
+DEFAULT_TERMS = ['red', 'lamp', 'wireless speaker', 'vintag', 'keybord', 'steel kettle']
+
+def seed_products(total, batch_size):
+    if not db.session.get(MsUser, SELLER):
+        db.session.add(MsUser(SELLER, 'password', 'Seller'))
+        db.session.commit()
+
+    for offset in range(0, total, batch_size):
+        db.session.execute(db.insert(MsProduct), [
+            {
+                'ProductId': uuid.uuid4(),
+                'ProductName': f'{random.choice(ADJECTIVES)} {random.choice(NOUNS)} {n}',
+                'ProductDescription': ' '.join(random.choices(WORDS, k=12)),
+                'ProductPrice': Decimal(random.randint(100, 50000)) / 100,
+                'ProductStock': random.randint(0, 100),
+                'ProductOwner': SELLER
+            }
+            for n in range(offset, min(offset + batch_size, total))
+        ])
+        db.session.commit()
+
+def base_query():
+    # Same filter as GET /api/products/search
+    return MsProduct.query.filter(MsProduct.IsActive == True, MsProduct.ProductStock > 0)
+
+def ilike_search(term, limit):
+    return base_query()\
+        .filter(MsProduct.ProductName.ilike(f'%{term}%'))\
+        .order_by(MsProduct.ProductId)\
+        .limit(limit)\
+        .all()
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def time_ms(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+        db.session.rollback()
+    timings.sort()
+    return result, percentile(timings, 50), percentile(timings, 99)
+
+def bench(terms, repeat, limit):
+    engine = get_search_engine()
+    engine.search(base_query(), terms[0], limit=limit)  # build the local index, if any
+    print(f'{base_query().count()} searchable products, {engine.name} engine, page size {limit}')
+    print(f'{"term":<20}{"engine p50":>12}{"p99":>10}{"hits":>6}{"ILIKE p50":>12}{"p99":>10}{"hits":>6}')
+    for term in terms:
+        (found, _), p50, p99 = time_ms(lambda: engine.search(base_query(), term, limit=limit), repeat)
+        rows, ilike_p50, ilike_p99 = time_ms(lambda: ilike_search(term, limit), repeat)
+        print(f'{term:<20}{p50:>12.2f}{p99:>10.2f}{len(found):>6}{ilike_p50:>12.2f}{ilike_p99:>10.2f}{len(rows):>6}')
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark product search against ILIKE')
+    parser.add_argument('--products', type=int, default=100000)
+    parser.add_argument('--batch', type=int, default=10000)
+    parser.add_argument('--terms', nargs='+', default=DEFAULT_TERMS)
+    parser.add_argument('--repeat', type=int, default=100)
+    parser.add_argument('--limit', type=int, default=50)
+    parser.add_argument('--bench-only', action='store_true')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        if not args.bench_only:
+            seed_products(args.products, args.batch)
+        bench(args.terms, args.repeat, args.limit)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+# seed_orders.py
+# Seed a large synthetic order history and compare the seller analytics read
+# from OrderDailyStats with the same aggregates computed from Orders:
+#
+#   python seed_orders.py --orders 2000000
+#   python seed_orders.py --bench-only --repeat 20
+#
+# Seeded users are seed-seller-<n>@example.com and seed-customer-<n>@example.com
+# with the password 'password'.
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from werkzeug.security import generate_password_hash
+from app import create_app, db
+from app.models.order import Orders
+from app.models.order_stats import OrderDailyStats
+from app.models.product import MsProduct, product_id_matches
+from app.models.user import MsUser
+from app.utils import order_stats
+
+STATUSES = ['Pending', 'Accepted', 'Shipped', 'Completed']
+STATUS_WEIGHTS = [10, 10, 20, 60]
+
+def seller_email(n):
+    return f'seed-seller-{n}@example.com'
+
+def customer_email(n):
+    return f'seed-customer-{n}@example.com'
+
+# Create missing seed users and products, returning (ProductId, price) pairs
+def seed_catalog(sellers, products_per_seller, customers):
+    password = generate_password_hash('password')
+    emails = [(seller_email(n), 'Seller') for n in range(sellers)] + \
+        [(customer_email(n), 'Customer') for n in range(customers)]
+    existing = {email for (email,) in db.session.query(MsUser.email).filter(
+        MsUser.email.in_([email for email, _ in emails])
+    )}
+    users = [
+        {'email': email, 'password': password, 'role': role}
+        for email, role in emails if email not in existing
+    ]
+    if users:
+        db.session.execute(db.insert(MsUser), users)
+
+    products = []
+    for n in range(sellers):
+        owner = seller_email(n)
+        count = MsProduct.query.filter_by(ProductOwner=owner).count()
+        products += [
+            {
+                'ProductId': uuid.uuid4(),
+                'ProductName': f'Seed product {n}-{i}',
+                'ProductPrice': Decimal(random.randint(100, 50000)) / 100,
+                'ProductStock': 1000000,
+                'ProductOwner': owner
+            }
+            for i in range(count, products_per_seller)
+        ]
+    if products:
+        db.session.execute(db.insert(MsProduct), products)
+    db.session.commit()
+
+    return [
+        (str(product_id), price)
+        for product_id, price in db.session.query(MsProduct.ProductId, MsProduct.ProductPrice)
+            .filter(MsProduct.ProductOwner.in_([seller_email(n) for n in range(sellers)]))
+    ]
+
+def seed_orders(total, products, customers, days, batch_size):
+    now = datetime.now()
+    started = time.perf_counter()
+    for offset in range(0, total, batch_size):
+        batch = []
+        for _ in range(min(batch_size, total - offset)):
+            product_id, price = random.choice(products)
+            batch.append({
+                'OrderId': str(uuid.uuid4()),
+                'ProductId': product_id,
+                'Quantity': random.randint(1, 5),
+                'UnitPrice': price,
+                'Customer': customer_email(random.randrange(customers)),
+                'Status': random.choices(STATUSES, STATUS_WEIGHTS)[0],
+                'Timestamp': now - timedelta(seconds=random.randrange(days * 86400)),
+                'ShippingAddress': 'Seed address',
+                'PaymentMethod': 'Seed'
+            })
+        db.session.execute(db.insert(Orders), batch)
+        db.session.commit()
+        done = offset + len(batch)
+        print(f'{done} orders, {done / (time.perf_counter() - started):.0f}/s', end='\r')
+    print()
+
+# The same result as order_stats.seller_analytics, aggregated from Orders
+def naive_analytics(email, days):
+    since = datetime.combine(date.today() - timedelta(days=days - 1), datetime.min.time())
+    # date() rather than CAST, which SQLite turns into just the year
+    day = db.func.date(Orders.Timestamp, type_=db.Date)
+    sums = (db.func.count(), db.func.sum(Orders.Quantity), db.func.sum(Orders.Quantity * Orders.UnitPrice))
+
+    def seller_orders(*columns):
+        return db.session.query(*columns)\
+            .join(MsProduct, product_id_matches(Orders.ProductId))\
+            .filter(MsProduct.ProductOwner == email)
+
+    return {
+        'statusCounts': dict(seller_orders(Orders.Status, db.func.count()).group_by(Orders.Status).all()),
+        'products': seller_orders(Orders.ProductId, MsProduct.ProductName, *sums)
+            .filter(Orders.Timestamp >= since)
+            .group_by(Orders.ProductId, MsProduct.ProductName)
+            .all(),
+        'daily': seller_orders(day, *sums)
+            .filter(Orders.Timestamp >= since)
+            .group_by(day)
+            .all()
+    }
+
+def time_ms(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+        db.session.rollback()
+    return statistics.median(timings), max(timings)
+
+def bench(email, days, repeat):
+    orders = Orders.query.join(MsProduct, product_id_matches(Orders.ProductId))\
+        .filter(MsProduct.ProductOwner == email).count()
+    summary_rows = OrderDailyStats.query.filter_by(SellerEmail=email).count()
+    print(f'seller {email}: {orders} orders, {summary_rows} summary rows, {days} day window')
+
+    fast = order_stats.seller_analytics(email, days)
+    slow = naive_analytics(email, days)
+    if fast['statusCounts'] != slow['statusCounts']:
+        print(f'WARNING: summary rows are out of date: {fast["statusCounts"]} != {slow["statusCounts"]}')
+
+    for label, fn in (
+        ('summary rows', lambda: order_stats.seller_analytics(email, days)),
+        ('naive aggregate', lambda: naive_analytics(email, days))
+    ):
+        median, worst = time_ms(fn, repeat)
+        print(f'{label:<16} median {median:9.2f} ms   max {worst:9.2f} ms')
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed orders and benchmark seller analytics')
+    parser.add_argument('--orders', type=int, default=1000000)
+    parser.add_argument('--sellers', type=int, default=20)
+    parser.add_argument('--products-per-seller', type=int, default=50)
+    parser.add_argument('--customers', type=int, default=1000)
+    parser.add_argument('--days', type=int, default=365, help='spread orders over this many days')
+    parser.add_argument('--batch', type=int, default=10000)
+    parser.add_argument('--window', type=int, default=order_stats.DEFAULT_WINDOW_DAYS)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--bench-only', action='store_true')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        if not args.bench_only:
+            products = seed_catalog(args.sellers, args.products_per_seller, args.customers)
+            seed_orders(args.orders, products, args.customers, args.days, args.batch)
+            print('Rebuilding summary rows...')
+            order_stats.rebuild()
+            db.session.commit()
+        bench(seller_email(0), args.window, args.repeat)
+
+if __name__ == '__main__':
+    main()
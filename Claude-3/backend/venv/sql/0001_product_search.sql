@@ -0,0 +1,15 @@
+-- Indexes for product search (app/utils/search.py).
+--
+-- The tsvector expression must stay identical to the one built in
+-- PostgresSearchEngine, otherwise the planner will not use the index.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS "ix_MsProduct_search_vector"
+    ON "MsProduct"
+    USING GIN (to_tsvector('simple', coalesce("ProductName", '') || ' ' || coalesce("ProductDescription", '')));
+
+-- Typo-tolerant matching on the product name with the % operator
+CREATE INDEX IF NOT EXISTS "ix_MsProduct_name_trgm"
+    ON "MsProduct"
+    USING GIN ("ProductName" gin_trgm_ops);
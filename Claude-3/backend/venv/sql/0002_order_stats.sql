@@ -0,0 +1,44 @@
+-- Seller analytics (app/utils/order_stats.py).
+--
+-- New databases get the same schema from db.create_all(); run this once on
+-- existing ones. The backfill equals order_stats.rebuild().
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS "ix_Orders_product_status_time"
+    ON "Orders" ("ProductId", "Status", "Timestamp");
+
+-- Price paid per unit, so revenue does not follow later price edits.
+-- Existing orders take the current price, or 0 if the product is gone.
+ALTER TABLE "Orders" ADD COLUMN IF NOT EXISTS "UnitPrice" numeric(10, 2);
+UPDATE "Orders" o
+    SET "UnitPrice" = p."ProductPrice"
+    FROM "MsProduct" p
+    WHERE o."UnitPrice" IS NULL AND o."ProductId" = p."ProductId"::text;
+UPDATE "Orders" SET "UnitPrice" = 0 WHERE "UnitPrice" IS NULL;
+ALTER TABLE "Orders" ALTER COLUMN "UnitPrice" SET NOT NULL;
+
+CREATE TABLE IF NOT EXISTS "OrderDailyStats" (
+    "ProductId" varchar(36) NOT NULL,
+    "Day" date NOT NULL,
+    "Status" varchar(15) NOT NULL,
+    "SellerEmail" varchar(100) NOT NULL,
+    "OrderCount" integer NOT NULL DEFAULT 0,
+    "Units" integer NOT NULL DEFAULT 0,
+    "Revenue" numeric(14, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY ("ProductId", "Day", "Status")
+);
+
+CREATE INDEX IF NOT EXISTS "ix_OrderDailyStats_seller_day"
+    ON "OrderDailyStats" ("SellerEmail", "Day");
+
+DELETE FROM "OrderDailyStats";
+INSERT INTO "OrderDailyStats"
+    ("ProductId", "Day", "Status", "SellerEmail", "OrderCount", "Units", "Revenue")
+SELECT o."ProductId", o."Timestamp"::date, coalesce(o."Status", 'Pending'), p."ProductOwner",
+       count(*), sum(o."Quantity"), sum(o."Quantity" * o."UnitPrice")
+FROM "Orders" o
+JOIN "MsProduct" p ON o."ProductId" = p."ProductId"::text
+GROUP BY 1, 2, 3, 4;
+
+COMMIT;
@@ -0,0 +1,15 @@
+# tests/test_auth.py
+import pytest
+from werkzeug.security import generate_password_hash
+from app.utils.auth import needs_rehash
+
+# Short forms are expanded by werkzeug, so compare against what it writes
+@pytest.mark.parametrize('method', ['pbkdf2', 'scrypt', 'pbkdf2:sha256:1000', 'scrypt:16384:8:1'])
+def test_hash_made_with_the_configured_method_is_kept(app, method):
+    app.config['PASSWORD_HASH_METHOD'] = method
+    assert not needs_rehash(generate_password_hash('secret', method=method))
+
+def test_hash_made_with_other_parameters_is_upgraded(app):
+    app.config['PASSWORD_HASH_METHOD'] = 'scrypt'
+    assert needs_rehash(generate_password_hash('secret', method='scrypt:16384:8:1'))
+    assert needs_rehash(generate_password_hash('secret', method='pbkdf2:sha256:1000'))
@@ -0,0 +1,85 @@
+# tests/test_checkout_concurrency.py
+import os
+import threading
+import uuid
+from decimal import Decimal
+import pytest
+from app import db
+from app.models.cart import Cart
+from app.models.order import Orders
+from app.models.product import MsProduct
+from app.models.user import MsUser
+
+# SQLite ignores FOR UPDATE and serializes writers, so only Postgres
+# exercises the row locks
+pytestmark = pytest.mark.skipif(
+    not os.getenv('TEST_DATABASE_URL', '').startswith('postgresql'),
+    reason='set TEST_DATABASE_URL to a Postgres database'
+)
+
+SELLER = 'seller@example.com'
+
+def customer(n):
+    return f'customer-{n}@example.com'
+
+# Seed `customers` customers whose carts hold one of each product, returning
+# the product ids
+def seed_carts(customers, products, stock):
+    db.session.execute(db.insert(MsUser), [{'email': SELLER, 'password': 'x', 'role': 'Seller'}] + [
+        {'email': customer(n), 'password': 'x', 'role': 'Customer'} for n in range(customers)
+    ])
+    product_ids = [uuid.uuid4() for _ in range(products)]
+    db.session.execute(db.insert(MsProduct), [
+        {'ProductId': product_id, 'ProductName': f'Product {n}', 'ProductPrice': Decimal('9.99'),
+         'ProductStock': stock, 'ProductOwner': SELLER}
+        for n, product_id in enumerate(product_ids)
+    ])
+    db.session.execute(db.insert(Cart), [
+        {'ProductId': product_id, 'Customer': customer(n), 'Quantity': 1}
+        for n in range(customers) for product_id in reversed(product_ids)
+    ])
+    db.session.commit()
+    return product_ids
+
+# Run checkout for every email at the same time, returning the status codes
+def checkout_concurrently(app, emails):
+    barrier = threading.Barrier(len(emails))
+    statuses = [None] * len(emails)
+
+    def checkout(i, email):
+        client = app.test_client()
+        barrier.wait()
+        statuses[i] = client.post('/api/order/checkout', json={
+            'userEmail': email, 'shippingAddress': '1 Test Street', 'paymentMethod': 'Card'
+        }).status_code
+
+    threads = [threading.Thread(target=checkout, args=(i, email)) for i, email in enumerate(emails)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return statuses
+
+def test_concurrent_checkouts_do_not_oversell(app):
+    stock, customers = 5, 12
+    product_ids = seed_carts(customers, products=2, stock=stock)
+
+    statuses = checkout_concurrently(app, [customer(n) for n in range(customers)])
+
+    assert statuses.count(201) == stock
+    assert statuses.count(400) == customers - stock
+    db.session.expire_all()
+    for product_id in product_ids:
+        assert db.session.get(MsProduct, product_id).ProductStock == 0
+        assert Orders.query.filter_by(ProductId=str(product_id)).count() == stock
+
+def test_repeated_checkout_orders_the_cart_once(app):
+    product_ids = seed_carts(1, products=2, stock=100)
+
+    statuses = checkout_concurrently(app, [customer(0)] * 6)
+
+    assert statuses.count(201) == 1
+    db.session.expire_all()
+    assert Orders.query.filter_by(Customer=customer(0)).count() == len(product_ids)
+    for product_id in product_ids:
+        assert db.session.get(MsProduct, product_id).ProductStock == 99
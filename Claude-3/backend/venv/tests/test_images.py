@@ -0,0 +1,90 @@
+# tests/test_images.py
+import io
+import os
+from types import SimpleNamespace
+import pytest
+from werkzeug.datastructures import FileStorage
+from app.utils import images as images_module
+from app.utils.images import ImageService, InvalidImage, LocalStorage, detect_image_format
+
+Image = pytest.importorskip('PIL.Image')
+
+@pytest.fixture
+def images(tmp_path):
+    service = ImageService()
+    service.storage = LocalStorage(str(tmp_path), '/static/product_images')
+    service.executor = SimpleNamespace(submit=lambda *args: None)  # background jobs never run
+    return service
+
+def image_bytes(image_format='PNG'):
+    data = io.BytesIO()
+    Image.new('RGB', (600, 400), 'red').save(data, image_format)
+    return data.getvalue()
+
+def upload(service, data=None, filename='photo.png'):
+    return service.save_upload(FileStorage(io.BytesIO(image_bytes() if data is None else data), filename=filename))
+
+def test_thumbnail_url_falls_back_to_the_original_until_it_exists(images):
+    url = upload(images)
+    assert images.thumbnail_url(url, 256) == url
+
+    assert images.backfill(url) == len(images.thumbnail_sizes)
+    thumbnail = images.thumbnail_url(url, 256)
+    assert thumbnail.startswith('/static/product_images/thumbnails/256/')
+    assert images.storage.exists(thumbnail.split('/static/product_images/', 1)[1])
+
+    assert images.backfill(url) == 0
+
+def test_thumbnail_url_keeps_legacy_urls(images):
+    assert images.thumbnail_url('/static/uploads/old.jpg', 256) == '/static/uploads/old.jpg'
+    assert images.thumbnail_url(None, 256) is None
+
+def test_missing_thumbnail_is_cached_for_a_while(images, monkeypatch):
+    url = upload(images)
+    checks = []
+    exists = images.storage.exists
+    monkeypatch.setattr(images.storage, 'exists', lambda key: checks.append(key) or exists(key))
+
+    assert images.thumbnail_url(url, 256) == url
+    assert images.thumbnail_url(url, 256) == url
+    assert len(checks) == 1
+
+    # Misses are checked again once the TTL has passed
+    images._thumbnails_missing = {key: 0 for key in images._thumbnails_missing}
+    assert images.thumbnail_url(url, 256) == url
+    assert len(checks) == 2
+
+    # Writing the thumbnail clears the miss straight away
+    images.backfill(url)
+    assert images.thumbnail_url(url, 256) != url
+
+def test_upload_extension_comes_from_the_content(images):
+    assert upload(images, image_bytes('JPEG'), filename='photo.png').endswith('.jpg')
+    assert upload(images, filename='payload.html').endswith('.png')
+
+@pytest.mark.parametrize('data', [
+    b'<script>alert(1)</script>',
+    image_bytes()[:64],  # truncated
+    b'',
+])
+def test_upload_that_is_not_an_image_is_rejected(images, tmp_path, data):
+    with pytest.raises(InvalidImage):
+        upload(images, data, filename='photo.png')
+    assert not os.path.exists(tmp_path / 'originals')
+
+def test_format_is_sniffed_without_pillow(tmp_path, monkeypatch):
+    monkeypatch.setattr(images_module, 'Image', None)
+    path = tmp_path / 'upload'
+    for image_format in ('JPEG', 'PNG', 'GIF', 'WEBP'):
+        path.write_bytes(image_bytes(image_format))
+        assert detect_image_format(str(path)) == image_format
+    path.write_bytes(b'MZ\x90\x00 not an image')
+    assert detect_image_format(str(path)) is None
+
+def test_product_with_invalid_image_is_rejected(client):
+    response = client.post('/api/products', data={
+        'ProductName': 'Lamp', 'ProductPrice': '9.99', 'ProductStock': '1',
+        'ProductImage': (io.BytesIO(b'not an image'), 'lamp.png'),
+    })
+    assert response.status_code == 400
+    assert response.get_json() == {'errors': ['Image must be a JPEG, PNG, GIF or WebP file']}
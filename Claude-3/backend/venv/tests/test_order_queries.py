@@ -0,0 +1,62 @@
+# tests/test_order_queries.py
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+import pytest
+from app import db
+from app.models.order import Orders
+from app.models.product import MsProduct
+from app.models.user import MsUser
+from app.utils.metrics import query_budget
+
+SELLER = 'seller@example.com'
+CUSTOMER = 'customer@example.com'
+N = 5
+QUERY_BUDGET = 1
+
+def seed_orders(count):
+    if not db.session.get(MsUser, SELLER):
+        db.session.add_all([MsUser(SELLER, 'password', 'Seller'), MsUser(CUSTOMER, 'password', 'Customer')])
+        db.session.add_all([
+            MsProduct(ProductName=f'Product {n}', ProductPrice=Decimal('9.99'), ProductStock=100, ProductOwner=SELLER)
+            for n in range(3)
+        ])
+        db.session.flush()
+
+    products = MsProduct.query.order_by(MsProduct.ProductName).all()
+    now = datetime.utcnow()
+    db.session.add_all([
+        Orders(
+            OrderId=str(uuid.uuid4()),
+            ProductId=str(products[n % len(products)].ProductId),
+            Quantity=1,
+            UnitPrice=Decimal('9.99'),
+            Customer=CUSTOMER,
+            Status='Pending',
+            Timestamp=now - timedelta(minutes=n),
+            ShippingAddress='1 Test Street',
+            PaymentMethod='Card'
+        )
+        for n in range(count)
+    ])
+    db.session.commit()
+
+def get_orders(client, url):
+    with query_budget(QUERY_BUDGET) as statements:
+        response = client.get(url)
+    assert response.status_code == 200, response.json
+    return response.json['orders'], len(statements)
+
+@pytest.mark.parametrize('url', [
+    f'/api/orders?userEmail={CUSTOMER}',
+    f'/api/seller/orders?sellerEmail={SELLER}'
+])
+def test_order_listing_runs_a_constant_number_of_queries(client, url):
+    seed_orders(N)
+    orders, queries = get_orders(client, url)
+    assert len(orders) == N
+
+    seed_orders(9 * N)
+    orders, queries_for_10n = get_orders(client, url)
+    assert len(orders) == 10 * N
+    assert queries_for_10n == queries
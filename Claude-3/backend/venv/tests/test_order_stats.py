@@ -0,0 +1,117 @@
+# tests/test_order_stats.py
+from decimal import Decimal
+import pytest
+from app import db
+from app.models.cart import Cart
+from app.models.order import Orders
+from app.models.product import MsProduct
+from app.models.user import MsUser
+from app.utils import order_stats
+from seed_orders import naive_analytics
+
+SELLER = 'seller@example.com'
+OTHER_SELLER = 'other@example.com'
+CUSTOMER = 'customer@example.com'
+DAYS = order_stats.DEFAULT_WINDOW_DAYS
+
+@pytest.fixture
+def products(app):
+    db.session.add_all([
+        MsUser(SELLER, 'password', 'Seller'),
+        MsUser(OTHER_SELLER, 'password', 'Seller'),
+        MsUser(CUSTOMER, 'password', 'Customer'),
+    ])
+    products = [
+        MsProduct(ProductName=name, ProductPrice=Decimal(price), ProductStock=50, ProductOwner=owner)
+        for name, price, owner in [
+            ('Lamp', '9.99', SELLER), ('Desk', '120.00', SELLER), ('Chair', '45.50', OTHER_SELLER)
+        ]
+    ]
+    db.session.add_all(products)
+    db.session.commit()
+    return products
+
+def checkout(client, quantities):
+    db.session.add_all([
+        Cart(ProductId=product.ProductId, Customer=CUSTOMER, Quantity=quantity)
+        for product, quantity in quantities
+    ])
+    db.session.commit()
+    response = client.post('/api/order/checkout', json={
+        'userEmail': CUSTOMER, 'shippingAddress': '1 Test Street', 'paymentMethod': 'Card'
+    })
+    assert response.status_code == 201, response.json
+    orders = Orders.query.filter(Orders.OrderId.in_(response.json['orderIds']))
+    return {order.ProductId: order.OrderId for order in orders}
+
+def set_status(client, order_id, status, user_email):
+    return client.post('/api/orders/update-status', json={
+        'orderId': order_id, 'status': status, 'userEmail': user_email
+    })
+
+def analytics(client):
+    response = client.get(f'/api/seller/analytics?sellerEmail={SELLER}&days={DAYS}')
+    assert response.status_code == 200
+    return response.json['analytics']
+
+# The naive aggregate over Orders, shaped like seller_analytics
+def expected_analytics():
+    naive = naive_analytics(SELLER, DAYS)
+    return {
+        'statusCounts': naive['statusCounts'],
+        'products': {
+            str(product_id): (name, count, units, float(revenue))
+            for product_id, name, count, units, revenue in naive['products']
+        },
+        'daily': {day.isoformat(): (count, units, float(revenue)) for day, count, units, revenue in naive['daily']}
+    }
+
+def actual_analytics(result):
+    return {
+        'statusCounts': result['statusCounts'],
+        'products': {
+            p['productId']: (p['productName'], p['orders'], p['units'], p['revenue']) for p in result['products']
+        },
+        'daily': {d['date']: (d['orders'], d['units'], d['revenue']) for d in result['daily']}
+    }
+
+def test_summary_rows_match_the_naive_aggregate(client, products):
+    lamp, desk, chair = products
+    orders = checkout(client, [(lamp, 2), (desk, 1), (chair, 4)])
+    lamp_order, desk_order = orders[str(lamp.ProductId)], orders[str(desk.ProductId)]
+    checkout(client, [(lamp, 3)])
+
+    # The customer can't complete an order that hasn't shipped
+    assert set_status(client, lamp_order, 'Completed', CUSTOMER).status_code == 400
+    for status, user in [('Accepted', SELLER), ('Shipped', SELLER), ('Completed', CUSTOMER)]:
+        assert set_status(client, lamp_order, status, user).status_code == 200
+    assert set_status(client, desk_order, 'Accepted', SELLER).status_code == 200
+
+    result = analytics(client)
+    assert actual_analytics(result) == expected_analytics()
+    assert result['statusCounts'] == {'Pending': 1, 'Accepted': 1, 'Completed': 1}
+    assert result['totals'] == {'orders': 3, 'units': 6, 'revenue': pytest.approx(5 * 9.99 + 120)}
+
+    # Rebuilding from Orders gives the same rows the deltas produced
+    order_stats.rebuild()
+    db.session.commit()
+    assert analytics(client) == result
+
+def test_summary_rows_follow_every_status(client, products):
+    lamp = products[0]
+    order_id = checkout(client, [(lamp, 1)])[str(lamp.ProductId)]
+    for status, user in [('Accepted', SELLER), ('Shipped', SELLER), ('Completed', CUSTOMER)]:
+        assert set_status(client, order_id, status, user).status_code == 200
+        assert analytics(client)['statusCounts'] == {status: 1}
+        assert actual_analytics(analytics(client)) == expected_analytics()
+    assert db.session.get(Orders, order_id).Status == 'Completed'
+
+def test_failure_is_logged_not_returned(client, products, monkeypatch, caplog):
+    def fail(*args):
+        raise RuntimeError('connection to db-internal:5432 refused')
+    monkeypatch.setattr(order_stats, 'seller_analytics', fail)
+
+    response = client.get(f'/api/seller/analytics?sellerEmail={SELLER}')
+    assert response.status_code == 500
+    assert response.json == {'success': False, 'message': 'Failed to load analytics'}
+    assert 'db-internal' in caplog.text
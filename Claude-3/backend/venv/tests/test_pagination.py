@@ -0,0 +1,86 @@
+# tests/test_pagination.py
+import base64
+import json
+from decimal import Decimal
+import pytest
+from app import db
+from app.models.product import MsProduct
+from app.models.user import MsUser
+from app.utils.pagination import encode_cursor
+
+SELLER = 'seller@example.com'
+PRODUCTS = 23
+PAGE_SIZE = 7
+
+@pytest.fixture
+def product_ids(app):
+    db.session.add(MsUser(SELLER, 'password', 'Seller'))
+    products = [
+        MsProduct(ProductName=f'Lamp {n}', ProductPrice=Decimal('9.99'), ProductStock=5, ProductOwner=SELLER)
+        for n in range(PRODUCTS)
+    ]
+    db.session.add_all(products)
+    db.session.commit()
+    return {str(product.ProductId) for product in products}
+
+# Follow nextCursor from the first page to the last, collecting product ids
+def walk(client, path, **params):
+    seen, cursor, pages = [], None, 0
+    while True:
+        query = dict(params, limit=PAGE_SIZE, **({'cursor': cursor} if cursor else {}))
+        response = client.get(path, query_string=query)
+        assert response.status_code == 200
+        body = response.get_json()
+        seen.extend(product['ProductId'] for product in body['products'])
+        pages += 1
+        cursor = body['nextCursor']
+        if cursor is None:
+            return seen, pages
+
+@pytest.mark.parametrize('path, params', [
+    ('/api/products', {}),
+    ('/api/products/search', {}),
+    ('/api/products/search', {'q': 'lamp'}),
+])
+def test_pages_cover_every_product_once(client, product_ids, path, params):
+    seen, pages = walk(client, path, **params)
+    assert len(seen) == len(set(seen))
+    assert set(seen) == product_ids
+    assert pages == -(-PRODUCTS // PAGE_SIZE)
+
+def test_stream_resumes_after_cursor(client, product_ids):
+    first = client.get('/api/products', query_string={'limit': PAGE_SIZE}).get_json()
+    response = client.get('/api/products', query_string={'format': 'ndjson', 'cursor': first['nextCursor']})
+    streamed = [json.loads(line)['ProductId'] for line in response.get_data(as_text=True).splitlines()]
+    page_ids = [product['ProductId'] for product in first['products']]
+    assert set(page_ids).isdisjoint(streamed)
+    assert set(page_ids) | set(streamed) == product_ids
+
+def raw_cursor(text):
+    return base64.urlsafe_b64encode(text.encode('utf-8')).decode('ascii')
+
+@pytest.mark.parametrize('cursor', [
+    'not a cursor',
+    raw_cursor('not json'),
+    raw_cursor('{"ProductId": 1}'),
+    encode_cursor([]),
+    encode_cursor([None]),
+    encode_cursor([[1]]),
+    encode_cursor(['not-a-uuid']),
+    encode_cursor(['00000000-0000-0000-0000-000000000000', 1]),
+])
+@pytest.mark.parametrize('path', ['/api/products', '/api/products/search'])
+def test_bad_cursor_is_rejected(client, product_ids, path, cursor):
+    for params in ({}, {'format': 'ndjson'}):
+        response = client.get(path, query_string=dict(params, cursor=cursor))
+        assert response.status_code == 400
+        assert response.get_json() == {'message': 'Invalid cursor'}
+
+@pytest.mark.parametrize('cursor', [
+    encode_cursor([None, None]),
+    encode_cursor(['-1', 'not-a-uuid']),
+    encode_cursor([-1.0]),
+])
+def test_bad_search_cursor_is_rejected(client, product_ids, cursor):
+    response = client.get('/api/products/search', query_string={'q': 'lamp', 'cursor': cursor})
+    assert response.status_code == 400
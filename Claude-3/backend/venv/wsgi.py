@@ -0,0 +1,10 @@
+# wsgi.py
+# Production entry point: gunicorn -c gunicorn.conf.py wsgi:app
+from app import create_app
+from config import ProductionConfig
+
+missing = ProductionConfig.missing_environment()
+if missing:
+    raise RuntimeError(f'Set {", ".join(missing)} in the environment before starting in production')
+
+app = create_app(ProductionConfig)
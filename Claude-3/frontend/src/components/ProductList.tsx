@@ -205,7 +205,9 @@ export default function ProductList({
                             }`}>
                             <div className="relative h-48 bg-gray-100">
                                 <img
-                                    src={getImageUrl(product.ProductImages)}
+                                    src={getImageUrl(
+                                        product.ProductThumbnail ?? product.ProductImages
+                                    )}
                                     alt={product.ProductName}
                                     className="w-full h-full object-cover"
                                 />
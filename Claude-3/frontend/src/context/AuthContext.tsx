@@ -128,6 +128,7 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({
             const user = { email: data.email, role: response.role };
 
             localStorage.setItem("token", response.token);
+            localStorage.setItem("refreshToken", response.refreshToken);
             localStorage.setItem("user", JSON.stringify(user));
 
             dispatch({
@@ -159,6 +160,7 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({
             const user = { email: data.email, role: response.role };
 
             localStorage.setItem("token", response.token);
+            localStorage.setItem("refreshToken", response.refreshToken);
             localStorage.setItem("user", JSON.stringify(user));
 
             dispatch({
@@ -185,6 +187,7 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({
     // Logout
     const logout = () => {
         localStorage.removeItem("token");
+        localStorage.removeItem("refreshToken");
         localStorage.removeItem("user");
         dispatch({ type: "LOGOUT" });
         navigate("/login");
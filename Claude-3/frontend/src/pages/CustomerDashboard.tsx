@@ -7,11 +7,15 @@ import type { Product } from "../types/product";
 const ProductSearch: React.FC = () => {
     const [products, setProducts] = useState<Product[]>([]);
     const [searchQuery, setSearchQuery] = useState<string>("");
+    // Query of the listed results and the cursor of their next page
+    const [activeQuery, setActiveQuery] = useState<string>("");
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
     const [isLoading, setIsLoading] = useState<boolean>(false);
+    const [isLoadingMore, setIsLoadingMore] = useState<boolean>(false);
     const [error, setError] = useState<string | null>(null);
     const navigate = useNavigate();
 
-    // Function to load products
+    // Function to load the first page of products
     const loadProducts = async (query: string = "") => {
         setIsLoading(true);
         setError(null);
@@ -19,6 +23,8 @@ const ProductSearch: React.FC = () => {
         try {
             const response = await searchProducts(query);
             setProducts(response.products);
+            setActiveQuery(query);
+            setNextCursor(response.nextCursor);
 
             if (response.products.length === 0 && query) {
                 setError(`No products found matching "${query}"`);
@@ -31,6 +37,26 @@ const ProductSearch: React.FC = () => {
         }
     };
 
+    // Append the next page of the current results
+    const loadMoreProducts = async () => {
+        if (!nextCursor) return;
+        setIsLoadingMore(true);
+
+        try {
+            const response = await searchProducts(activeQuery, nextCursor);
+            setProducts((prevProducts) => [
+                ...prevProducts,
+                ...response.products,
+            ]);
+            setNextCursor(response.nextCursor);
+        } catch (err) {
+            setError("Failed to load more products. Please try again later.");
+            console.error("Error loading more products:", err);
+        } finally {
+            setIsLoadingMore(false);
+        }
+    };
+
     // Load products on component mount
     useEffect(() => {
         loadProducts();
@@ -114,7 +140,10 @@ const ProductSearch: React.FC = () => {
                             <div className="h-48 bg-gray-200 flex items-center justify-center">
                                 {product.ProductImages ? (
                                     <img
-                                        src={product.ProductImages}
+                                        src={
+                                            product.ProductThumbnail ??
+                                            product.ProductImages
+                                        }
                                         alt={product.ProductName}
                                         className="w-full h-full object-cover"
                                     />
@@ -147,6 +176,18 @@ const ProductSearch: React.FC = () => {
                 </div>
             )}
 
+            {/* Next page of results */}
+            {!isLoading && nextCursor && (
+                <div className="flex justify-center mt-8">
+                    <button
+                        onClick={loadMoreProducts}
+                        disabled={isLoadingMore}
+                        className="px-6 py-2 bg-blue-600 text-white rounded hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-blue-500 disabled:opacity-50">
+                        {isLoadingMore ? "Loading..." : "Load more"}
+                    </button>
+                </div>
+            )}
+
             {/* Empty State (when not loading and no error) */}
             {!isLoading && !error && products.length === 0 && (
                 <div className="text-center py-10">
@@ -13,7 +13,9 @@ import toast from "react-hot-toast";
 
 const SellerDashboard: React.FC = () => {
     const [products, setProducts] = useState<Product[]>([]);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
     const [loading, setLoading] = useState<boolean>(true);
+    const [loadingMore, setLoadingMore] = useState<boolean>(false);
     const [error, setError] = useState<string | null>(null);
     const [isModalOpen, setIsModalOpen] = useState<boolean>(false);
     const [currentProduct, setCurrentProduct] = useState<Product | undefined>(
@@ -43,11 +45,13 @@ const SellerDashboard: React.FC = () => {
         fetchProducts();
     }, []);
 
+    // Load the first page of products
     const fetchProducts = async () => {
         try {
             setLoading(true);
-            const data = await getProducts();
-            setProducts(data);
+            const page = await getProducts();
+            setProducts(page.products);
+            setNextCursor(page.nextCursor);
             setError(null);
         } catch (err) {
             setError("Failed to fetch products");
@@ -57,6 +61,22 @@ const SellerDashboard: React.FC = () => {
         }
     };
 
+    // Append the next page of products
+    const handleLoadMore = async () => {
+        if (!nextCursor) return;
+        try {
+            setLoadingMore(true);
+            const page = await getProducts(nextCursor);
+            setProducts((prevProducts) => [...prevProducts, ...page.products]);
+            setNextCursor(page.nextCursor);
+        } catch (err) {
+            toast.error("Failed to load more products");
+            console.error("Error loading more products:", err);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const handleAddProduct = () => {
         setCurrentProduct(undefined);
         setIsModalOpen(true);
@@ -178,12 +198,24 @@ const SellerDashboard: React.FC = () => {
                     <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-indigo-500"></div>
                 </div>
             ) : products.length > 0 ? (
-                <ProductList
-                    products={products}
-                    onEdit={handleEditProduct}
-                    onDelete={handleDeleteProduct}
-                    onToggleStatus={handleToggleStatus}
-                />
+                <>
+                    <ProductList
+                        products={products}
+                        onEdit={handleEditProduct}
+                        onDelete={handleDeleteProduct}
+                        onToggleStatus={handleToggleStatus}
+                    />
+                    {nextCursor && (
+                        <div className="flex justify-center mt-6">
+                            <button
+                                onClick={handleLoadMore}
+                                disabled={loadingMore}
+                                className="px-4 py-2 bg-indigo-600 text-white rounded-md hover:bg-indigo-700 focus:outline-none disabled:opacity-50">
+                                {loadingMore ? "Loading..." : "Load more"}
+                            </button>
+                        </div>
+                    )}
+                </>
             ) : (
                 <div className="text-center py-12">
                     <p className="text-gray-500">
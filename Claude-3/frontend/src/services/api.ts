@@ -24,6 +24,94 @@ api.interceptors.request.use(
     (error) => Promise.reject(error)
 );
 
+// When the access token has expired, get a new one with the refresh token
+// and retry once. Concurrent failures share a single refresh request.
+let refreshRequest: Promise<string> | null = null;
+
+const refreshAccessToken = async (): Promise<string> => {
+    const refreshToken = localStorage.getItem("refreshToken");
+    if (!refreshToken) {
+        throw new Error("No refresh token");
+    }
+    const response = await axios.post<{ token: string }>(
+        `${API_URL}/auth/refresh`,
+        null,
+        { headers: { Authorization: `Bearer ${refreshToken}` } }
+    );
+    localStorage.setItem("token", response.data.token);
+    return response.data.token;
+};
+
+export const refreshAccessTokenOnce = (): Promise<string> => {
+    refreshRequest =
+        refreshRequest ??
+        refreshAccessToken().finally(() => {
+            refreshRequest = null;
+        });
+    return refreshRequest;
+};
+
+// A 401 from these means wrong credentials or a refresh token that is no
+// longer valid, so it goes straight back to the caller instead of
+// triggering another refresh
+const AUTH_PATHS = ["/auth/login", "/auth/register", "/auth/refresh"];
+
+const isAuthRequest = (url = ""): boolean =>
+    AUTH_PATHS.some((path) => url.split("?")[0].endsWith(path));
+
+// fetch() with the access token, refreshing it and retrying once on a 401,
+// for services that don't go through the axios instance
+export const authFetch = async (
+    url: string,
+    init: RequestInit & { headers?: Record<string, string> } = {}
+): Promise<Response> => {
+    const send = (token: string | null) =>
+        fetch(url, {
+            ...init,
+            headers: {
+                ...init.headers,
+                ...(token ? { Authorization: `Bearer ${token}` } : {}),
+            },
+        });
+
+    const response = await send(localStorage.getItem("token"));
+    if (
+        response.status !== 401 ||
+        isAuthRequest(url) ||
+        !localStorage.getItem("refreshToken")
+    ) {
+        return response;
+    }
+    try {
+        return await send(await refreshAccessTokenOnce());
+    } catch {
+        return response;
+    }
+};
+
+api.interceptors.response.use(
+    (response) => response,
+    async (error) => {
+        const original = error.config;
+        if (
+            error.response?.status !== 401 ||
+            !original ||
+            original._retried ||
+            isAuthRequest(original.url)
+        ) {
+            return Promise.reject(error);
+        }
+        original._retried = true;
+        try {
+            const token = await refreshAccessTokenOnce();
+            original.headers["Authorization"] = `Bearer ${token}`;
+            return api(original);
+        } catch {
+            return Promise.reject(error);
+        }
+    }
+);
+
 // Auth service
 export const authApi = {
     register: async (userData: RegisterFormData): Promise<AuthResponse> => {
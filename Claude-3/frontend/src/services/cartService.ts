@@ -1,5 +1,6 @@
 // src/services/cartService.ts
 import type { Product } from "../types/product";
+import { authFetch } from "./api";
 import { handleResponse } from "./productService";
 
 export interface CartItem {
@@ -22,11 +23,10 @@ const API_URL = "http://localhost:5000/api/cart";
 
 // Get cart items
 export const getCart = async (): Promise<CartResponse> => {
-    const response = await fetch(`${API_URL}`, {
+    const response = await authFetch(`${API_URL}`, {
         method: "GET",
         headers: {
             "Content-Type": "application/json",
-            Authorization: `Bearer ${localStorage.getItem("token")}`,
         },
     });
 
@@ -38,11 +38,10 @@ export const addToCart = async (
     productId: string,
     quantity: number
 ): Promise<{ message: string; cartItem: CartItem }> => {
-    const response = await fetch(`${API_URL}/add`, {
+    const response = await authFetch(`${API_URL}/add`, {
         method: "POST",
         headers: {
             "Content-Type": "application/json",
-            Authorization: `Bearer ${localStorage.getItem("token")}`,
         },
         body: JSON.stringify({ productId, quantity }),
     });
@@ -55,11 +54,10 @@ export const updateCartItem = async (
     productId: string,
     quantity: number
 ): Promise<{ message: string; cartItem: CartItem }> => {
-    const response = await fetch(`${API_URL}/update`, {
+    const response = await authFetch(`${API_URL}/update`, {
         method: "PUT",
         headers: {
             "Content-Type": "application/json",
-            Authorization: `Bearer ${localStorage.getItem("token")}`,
         },
         body: JSON.stringify({ productId, quantity }),
     });
@@ -71,11 +69,10 @@ export const updateCartItem = async (
 export const removeFromCart = async (
     productId: string
 ): Promise<{ message: string }> => {
-    const response = await fetch(`${API_URL}/remove?productId=${productId}`, {
+    const response = await authFetch(`${API_URL}/remove?productId=${productId}`, {
         method: "DELETE",
         headers: {
             "Content-Type": "application/json",
-            Authorization: `Bearer ${localStorage.getItem("token")}`,
         },
     });
 
@@ -84,11 +81,10 @@ export const removeFromCart = async (
 
 // Clear cart
 export const clearCart = async (): Promise<{ message: string }> => {
-    const response = await fetch(`${API_URL}/clear`, {
+    const response = await authFetch(`${API_URL}/clear`, {
         method: "DELETE",
         headers: {
             "Content-Type": "application/json",
-            Authorization: `Bearer ${localStorage.getItem("token")}`,
         },
     });
 
@@ -14,9 +14,22 @@ export const handleResponse = async (response: Response) => {
     return data;
 };
 
-// Get all products
-export const getProducts = async (): Promise<Product[]> => {
-    const response = await fetch(API_URL, {
+export interface ProductPage {
+    products: Product[];
+    nextCursor: string | null;
+}
+
+// Listings are served in keyset pages: fetch the page after `cursor`, or the
+// first page without one. Pass the returned nextCursor to load more.
+const fetchPage = async (
+    url: string,
+    cursor?: string | null
+): Promise<ProductPage> => {
+    const separator = url.includes("?") ? "&" : "?";
+    const pageUrl = cursor
+        ? `${url}${separator}cursor=${encodeURIComponent(cursor)}`
+        : url;
+    const response = await fetch(pageUrl, {
         method: "GET",
         headers: {
             "Content-Type": "application/json",
@@ -24,7 +37,14 @@ export const getProducts = async (): Promise<Product[]> => {
     });
 
     const data = await handleResponse(response);
-    return data.products;
+    return { products: data.products, nextCursor: data.nextCursor ?? null };
+};
+
+// Get a page of products
+export const getProducts = async (
+    cursor?: string | null
+): Promise<ProductPage> => {
+    return fetchPage(API_URL, cursor);
 };
 
 // Get a specific product
@@ -117,12 +137,15 @@ export const toggleProductStatus = async (
 
 export interface ProductResponse {
     products: Product[];
+    nextCursor: string | null;
     message: string;
     count: number;
 }
 
+// Get a page of search results
 export const searchProducts = async (
-    searchQuery?: string
+    searchQuery?: string,
+    cursor?: string | null
 ): Promise<ProductResponse> => {
     let url = `${API_URL}/search`;
 
@@ -131,12 +154,10 @@ export const searchProducts = async (
         url += `?search=${encodeURIComponent(searchQuery)}`;
     }
 
-    const response = await fetch(url, {
-        method: "GET",
-        headers: {
-            "Content-Type": "application/json",
-        },
-    });
-
-    return handleResponse(response);
+    const page = await fetchPage(url, cursor);
+    return {
+        ...page,
+        message: "Products retrieved successfully",
+        count: page.products.length,
+    };
 };
@@ -7,6 +7,7 @@ export interface User {
 export interface AuthResponse {
     message: string;
     token: string;
+    refreshToken: string;
     role: "Customer" | "Seller";
 }
 
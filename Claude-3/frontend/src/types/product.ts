@@ -3,6 +3,8 @@ export interface Product {
     ProductName: string;
     ProductDescription: string | null;
     ProductImages: string | null;
+    // Listing responses add a resized copy of ProductImages for cards
+    ProductThumbnail?: string | null;
     ProductPrice: number;
     ProductStock: number;
     ProductOwner: string;
@@ -0,0 +1,77 @@
+# api/auth.py
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import create_access_token, jwt_required
+from models import db
+from models.user import MsUser
+from utils.auth import current_principal, load_principal, needs_rehash
+
+auth_bp = Blueprint("auth", __name__)
+
+@auth_bp.route('/register', methods=['POST'])
+def register():
+    data = request.get_json()
+    email = data.get('email')
+    password = data.get('password')
+    role = data.get('role')
+    
+    if not email or not password or not role:
+        return jsonify({'error': 'Email, password, and role are required'}), 400
+    
+    if role not in ['Customer', 'Seller']:
+        return jsonify({'error': 'Invalid role'}), 400
+    
+    if MsUser.query.filter_by(email=email).first():
+        return jsonify({'error': 'Email already exists'}), 400
+    
+    user = MsUser(email=email, role=role)
+    user.set_password(password)
+    
+    db.session.add(user)
+    db.session.commit()
+    
+    return jsonify({
+        'message': 'User registered successfully',
+        'token': user.generate_token(),
+        'refresh_token': user.generate_refresh_token()
+    }), 201
+
+@auth_bp.route('/login', methods=['POST'])
+def login():
+    data = request.get_json()
+    email = data.get('email')
+    password = data.get('password')
+    
+    if not email or not password:
+        return jsonify({'error': 'Email and password are required'}), 400
+    
+    user = MsUser.query.filter_by(email=email).first()
+    
+    if not user or not user.check_password(password):
+        return jsonify({'error': 'Invalid email or password'}), 401
+    
+    # Upgrade hashes made with outdated cost parameters while the plain
+    # password is at hand
+    if needs_rehash(user.password):
+        user.set_password(password)
+        db.session.commit()
+    
+    return jsonify({
+        'message': 'Login successful',
+        'token': user.generate_token(),
+        'refresh_token': user.generate_refresh_token(),
+        'role': user.role
+    }), 200
+
+# Exchange a refresh token for a new access token, so clients do not have to
+# log in again every time the access token expires
+@auth_bp.route('/refresh', methods=['POST'])
+@jwt_required(refresh=True)
+def refresh():
+    principal = load_principal(current_principal().email)
+    if principal is None:
+        return jsonify({'error': 'User no longer exists'}), 401
+    
+    return jsonify({
+        'token': create_access_token(identity=principal.email, additional_claims={'role': principal.role}),
+        'role': principal.role
+    }), 200
\ No newline at end of file
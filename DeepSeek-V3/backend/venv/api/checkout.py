@@ -0,0 +1,97 @@
+from flask import Blueprint, current_app, request, jsonify
+from flask_jwt_extended import jwt_required
+from models.order import Order
+from models.cart import Cart
+from models.product import MsProduct
+from models import db
+from utils import order_stats
+from utils.cache import product_cache
+from utils.auth import current_principal
+import uuid
+from datetime import datetime
+
+checkout_bp = Blueprint('checkout', __name__)
+
+@checkout_bp.route('/checkout', methods=['POST'])
+@jwt_required()
+def checkout():
+    current_user = current_principal()
+    data = request.get_json()
+    
+    # Validate required fields
+    if not data or 'payment_method' not in data or 'shipping_address' not in data:
+        return jsonify({'error': 'Payment method and shipping address are required'}), 400
+    
+    try:
+        # Get user's cart items, locked so a second checkout of the same cart
+        # waits for this one and then finds the cart empty
+        cart_items = Cart.query.filter_by(customer=current_user.email)\
+            .order_by(Cart.product_id)\
+            .with_for_update()\
+            .all()
+        
+        if not cart_items:
+            return jsonify({'error': 'No items in cart to checkout'}), 400
+        
+        # Load and lock all cart products in one query. Locking in a stable
+        # order keeps concurrent checkouts from deadlocking or overselling.
+        products = MsProduct.query.filter(
+            MsProduct.product_id.in_([item.product_id for item in cart_items])
+        ).order_by(MsProduct.product_id).with_for_update().all()
+        products_by_id = {product.product_id: product for product in products}
+        
+        # Check product availability
+        for item in cart_items:
+            product = products_by_id.get(item.product_id)
+            
+            if not product:
+                db.session.rollback()
+                return jsonify({'error': f'Product {item.product_id} not found'}), 404
+            
+            if product.product_stock < item.quantity:
+                db.session.rollback()
+                return jsonify({
+                    'error': f'Not enough stock for {product.product_name}. Available: {product.product_stock}'
+                }), 400
+        
+        # Create orders; the flush inserts them in one batched statement
+        orders = [
+            Order(
+                order_id=str(uuid.uuid4()),
+                product=products_by_id[item.product_id],
+                quantity=item.quantity,
+                unit_price=products_by_id[item.product_id].product_price,
+                customer=current_user.email,
+                payment_method=data['payment_method'],
+                shipping_address=data['shipping_address'],
+                status='Pending'
+            )
+            for item in cart_items
+        ]
+        db.session.add_all(orders)
+        
+        # Update product stock
+        for item in cart_items:
+            products_by_id[item.product_id].product_stock -= item.quantity
+        
+        # Remove items from cart
+        Cart.query.filter_by(customer=current_user.email).delete(synchronize_session=False)
+        
+        # Serialize before commit so the response doesn't reload every order
+        db.session.flush()
+        result = [order.to_dict() for order in orders]
+        
+        # Count the orders in the sellers' summary rows
+        order_stats.record_orders(orders)
+        db.session.commit()
+        product_cache.invalidate(*products_by_id)
+        
+        return jsonify({
+            'message': 'Order placed successfully',
+            'orders': result
+        }), 201
+        
+    except Exception:
+        current_app.logger.exception('Error during checkout')
+        db.session.rollback()
+        return jsonify({'error': 'Checkout failed'}), 500
\ No newline at end of file
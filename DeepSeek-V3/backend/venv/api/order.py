@@ -0,0 +1,112 @@
+from flask import Blueprint, current_app, request, jsonify
+from flask_jwt_extended import jwt_required
+from models.order import Order, OrderStatus
+from models.product import MsProduct
+from models import db
+from utils import order_stats
+from utils.auth import current_principal
+from sqlalchemy.orm import contains_eager, joinedload
+
+order_bp = Blueprint('order', __name__)
+
+@order_bp.route('/orders', methods=['GET'])
+@jwt_required()
+def get_orders():
+    current_user = current_principal()
+    
+    try:
+        if current_user.role == 'Seller':
+            # Get all orders for seller's products
+            orders = Order.query.join(MsProduct).options(
+                contains_eager(Order.product)
+            ).filter(
+                MsProduct.product_owner == current_user.email
+            ).order_by(Order.timestamp.desc()).all()
+        else:
+            # Get all orders for customer
+            orders = Order.query.options(
+                joinedload(Order.product)
+            ).filter_by(
+                customer=current_user.email
+            ).order_by(Order.timestamp.desc()).all()
+            
+        return jsonify([order.to_dict() for order in orders])
+        
+    except Exception:
+        current_app.logger.exception('Error fetching orders')
+        return jsonify({'error': 'Failed to fetch orders'}), 500
+
+# Dashboard aggregates for the current seller, read from the precomputed
+# summary rows
+@order_bp.route('/orders/analytics', methods=['GET'])
+@jwt_required()
+def get_order_analytics():
+    current_user = current_principal()
+    if current_user.role != 'Seller':
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    try:
+        days = int(request.args.get('days', order_stats.DEFAULT_WINDOW_DAYS))
+    except ValueError:
+        return jsonify({'error': 'days must be an integer'}), 400
+    days = max(1, min(days, order_stats.MAX_WINDOW_DAYS))
+    
+    try:
+        return jsonify(order_stats.seller_analytics(current_user.email, days))
+    except Exception:
+        current_app.logger.exception('Error computing seller analytics')
+        return jsonify({'error': 'Failed to load analytics'}), 500
+
+@order_bp.route('/orders/<order_id>/status', methods=['PUT'])
+@jwt_required()
+def update_order_status(order_id):
+    current_user = current_principal()
+    data = request.get_json()
+    
+    if not data or 'status' not in data:
+        return jsonify({'error': 'Status is required'}), 400
+    
+    try:
+        # Lock the order so concurrent updates can't both move it between summary rows
+        order = Order.query.filter_by(order_id=order_id).with_for_update().first()
+        if not order:
+            return jsonify({'error': 'Order not found'}), 404
+        
+        # Verify permissions
+        if current_user.role == 'Seller':
+            # Seller can only update their own product orders
+            product = MsProduct.query.get(order.product_id)
+            if product.product_owner != current_user.email:
+                return jsonify({'error': 'Unauthorized'}), 403
+            
+            # Seller can only change to Accepted or Shipped
+            if data['status'] not in [OrderStatus.ACCEPTED.value, OrderStatus.SHIPPED.value]:
+                return jsonify({'error': 'Invalid status transition'}), 400
+            
+            # Validate status flow
+            if (order.status == OrderStatus.PENDING.value and data['status'] != OrderStatus.ACCEPTED.value) or \
+               (order.status == OrderStatus.ACCEPTED.value and data['status'] != OrderStatus.SHIPPED.value):
+                return jsonify({'error': 'Invalid status transition'}), 400
+                
+        elif current_user.role == 'Customer':
+            # Customer can only mark Shipped orders as Completed
+            if data['status'] != OrderStatus.COMPLETED.value or order.status != OrderStatus.SHIPPED.value:
+                return jsonify({'error': 'Invalid status transition'}), 400
+                
+            # Customer can only update their own orders
+            if order.customer != current_user.email:
+                return jsonify({'error': 'Unauthorized'}), 403
+        else:
+            return jsonify({'error': 'Unauthorized'}), 403
+        
+        old_status = order.status
+        order.status = data['status']
+        order_stats.move_order(order, old_status)
+        db.session.commit()
+        
+        return jsonify(order.to_dict())
+        
+    except Exception:
+        current_app.logger.exception('Error updating order status')
+        db.session.rollback()
+        return jsonify({'error': 'Failed to update order status'}), 500
\ No newline at end of file
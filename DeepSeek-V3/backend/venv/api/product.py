@@ -0,0 +1,180 @@
+from flask import Blueprint, current_app, request, jsonify
+from models.product import MsProduct
+from models import db
+from utils.pagination import get_page_args, ndjson_response, paginate, stream_ndjson, wants_stream
+from utils.search import get_search_engine, tokenize
+from utils.cache import product_cache
+from utils.auth import current_principal
+from flask_jwt_extended import jwt_required
+
+product_bp = Blueprint('product', __name__)
+
+@product_bp.route('/product', methods=['GET'])
+@jwt_required()
+def get_products():
+    current_user = current_principal()
+    limit, cursor = get_page_args()
+    query = MsProduct.query.filter_by(product_owner=current_user.email)
+    
+    try:
+        if wants_stream():
+            return stream_ndjson(query, [MsProduct.product_id], MsProduct.to_dict, cursor)
+        products, next_cursor = paginate(
+            query, [MsProduct.product_id], lambda p: [p.product_id], cursor, limit
+        )
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+    
+    # Keep the bare list body; the next page cursor goes in a header
+    response = jsonify([product.to_dict() for product in products])
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
+
+@product_bp.route('/product/<product_id>', methods=['GET'])
+def get_product(product_id):
+    try:
+        def load_product():
+            product = MsProduct.query.filter_by(product_id=product_id).first()
+            return product.to_dict() if product else None
+        
+        product, etag = product_cache.get_or_load(product_id, load_product)
+        if product is None:
+            return jsonify({'error': 'Product not found'}), 404
+        
+        # 304 Not Modified when the client's If-None-Match still matches
+        response = jsonify(product)
+        response.set_etag(etag)
+        return response.make_conditional(request)
+        
+    except Exception:
+        current_app.logger.exception('Error fetching product')
+        return jsonify({
+            'error': 'Failed to fetch product'
+        }), 500
+
+@product_bp.route('/product/cache/stats', methods=['GET'])
+def get_product_cache_stats():
+    return jsonify(product_cache.stats())
+
+@product_bp.route('/product', methods=['POST'])
+@jwt_required()
+def create_product():
+    current_user = current_principal()
+    data = request.get_json()
+    
+    required_fields = ['product_name', 'product_price', 'product_stock']
+    if not all(field in data for field in required_fields):
+        return jsonify({'error': 'Missing required fields'}), 400
+    
+    try:
+        product = MsProduct(
+            product_name=data['product_name'],
+            product_description=data.get('product_description', ''),
+            product_images=data.get('product_images', []),
+            product_price=data['product_price'],
+            product_stock=data['product_stock'],
+            product_owner=current_user.email
+        )
+        db.session.add(product)
+        db.session.commit()
+        return jsonify({
+            'message': 'Product created successfully',
+            'product': product.to_dict()
+        }), 201
+    except Exception:
+        current_app.logger.exception('Error creating product')
+        db.session.rollback()
+        return jsonify({'error': 'Failed to create product'}), 500
+
+@product_bp.route('/product/<product_id>', methods=['PUT'])
+@jwt_required()
+def update_product(product_id):
+    current_user = current_principal()
+    product = MsProduct.query.filter_by(product_id=product_id, product_owner=current_user.email).first()
+    
+    if not product:
+        return jsonify({'error': 'Product not found'}), 404
+    
+    data = request.get_json()
+    try:
+        product.product_name = data.get('product_name', product.product_name)
+        product.product_description = data.get('product_description', product.product_description)
+        product.product_images = data.get('product_images', product.product_images)
+        product.product_price = data.get('product_price', product.product_price)
+        product.product_stock = data.get('product_stock', product.product_stock)
+        
+        db.session.commit()
+        product_cache.invalidate(product_id)
+        return jsonify(product.to_dict())
+    except Exception:
+        current_app.logger.exception('Error updating product')
+        db.session.rollback()
+        return jsonify({'error': 'Failed to update product'}), 400
+
+@product_bp.route('/product/<product_id>', methods=['DELETE'])
+@jwt_required()
+def delete_product(product_id):
+    current_user = current_principal()
+    product = MsProduct.query.filter_by(product_id=product_id, product_owner=current_user.email).first()
+    
+    if not product:
+        return jsonify({'error': 'Product not found'}), 404
+    
+    try:
+        db.session.delete(product)
+        db.session.commit()
+        product_cache.invalidate(product_id)
+        return jsonify({'message': 'Product deleted successfully'})
+    except Exception:
+        current_app.logger.exception('Error deleting product')
+        db.session.rollback()
+        return jsonify({'error': 'Failed to delete product'}), 400
+    
+@product_bp.route('/product/search', methods=['GET'])
+def search_products():
+    search_query = request.args.get('q', '').strip()
+    min_stock = request.args.get('min_stock', 1, type=int)
+    
+    try:
+        # Base query for available products
+        query = MsProduct.query.filter(
+            MsProduct.product_stock >= min_stock
+        )
+        
+        limit, cursor = get_page_args()
+        
+        # Rank matches through the search engine when there is a search term
+        if tokenize(search_query):
+            engine = get_search_engine()
+            if wants_stream():
+                return ndjson_response(
+                    engine.iter_search(query, search_query, cursor), MsProduct.to_dict
+                )
+            products, next_cursor = engine.search(query, search_query, cursor, limit)
+        else:
+            if wants_stream():
+                return stream_ndjson(query, [MsProduct.product_id], MsProduct.to_dict, cursor)
+            products, next_cursor = paginate(
+                query, [MsProduct.product_id], lambda p: [p.product_id], cursor, limit
+            )
+        
+        if not products:
+            return jsonify({
+                'message': 'No products found matching your search',
+                'products': [],
+                'next_cursor': None
+            }), 200
+        
+        return jsonify({
+            'products': [product.to_dict() for product in products],
+            'next_cursor': next_cursor
+        })
+        
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+    except Exception:
+        current_app.logger.exception('Error searching products')
+        return jsonify({
+            'error': 'Failed to search products'
+        }), 500
\ No newline at end of file
@@ -0,0 +1,63 @@
+# gunicorn.conf.py
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+
+# Worker processes, each running a pool of threads
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+
+# Recycle workers now and then to bound memory growth
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Load the app once in the master so workers fork with it already imported
+preload_app = os.getenv('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+# Workers keep their own metrics; with more than one they share snapshots
+# through this directory so every /metrics scrape covers the whole server.
+# It is read by the app's config, so it must be set before the app loads.
+_metrics_dir_created = False
+if workers > 1 and not os.getenv('METRICS_MULTIPROC_DIR'):
+    os.environ['METRICS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='metrics-')
+    _metrics_dir_created = True
+
+def on_starting(server):
+    # Counts of a previous run in a reused directory would be added again
+    metrics_dir = os.getenv('METRICS_MULTIPROC_DIR')
+    if metrics_dir and os.path.isdir(metrics_dir):
+        from utils.metrics import clear_snapshots
+        clear_snapshots(metrics_dir)
+
+def on_exit(server):
+    if _metrics_dir_created:
+        shutil.rmtree(os.environ['METRICS_MULTIPROC_DIR'], ignore_errors=True)
+
+def post_fork(server, worker):
+    # Connections must not be shared across processes; drop anything the
+    # master opened so each worker creates its own pool on first use
+    from models import db
+    from wsgi import app as application
+    with application.app_context():
+        db.engine.dispose(close=False)
+
+def worker_exit(server, worker):
+    # Write the final counts so the master can archive them
+    from wsgi import app as application
+    metrics = application.extensions.get('metrics')
+    if metrics is not None:
+        with application.app_context():
+            metrics.flush()
+
+def child_exit(server, worker):
+    metrics_dir = os.getenv('METRICS_MULTIPROC_DIR')
+    if metrics_dir:
+        from utils.metrics import mark_process_dead
+        mark_process_dead(metrics_dir, worker.pid)
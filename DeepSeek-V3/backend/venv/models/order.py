@@ -0,0 +1,42 @@
+from models import db
+import uuid
+from datetime import datetime
+from enum import Enum
+
+class OrderStatus(Enum):
+    PENDING = 'Pending'
+    ACCEPTED = 'Accepted'
+    SHIPPED = 'Shipped'
+    COMPLETED = 'Completed'
+
+class Order(db.Model):
+    __tablename__ = 'Orders'
+    __table_args__ = (
+        # Serves per-product lookups filtered by status and time range
+        db.Index('ix_Orders_product_status_time', 'product_id', 'status', 'timestamp'),
+    )
+    
+    order_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    product_id = db.Column(db.String(36), db.ForeignKey('MsProduct.product_id'), nullable=False)
+    quantity = db.Column(db.Integer, nullable=False)
+    unit_price = db.Column(db.Numeric(10, 2), nullable=False)  # Price paid, kept when the product price changes
+    customer = db.Column(db.String(255), db.ForeignKey('MsUser.email'), nullable=False)
+    status = db.Column(db.String(15), default='Pending')
+    timestamp = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    payment_method = db.Column(db.String(50), nullable=False)
+    shipping_address = db.Column(db.Text, nullable=False)
+    
+    product = db.relationship('MsProduct', backref='Orders')
+    
+    def to_dict(self):
+        return {
+            'order_id': self.order_id,
+            'product_id': self.product_id,
+            'quantity': self.quantity,
+            'customer': self.customer,
+            'status': self.status,
+            'timestamp': self.timestamp.isoformat(),
+            'payment_method': self.payment_method,
+            'shipping_address': self.shipping_address,
+            'product': self.product.to_dict() if self.product else None
+        }
\ No newline at end of file
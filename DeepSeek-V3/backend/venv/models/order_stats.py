@@ -0,0 +1,16 @@
+from models import db
+
+# Daily order totals per product and status, maintained by utils/order_stats.py
+class OrderDailyStats(db.Model):
+    __tablename__ = 'OrderDailyStats'
+    __table_args__ = (
+        db.Index('ix_OrderDailyStats_seller_day', 'seller', 'day'),
+    )
+    
+    product_id = db.Column(db.String(36), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)
+    status = db.Column(db.String(15), primary_key=True)
+    seller = db.Column(db.String(100), nullable=False)
+    order_count = db.Column(db.Integer, nullable=False, default=0)
+    units = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Numeric(14, 2), nullable=False, default=0)
@@ -0,0 +1,30 @@
+from flask import current_app
+from models import db
+from werkzeug.security import generate_password_hash, check_password_hash
+
+class MsUser(db.Model):
+    __tablename__ = 'MsUser'
+    
+    email = db.Column(db.String(100), primary_key=True)
+    password = db.Column(db.String(255), nullable=False)
+    role = db.Column(db.String(15), nullable=False)
+    
+    def set_password(self, password):
+        method = current_app.config.get('PASSWORD_HASH_METHOD')
+        if method:
+            self.password = generate_password_hash(password, method=method)
+        else:
+            self.password = generate_password_hash(password)
+    
+    def check_password(self, password):
+        return check_password_hash(self.password, password)
+    
+    # The email is the subject and the role travels as a claim, so protected
+    # routes can authorize without loading the user
+    def generate_token(self):
+        from flask_jwt_extended import create_access_token
+        return create_access_token(identity=self.email, additional_claims={'role': self.role})
+    
+    def generate_refresh_token(self):
+        from flask_jwt_extended import create_refresh_token
+        return create_refresh_token(identity=self.email, additional_claims={'role': self.role})
\ No newline at end of file
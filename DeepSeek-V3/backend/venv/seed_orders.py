@@ -0,0 +1,171 @@
+# Seed a large synthetic order history and compare the seller analytics read
+# from OrderDailyStats with the same aggregates computed from Orders:
+#
+#   python seed_orders.py --orders 2000000
+#   python seed_orders.py --bench-only --repeat 20
+#
+# Seeded users are seed-seller-<n>@example.com and seed-customer-<n>@example.com
+# with the password 'password'.
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from werkzeug.security import generate_password_hash
+from app import create_app
+from models import db
+from models.order import Order
+from models.order_stats import OrderDailyStats
+from models.product import MsProduct
+from models.user import MsUser
+from utils import order_stats
+
+STATUSES = ['Pending', 'Accepted', 'Shipped', 'Completed']
+STATUS_WEIGHTS = [10, 10, 20, 60]
+
+def seller_email(n):
+    return f'seed-seller-{n}@example.com'
+
+def customer_email(n):
+    return f'seed-customer-{n}@example.com'
+
+# Create missing seed users and products, returning (product_id, price) pairs
+def seed_catalog(sellers, products_per_seller, customers):
+    password = generate_password_hash('password')
+    emails = [(seller_email(n), 'Seller') for n in range(sellers)] + \
+        [(customer_email(n), 'Customer') for n in range(customers)]
+    existing = {email for (email,) in db.session.query(MsUser.email).filter(
+        MsUser.email.in_([email for email, _ in emails])
+    )}
+    users = [
+        {'email': email, 'password': password, 'role': role}
+        for email, role in emails if email not in existing
+    ]
+    if users:
+        db.session.execute(db.insert(MsUser), users)
+
+    products = []
+    for n in range(sellers):
+        owner = seller_email(n)
+        count = MsProduct.query.filter_by(product_owner=owner).count()
+        products += [
+            {
+                'product_id': str(uuid.uuid4()),
+                'product_name': f'Seed product {n}-{i}',
+                'product_images': [],
+                'product_price': Decimal(random.randint(100, 50000)) / 100,
+                'product_stock': 1000000,
+                'product_owner': owner
+            }
+            for i in range(count, products_per_seller)
+        ]
+    if products:
+        db.session.execute(db.insert(MsProduct), products)
+    db.session.commit()
+
+    return db.session.query(MsProduct.product_id, MsProduct.product_price)\
+        .filter(MsProduct.product_owner.in_([seller_email(n) for n in range(sellers)]))\
+        .all()
+
+def seed_orders(total, products, customers, days, batch_size):
+    now = datetime.utcnow()
+    started = time.perf_counter()
+    for offset in range(0, total, batch_size):
+        batch = []
+        for _ in range(min(batch_size, total - offset)):
+            product_id, price = random.choice(products)
+            batch.append({
+                'order_id': str(uuid.uuid4()),
+                'product_id': product_id,
+                'quantity': random.randint(1, 5),
+                'unit_price': price,
+                'customer': customer_email(random.randrange(customers)),
+                'status': random.choices(STATUSES, STATUS_WEIGHTS)[0],
+                'timestamp': now - timedelta(seconds=random.randrange(days * 86400)),
+                'payment_method': 'Seed',
+                'shipping_address': 'Seed address'
+            })
+        db.session.execute(db.insert(Order), batch)
+        db.session.commit()
+        done = offset + len(batch)
+        print(f'{done} orders, {done / (time.perf_counter() - started):.0f}/s', end='\r')
+    print()
+
+# The same result as order_stats.seller_analytics, aggregated from Orders
+def naive_analytics(email, days):
+    since = datetime.combine(datetime.utcnow().date() - timedelta(days=days - 1), datetime.min.time())
+    # date() rather than CAST, which SQLite turns into just the year
+    day = db.func.date(Order.timestamp, type_=db.Date)
+    sums = (db.func.count(), db.func.sum(Order.quantity), db.func.sum(Order.quantity * Order.unit_price))
+
+    def seller_orders(*columns):
+        return db.session.query(*columns)\
+            .join(MsProduct, Order.product_id == MsProduct.product_id)\
+            .filter(MsProduct.product_owner == email)
+
+    return {
+        'status_counts': dict(seller_orders(Order.status, db.func.count()).group_by(Order.status).all()),
+        'products': seller_orders(Order.product_id, MsProduct.product_name, *sums)
+            .filter(Order.timestamp >= since)
+            .group_by(Order.product_id, MsProduct.product_name)
+            .all(),
+        'daily': seller_orders(day, *sums)
+            .filter(Order.timestamp >= since)
+            .group_by(day)
+            .all()
+    }
+
+def time_ms(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+        db.session.rollback()
+    return statistics.median(timings), max(timings)
+
+def bench(email, days, repeat):
+    orders = Order.query.join(MsProduct, Order.product_id == MsProduct.product_id)\
+        .filter(MsProduct.product_owner == email).count()
+    summary_rows = OrderDailyStats.query.filter_by(seller=email).count()
+    print(f'seller {email}: {orders} orders, {summary_rows} summary rows, {days} day window')
+
+    fast = order_stats.seller_analytics(email, days)['status_counts']
+    slow = naive_analytics(email, days)['status_counts']
+    if fast != slow:
+        print(f'WARNING: summary rows are out of date: {fast} != {slow}')
+
+    for label, fn in (
+        ('summary rows', lambda: order_stats.seller_analytics(email, days)),
+        ('naive aggregate', lambda: naive_analytics(email, days))
+    ):
+        median, worst = time_ms(fn, repeat)
+        print(f'{label:<16} median {median:9.2f} ms   max {worst:9.2f} ms')
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed orders and benchmark seller analytics')
+    parser.add_argument('--orders', type=int, default=1000000)
+    parser.add_argument('--sellers', type=int, default=20)
+    parser.add_argument('--products-per-seller', type=int, default=50)
+    parser.add_argument('--customers', type=int, default=1000)
+    parser.add_argument('--days', type=int, default=365, help='spread orders over this many days')
+    parser.add_argument('--batch', type=int, default=10000)
+    parser.add_argument('--window', type=int, default=order_stats.DEFAULT_WINDOW_DAYS)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--bench-only', action='store_true')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        if not args.bench_only:
+            products = seed_catalog(args.sellers, args.products_per_seller, args.customers)
+            seed_orders(args.orders, products, args.customers, args.days, args.batch)
+            print('Rebuilding summary rows...')
+            order_stats.rebuild()
+            db.session.commit()
+        bench(seller_email(0), args.window, args.repeat)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,15 @@
+-- Indexes for product search (utils/search.py).
+--
+-- The tsvector expression must stay identical to the one built in
+-- PostgresSearchEngine, otherwise the planner will not use the index.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_msproduct_search_vector
+    ON "MsProduct"
+    USING GIN (to_tsvector('simple', coalesce(product_name, '') || ' ' || coalesce(product_description, '')));
+
+-- Typo-tolerant matching on the product name with the % operator
+CREATE INDEX IF NOT EXISTS ix_msproduct_name_trgm
+    ON "MsProduct"
+    USING GIN (product_name gin_trgm_ops);
@@ -0,0 +1,88 @@
+# tests/test_checkout_concurrency.py
+import os
+import threading
+import uuid
+from decimal import Decimal
+import pytest
+from flask_jwt_extended import create_access_token
+from models import db
+from models.cart import Cart
+from models.order import Order
+from models.product import MsProduct
+from models.user import MsUser
+
+# SQLite ignores FOR UPDATE and serializes writers, so only Postgres
+# exercises the row locks
+pytestmark = pytest.mark.skipif(
+    not os.getenv('TEST_DATABASE_URL', '').startswith('postgresql'),
+    reason='set TEST_DATABASE_URL to a Postgres database'
+)
+
+SELLER = 'seller@example.com'
+
+def customer(n):
+    return f'customer-{n}@example.com'
+
+# Seed `customers` customers whose carts hold one of each product, returning
+# the product ids
+def seed_carts(customers, products, stock):
+    db.session.execute(db.insert(MsUser), [{'email': SELLER, 'password': 'x', 'role': 'Seller'}] + [
+        {'email': customer(n), 'password': 'x', 'role': 'Customer'} for n in range(customers)
+    ])
+    product_ids = [str(uuid.uuid4()) for _ in range(products)]
+    db.session.execute(db.insert(MsProduct), [
+        {'product_id': product_id, 'product_name': f'Product {n}', 'product_price': Decimal('9.99'),
+         'product_stock': stock, 'product_owner': SELLER}
+        for n, product_id in enumerate(product_ids)
+    ])
+    db.session.execute(db.insert(Cart), [
+        {'product_id': product_id, 'customer': customer(n), 'quantity': 1}
+        for n in range(customers) for product_id in reversed(product_ids)
+    ])
+    db.session.commit()
+    return product_ids
+
+# Run checkout for every email at the same time, returning the status codes
+def checkout_concurrently(app, emails):
+    barrier = threading.Barrier(len(emails))
+    statuses = [None] * len(emails)
+
+    tokens = [create_access_token(identity=email, additional_claims={'role': 'Customer'}) for email in emails]
+    
+    def checkout(i, token):
+        client = app.test_client()
+        barrier.wait()
+        statuses[i] = client.post('/checkout', headers={'Authorization': f'Bearer {token}'}, json={
+            'shipping_address': '1 Test Street', 'payment_method': 'Card'
+        }).status_code
+
+    threads = [threading.Thread(target=checkout, args=(i, token)) for i, token in enumerate(tokens)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return statuses
+
+def test_concurrent_checkouts_do_not_oversell(app):
+    stock, customers = 5, 12
+    product_ids = seed_carts(customers, products=2, stock=stock)
+
+    statuses = checkout_concurrently(app, [customer(n) for n in range(customers)])
+
+    assert statuses.count(201) == stock
+    assert statuses.count(400) == customers - stock
+    db.session.expire_all()
+    for product_id in product_ids:
+        assert db.session.get(MsProduct, product_id).product_stock == 0
+        assert Order.query.filter_by(product_id=product_id).count() == stock
+
+def test_repeated_checkout_orders_the_cart_once(app):
+    product_ids = seed_carts(1, products=2, stock=100)
+
+    statuses = checkout_concurrently(app, [customer(0)] * 6)
+
+    assert statuses.count(201) == 1
+    db.session.expire_all()
+    assert Order.query.filter_by(customer=customer(0)).count() == len(product_ids)
+    for product_id in product_ids:
+        assert db.session.get(MsProduct, product_id).product_stock == 99
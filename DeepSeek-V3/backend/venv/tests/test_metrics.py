@@ -0,0 +1,79 @@
+# tests/test_metrics.py
+import os
+from decimal import Decimal
+from app import create_app
+from models import db
+from models.product import MsProduct
+from models.user import MsUser
+from utils.metrics import ARCHIVE_FILE, mark_process_dead
+from config import Config
+
+SELLER = 'seller@example.com'
+
+# Requests to /metrics counted in the exposition `body`
+def metrics_requests(body):
+    prefix = 'http_request_duration_seconds_count{endpoint="metrics"'
+    return sum(int(line.rsplit(' ', 1)[1]) for line in body.splitlines() if line.startswith(prefix))
+
+def test_metrics_add_up_across_worker_processes(tmp_path):
+    config = type('MultiprocessConfig', (Config,), {'METRICS_MULTIPROC_DIR': str(tmp_path)})
+    app = create_app(config)
+    metrics = app.extensions['metrics']
+    client = app.test_client()
+    client.get('/metrics')
+
+    pid = os.fork()
+    if pid == 0:
+        # A worker: starts from zero, serves three requests and exits
+        status = 1
+        try:
+            for _ in range(3):
+                client.get('/metrics')
+            with app.app_context():
+                metrics.flush()
+            status = 0
+        finally:
+            os._exit(status)
+    _, status = os.waitpid(pid, 0)
+    assert status == 0
+
+    # The scrape itself is observed after rendering
+    assert metrics_requests(client.get('/metrics').get_data(as_text=True)) == 1 + 3
+
+    # Archiving the exited worker keeps its counts and removes its file
+    mark_process_dead(str(tmp_path), pid)
+    assert not [name for name in os.listdir(tmp_path) if name.startswith(f'metrics-{pid}-')]
+    assert ARCHIVE_FILE in os.listdir(tmp_path)
+    assert metrics_requests(client.get('/metrics').get_data(as_text=True)) == 2 + 3
+
+# (requests, queries) observed so far for `endpoint`
+def observed_queries(metrics, endpoint):
+    observed = {tuple(labels): series for labels, series in metrics.request_queries.snapshot()}
+    series = observed.get((endpoint,), {'count': 0, 'sum': 0})
+    return series['count'], series['sum']
+
+def test_streamed_response_is_observed_when_closed(app, client):
+    db.session.add(MsUser(email=SELLER, password='password', role='Seller'))
+    db.session.add_all([
+        MsProduct(product_name=f'Lamp {n}', product_price=Decimal('9.99'), product_stock=5,
+                  product_owner=SELLER)
+        for n in range(3)
+    ])
+    db.session.commit()
+    metrics = app.extensions['metrics']
+    headers = {'Authorization': f'Bearer {db.session.get(MsUser, SELLER).generate_token()}'}
+
+    page = client.get('/product', headers=headers)
+    assert int(page.headers['X-Query-Count']) > 0
+
+    before = observed_queries(metrics, 'product.get_products')
+    response = client.get('/product?format=ndjson', headers=headers, buffered=False)
+    assert 'X-Query-Count' not in response.headers
+    assert observed_queries(metrics, 'product.get_products') == before
+
+    # The rows are queried while the body streams, and counted on close
+    assert len(response.get_data().splitlines()) == 3
+    response.close()
+    requests, queries = observed_queries(metrics, 'product.get_products')
+    assert requests == before[0] + 1
+    assert queries > before[1]
@@ -0,0 +1,120 @@
+# tests/test_order_stats.py
+from decimal import Decimal
+import pytest
+from flask import g
+from models import db
+from models.cart import Cart
+from models.order import Order
+from models.product import MsProduct
+from models.user import MsUser
+from seed_orders import naive_analytics
+from utils import order_stats
+
+SELLER = 'seller@example.com'
+OTHER_SELLER = 'other@example.com'
+CUSTOMER = 'customer@example.com'
+DAYS = order_stats.DEFAULT_WINDOW_DAYS
+
+@pytest.fixture
+def products(app):
+    db.session.add_all([
+        MsUser(email=SELLER, password='password', role='Seller'),
+        MsUser(email=OTHER_SELLER, password='password', role='Seller'),
+        MsUser(email=CUSTOMER, password='password', role='Customer'),
+    ])
+    products = [
+        MsProduct(product_name=name, product_price=Decimal(price), product_stock=50, product_owner=owner)
+        for name, price, owner in [
+            ('Lamp', '9.99', SELLER), ('Desk', '120.00', SELLER), ('Chair', '45.50', OTHER_SELLER)
+        ]
+    ]
+    db.session.add_all(products)
+    db.session.commit()
+    return products
+
+# Requests share the test's app context, and with it the principal that
+# current_principal caches on g, so drop it before acting as another user
+def auth(email):
+    g.pop('principal', None)
+    return {'Authorization': f'Bearer {db.session.get(MsUser, email).generate_token()}'}
+
+def checkout(client, quantities):
+    db.session.add_all([
+        Cart(product_id=product.product_id, customer=CUSTOMER, quantity=quantity)
+        for product, quantity in quantities
+    ])
+    db.session.commit()
+    response = client.post('/checkout', headers=auth(CUSTOMER), json={
+        'payment_method': 'Card', 'shipping_address': '1 Test Street'
+    })
+    assert response.status_code == 201, response.json
+    return {order['product_id']: order['order_id'] for order in response.json['orders']}
+
+def set_status(client, order_id, status, user_email):
+    return client.put(f'/orders/{order_id}/status', headers=auth(user_email), json={'status': status})
+
+def analytics(client):
+    response = client.get(f'/orders/analytics?days={DAYS}', headers=auth(SELLER))
+    assert response.status_code == 200
+    return response.json
+
+# The naive aggregate over Orders, shaped like seller_analytics
+def expected_analytics():
+    naive = naive_analytics(SELLER, DAYS)
+    return {
+        'status_counts': naive['status_counts'],
+        'products': {
+            product_id: (name, count, units, float(revenue))
+            for product_id, name, count, units, revenue in naive['products']
+        },
+        'daily': {day.isoformat(): (count, units, float(revenue)) for day, count, units, revenue in naive['daily']}
+    }
+
+def actual_analytics(result):
+    return {
+        'status_counts': result['status_counts'],
+        'products': {
+            p['product_id']: (p['product_name'], p['orders'], p['units'], p['revenue']) for p in result['products']
+        },
+        'daily': {d['date']: (d['orders'], d['units'], d['revenue']) for d in result['daily']}
+    }
+
+def test_summary_rows_match_the_naive_aggregate(client, products):
+    lamp, desk, chair = products
+    orders = checkout(client, [(lamp, 2), (desk, 1), (chair, 4)])
+    checkout(client, [(lamp, 3)])
+
+    # The customer can't complete an order that hasn't shipped
+    assert set_status(client, orders[lamp.product_id], 'Completed', CUSTOMER).status_code == 400
+    for status, user in [('Accepted', SELLER), ('Shipped', SELLER), ('Completed', CUSTOMER)]:
+        assert set_status(client, orders[lamp.product_id], status, user).status_code == 200
+    assert set_status(client, orders[desk.product_id], 'Accepted', SELLER).status_code == 200
+
+    result = analytics(client)
+    assert actual_analytics(result) == expected_analytics()
+    assert result['status_counts'] == {'Pending': 1, 'Accepted': 1, 'Completed': 1}
+    assert result['totals'] == {'orders': 3, 'units': 6, 'revenue': pytest.approx(5 * 9.99 + 120)}
+
+    # Rebuilding from Orders gives the same rows the deltas produced
+    order_stats.rebuild()
+    db.session.commit()
+    assert analytics(client) == result
+
+def test_summary_rows_follow_every_status(client, products):
+    lamp = products[0]
+    order_id = checkout(client, [(lamp, 1)])[lamp.product_id]
+    for status, user in [('Accepted', SELLER), ('Shipped', SELLER), ('Completed', CUSTOMER)]:
+        assert set_status(client, order_id, status, user).status_code == 200
+        assert analytics(client)['status_counts'] == {status: 1}
+        assert actual_analytics(analytics(client)) == expected_analytics()
+    assert db.session.get(Order, order_id).status == 'Completed'
+
+def test_failure_is_logged_not_returned(client, products, monkeypatch, caplog):
+    def fail(*args):
+        raise RuntimeError('connection to db-internal:5432 refused')
+    monkeypatch.setattr(order_stats, 'seller_analytics', fail)
+
+    response = client.get('/orders/analytics', headers=auth(SELLER))
+    assert response.status_code == 500
+    assert response.json == {'error': 'Failed to load analytics'}
+    assert 'db-internal' in caplog.text
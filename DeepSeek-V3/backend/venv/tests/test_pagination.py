@@ -0,0 +1,98 @@
+# tests/test_pagination.py
+import base64
+import json
+from decimal import Decimal
+import pytest
+from models import db
+from models.product import MsProduct
+from models.user import MsUser
+from utils.pagination import encode_cursor
+
+SELLER = 'seller@example.com'
+PRODUCTS = 23
+PAGE_SIZE = 7
+
+@pytest.fixture
+def product_ids(app):
+    db.session.add(MsUser(email=SELLER, password='password', role='Seller'))
+    products = [
+        MsProduct(product_name=f'Lamp {n}', product_price=Decimal('9.99'), product_stock=5, product_owner=SELLER)
+        for n in range(PRODUCTS)
+    ]
+    db.session.add_all(products)
+    db.session.commit()
+    return {product.product_id for product in products}
+
+@pytest.fixture
+def auth(product_ids):
+    return {'Authorization': f'Bearer {db.session.get(MsUser, SELLER).generate_token()}'}
+
+# One page of products and the cursor of the next; the seller listing is a
+# bare list with an X-Next-Cursor header, search results carry next_cursor
+def get_page(client, path, headers, params):
+    response = client.get(path, headers=headers, query_string=params)
+    assert response.status_code == 200
+    body = response.get_json()
+    if isinstance(body, list):
+        return body, response.headers.get('X-Next-Cursor')
+    return body['products'], body['next_cursor']
+
+# Follow the cursor from the first page to the last, collecting product ids
+def walk(client, path, headers, **params):
+    seen, cursor, pages = [], None, 0
+    while True:
+        query = dict(params, limit=PAGE_SIZE, **({'cursor': cursor} if cursor else {}))
+        products, cursor = get_page(client, path, headers, query)
+        seen.extend(product['product_id'] for product in products)
+        pages += 1
+        if cursor is None:
+            return seen, pages
+
+@pytest.mark.parametrize('path, params', [
+    ('/product', {}),
+    ('/product/search', {}),
+    ('/product/search', {'q': 'lamp'}),
+])
+def test_pages_cover_every_product_once(client, product_ids, auth, path, params):
+    seen, pages = walk(client, path, auth, **params)
+    assert len(seen) == len(set(seen))
+    assert set(seen) == product_ids
+    assert pages == -(-PRODUCTS // PAGE_SIZE)
+
+def test_stream_resumes_after_cursor(client, product_ids, auth):
+    first = client.get('/product', headers=auth, query_string={'limit': PAGE_SIZE})
+    response = client.get('/product', headers=auth, query_string={
+        'format': 'ndjson', 'cursor': first.headers['X-Next-Cursor']
+    })
+    streamed = [json.loads(line)['product_id'] for line in response.get_data(as_text=True).splitlines()]
+    page_ids = [product['product_id'] for product in first.get_json()]
+    assert set(page_ids).isdisjoint(streamed)
+    assert set(page_ids) | set(streamed) == product_ids
+
+def raw_cursor(text):
+    return base64.urlsafe_b64encode(text.encode('utf-8')).decode('ascii')
+
+@pytest.mark.parametrize('cursor', [
+    'not a cursor',
+    raw_cursor('not json'),
+    raw_cursor('{"product_id": 1}'),
+    encode_cursor([]),
+    encode_cursor([None]),
+    encode_cursor([[1]]),
+    encode_cursor(['00000000-0000-0000-0000-000000000000', 1]),
+])
+@pytest.mark.parametrize('path', ['/product', '/product/search'])
+def test_bad_cursor_is_rejected(client, auth, path, cursor):
+    for params in ({}, {'format': 'ndjson'}):
+        response = client.get(path, headers=auth, query_string=dict(params, cursor=cursor))
+        assert response.status_code == 400
+        assert response.get_json() == {'error': 'Invalid cursor'}
+
+@pytest.mark.parametrize('cursor', [
+    encode_cursor([None, None]),
+    encode_cursor(['-1', 'not-a-uuid']),
+    encode_cursor([-1.0]),
+])
+def test_bad_search_cursor_is_rejected(client, product_ids, cursor):
+    response = client.get('/product/search', query_string={'q': 'lamp', 'cursor': cursor})
+    assert response.status_code == 400
@@ -0,0 +1,113 @@
+# tests/test_product_cache.py
+import sys
+import uuid
+from decimal import Decimal
+import pytest
+from models import db
+from models.cart import Cart
+from models.product import MsProduct
+from models.user import MsUser
+from utils.cache import LRUCache, ProductCache, RedisCache, product_cache
+
+SELLER = 'seller@example.com'
+CUSTOMER = 'customer@example.com'
+
+# Stands in for a redis-py client
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+class DownRedis:
+    def get(self, *args):
+        raise ConnectionError('connection refused')
+
+    setex = delete = get
+
+@pytest.fixture
+def redis_client(app):
+    client = FakeRedis()
+    product_cache.backend = RedisCache(client)
+    return client
+
+@pytest.fixture
+def product_id(app):
+    db.session.add_all([
+        MsUser(email=SELLER, password='password', role='Seller'),
+        MsUser(email=CUSTOMER, password='password', role='Customer'),
+    ])
+    product = MsProduct(product_name='Lamp', product_price=Decimal('9.99'), product_stock=10, product_owner=SELLER)
+    db.session.add(product)
+    db.session.commit()
+    return product.product_id
+
+def cache_key(product_id):
+    return f'product:{product_id}'
+
+def auth(email):
+    return {'Authorization': f'Bearer {db.session.get(MsUser, email).generate_token()}'}
+
+def get_product(client, product_id, **headers):
+    return client.get(f'/product/{product_id}', headers=headers)
+
+def test_miss_then_hit(client, redis_client, product_id):
+    first = get_product(client, product_id)
+    assert first.status_code == 200
+    assert cache_key(product_id) in redis_client.data
+
+    second = get_product(client, product_id)
+    assert second.get_json() == first.get_json()
+    assert product_cache.stats() == {'backend': 'redis', 'hits': 1, 'misses': 1}
+
+def test_matching_etag_gets_304(client, redis_client, product_id):
+    etag = get_product(client, product_id).headers['ETag']
+    assert get_product(client, product_id, **{'If-None-Match': etag}).status_code == 304
+    assert get_product(client, product_id, **{'If-None-Match': '"stale"'}).status_code == 200
+
+@pytest.mark.parametrize('method, body', [
+    ('put', {'product_name': 'Desk lamp', 'product_price': 12.5, 'product_stock': 4}),
+    ('delete', None),
+])
+def test_writes_invalidate(client, redis_client, product_id, method, body):
+    get_product(client, product_id)
+    assert cache_key(product_id) in redis_client.data
+
+    response = getattr(client, method)(f'/product/{product_id}', json=body, headers=auth(SELLER))
+    assert response.status_code == 200
+    assert cache_key(product_id) not in redis_client.data
+
+def test_checkout_invalidates(client, redis_client, product_id):
+    db.session.add(Cart(product_id=product_id, customer=CUSTOMER, quantity=3))
+    db.session.commit()
+    get_product(client, product_id)
+
+    response = client.post('/checkout', headers=auth(CUSTOMER), json={
+        'shipping_address': '1 Test Street', 'payment_method': 'Card'
+    })
+    assert response.status_code == 201
+    assert cache_key(product_id) not in redis_client.data
+    assert get_product(client, product_id).get_json()['product_stock'] == 7
+
+def test_unreachable_redis_is_a_miss(client, product_id):
+    product_cache.backend = RedisCache(DownRedis())
+    assert get_product(client, product_id).status_code == 200
+    assert get_product(client, product_id).status_code == 200
+
+def test_redis_backend_falls_back_to_memory_without_the_package(app, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'redis', None)  # import redis raises ImportError
+    app.config['PRODUCT_CACHE_BACKEND'] = 'redis'
+    cache = ProductCache(app)
+    assert isinstance(cache.backend, LRUCache)
+    app.extensions['product_cache'] = product_cache
+
+def test_unknown_product_is_not_cached(client, redis_client):
+    assert get_product(client, uuid.uuid4()).status_code == 404
+    assert redis_client.data == {}
@@ -0,0 +1,97 @@
+# tests/test_search.py
+from decimal import Decimal
+import pytest
+from models import db
+from models.product import MsProduct
+from models.user import MsUser
+from utils.search import get_search_engine
+
+SELLER = 'seller@example.com'
+OTHER_SELLER = 'other@example.com'
+
+@pytest.fixture
+def engine(app):
+    db.session.add_all([
+        MsUser(email=SELLER, password='password', role='Seller'),
+        MsUser(email=OTHER_SELLER, password='password', role='Seller'),
+    ])
+    db.session.commit()
+    engine = get_search_engine()
+    assert engine.name == 'local'
+    return engine
+
+def add_product(name, description='', stock=5, owner=SELLER):
+    product = MsProduct(
+        product_name=name, product_description=description, product_price=Decimal('9.99'),
+        product_stock=stock, product_owner=owner
+    )
+    db.session.add(product)
+    db.session.commit()
+    return product
+
+# The base query of the search route
+def available():
+    return MsProduct.query.filter(MsProduct.product_stock >= 1)
+
+def names(engine, text, base_query=None):
+    products, _ = engine.search(base_query or available(), text)
+    return [product.product_name for product in products]
+
+def test_prefix_and_fuzzy_matches(engine):
+    add_product('Desk lamp')
+    add_product('Office chair')
+
+    assert names(engine, 'lam') == ['Desk lamp']
+    assert names(engine, 'lampp') == ['Desk lamp']
+    assert names(engine, 'chiar') == ['Office chair']
+    assert names(engine, 'sofa') == []
+
+def test_every_term_must_match(engine):
+    add_product('Red lamp')
+    add_product('Blue lamp')
+    add_product('Red chair')
+
+    assert names(engine, 'red lamp') == ['Red lamp']
+    assert sorted(names(engine, 'lamp')) == ['Blue lamp', 'Red lamp']
+
+def test_name_matches_rank_above_description_matches(engine):
+    add_product('Reading light', description='A lamp for the desk')
+    add_product('Desk lamp')
+
+    assert names(engine, 'lamp') == ['Desk lamp', 'Reading light']
+
+def test_pages_follow_the_rank_cursor_without_duplicates(engine):
+    expected = {add_product(f'Lamp {n}', description='lamp' if n % 2 else '').product_id for n in range(17)}
+
+    seen, cursor = [], None
+    while True:
+        products, cursor = engine.search(available(), 'lamp', cursor, limit=5)
+        seen.extend(product.product_id for product in products)
+        if cursor is None:
+            break
+    assert len(seen) == len(set(seen))
+    assert set(seen) == expected
+    assert list(engine.iter_search(available(), 'lamp')) == [db.session.get(MsProduct, key) for key in seen]
+
+def test_index_is_rebuilt_after_a_name_change(engine):
+    product = add_product('Desk lamp')
+    assert names(engine, 'lamp') == ['Desk lamp']
+
+    product.product_name = 'Office chair'
+    db.session.commit()
+    assert names(engine, 'lamp') == []
+    assert names(engine, 'chair') == ['Office chair']
+
+def test_base_query_filters_results(engine):
+    add_product('Lamp in stock')
+    add_product('Lamp sold out', stock=0)
+    add_product('Lamp from another seller', owner=OTHER_SELLER)
+
+    assert sorted(names(engine, 'lamp')) == ['Lamp from another seller', 'Lamp in stock']
+    mine = available().filter(MsProduct.product_owner == SELLER)
+    assert names(engine, 'lamp', mine) == ['Lamp in stock']
+
+    # Filtered rows are skipped without leaving short pages behind
+    products, cursor = engine.search(mine, 'lamp', limit=1)
+    assert [product.product_name for product in products] == ['Lamp in stock']
+    assert cursor is None
@@ -0,0 +1,124 @@
+# utils/order_stats.py
+from collections import defaultdict
+from datetime import datetime, timedelta
+from models import db
+from models.order import Order
+from models.order_stats import OrderDailyStats
+from models.product import MsProduct
+
+# Seller analytics backed by OrderDailyStats, which holds per product, day
+# and status totals. Checkout and status changes apply their deltas in the
+# same transaction as the order rows, so the dashboard reads a few summary
+# rows instead of aggregating every order of the seller.
+
+DEFAULT_WINDOW_DAYS = 30
+MAX_WINDOW_DAYS = 366
+
+def _insert(table):
+    if db.session.get_bind().dialect.name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+    return insert(table)
+
+# Add `sign` times the order to the delta of its (product, day, status) row
+def _add(deltas, order, status, seller, sign):
+    delta = deltas[(order.product_id, order.timestamp.date(), status)]
+    delta['seller'] = seller
+    delta['order_count'] += sign
+    delta['units'] += sign * order.quantity
+    delta['revenue'] += sign * order.quantity * order.unit_price
+
+def _new_deltas():
+    return defaultdict(lambda: {'order_count': 0, 'units': 0, 'revenue': 0})
+
+# Upsert the deltas with one INSERT ... ON CONFLICT DO UPDATE. Rows are sent
+# in key order so concurrent checkouts lock summary rows in the same order.
+def _apply(deltas):
+    if not deltas:
+        return
+    rows = [
+        {'product_id': product_id, 'day': day, 'status': status, **delta}
+        for (product_id, day, status), delta in sorted(deltas.items())
+    ]
+    stmt = _insert(OrderDailyStats).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['product_id', 'day', 'status'],
+        set_={
+            'order_count': OrderDailyStats.order_count + stmt.excluded.order_count,
+            'units': OrderDailyStats.units + stmt.excluded.units,
+            'revenue': OrderDailyStats.revenue + stmt.excluded.revenue
+        }
+    )
+    db.session.execute(stmt)
+
+# Count new, flushed orders
+def record_orders(orders):
+    deltas = _new_deltas()
+    for order in orders:
+        _add(deltas, order, order.status, order.product.product_owner, 1)
+    _apply(deltas)
+
+# Move an order whose status was just changed from `old_status`
+def move_order(order, old_status):
+    seller = order.product.product_owner
+    deltas = _new_deltas()
+    _add(deltas, order, old_status, seller, -1)
+    _add(deltas, order, order.status, seller, 1)
+    _apply(deltas)
+
+# Recompute every summary row from Orders, e.g. after bulk imports
+def rebuild():
+    # date() rather than CAST, which SQLite turns into just the year
+    day = db.func.date(Order.timestamp, type_=db.Date)
+    status = db.func.coalesce(Order.status, 'Pending')
+    select = db.select(
+        Order.product_id, day, status, MsProduct.product_owner,
+        db.func.count(), db.func.sum(Order.quantity), db.func.sum(Order.quantity * Order.unit_price)
+    ).join(MsProduct, Order.product_id == MsProduct.product_id)\
+        .group_by(Order.product_id, day, status, MsProduct.product_owner)
+
+    db.session.query(OrderDailyStats).delete(synchronize_session=False)
+    db.session.execute(db.insert(OrderDailyStats).from_select(
+        ['product_id', 'day', 'status', 'seller', 'order_count', 'units', 'revenue'], select
+    ))
+
+def _totals(orders, units, revenue):
+    return {'orders': int(orders or 0), 'units': int(units or 0), 'revenue': float(revenue or 0)}
+
+# Order counts by status (all time), plus totals, per-product and per-day
+# revenue and units over the last `days` days
+def seller_analytics(seller, days=DEFAULT_WINDOW_DAYS):
+    since = datetime.utcnow().date() - timedelta(days=days - 1)  # orders are stamped in UTC
+    stats = OrderDailyStats
+    sums = (db.func.sum(stats.order_count), db.func.sum(stats.units), db.func.sum(stats.revenue))
+
+    status_counts = db.session.query(stats.status, db.func.sum(stats.order_count))\
+        .filter(stats.seller == seller)\
+        .group_by(stats.status)\
+        .all()
+
+    products = db.session.query(stats.product_id, MsProduct.product_name, *sums)\
+        .outerjoin(MsProduct, stats.product_id == MsProduct.product_id)\
+        .filter(stats.seller == seller, stats.day >= since)\
+        .group_by(stats.product_id, MsProduct.product_name)\
+        .order_by(db.func.sum(stats.revenue).desc(), stats.product_id)\
+        .all()
+
+    daily = db.session.query(stats.day, *sums)\
+        .filter(stats.seller == seller, stats.day >= since)\
+        .group_by(stats.day)\
+        .order_by(stats.day)\
+        .all()
+
+    return {
+        'since': since.isoformat(),
+        'days': days,
+        'status_counts': {status: int(count) for status, count in status_counts if count},
+        'totals': _totals(*(sum(row[i] or 0 for row in daily) for i in (1, 2, 3))),
+        'products': [
+            {'product_id': product_id, 'product_name': name, **_totals(*values)}
+            for product_id, name, *values in products
+        ],
+        'daily': [{'date': day.isoformat(), **_totals(*values)} for day, *values in daily]
+    }
@@ -0,0 +1,189 @@
+# utils/search.py
+import bisect
+import difflib
+import itertools
+import re
+import threading
+from flask import current_app
+from sqlalchemy import Float, cast, event, func, inspect, or_
+from models import db
+from models.product import MsProduct
+from utils.pagination import (
+    DEFAULT_PAGE_SIZE, STREAM_BATCH_SIZE, apply_cursor, decode_cursor, encode_cursor, paginate
+)
+
+# Text search configuration used both here and by the GIN index in
+# sql/0001_product_search.sql; the expressions must match for Postgres to
+# use the index
+TS_CONFIG = 'simple'
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+def tokenize(text):
+    return _TOKEN_RE.findall((text or '').lower())
+
+# Full-text search backed by the indexed tsvector over name and description,
+# plus a trigram index on the name for typo tolerance. Results are ordered
+# by relevance and paginated with a (rank, id) keyset cursor.
+class PostgresSearchEngine:
+    name = 'postgres'
+
+    def _ranked_query(self, base_query, text):
+        tokens = tokenize(text)
+        # Every term is a prefix match so results show up while typing
+        tsquery = func.to_tsquery(TS_CONFIG, ' & '.join(f'{token}:*' for token in tokens))
+        vector = func.to_tsvector(
+            TS_CONFIG,
+            func.coalesce(MsProduct.product_name, '') + ' ' + func.coalesce(MsProduct.product_description, '')
+        )
+        # ts_rank and similarity are float4; widen to float8 so the value the
+        # driver returns for the cursor compares equal to the one in SQL
+        rank = cast(func.ts_rank(vector, tsquery) + func.similarity(MsProduct.product_name, text), Float(53))
+
+        query = base_query.with_entities(MsProduct, rank).filter(or_(
+            vector.op('@@')(tsquery),
+            # Trigram match, using pg_trgm.similarity_threshold (0.3 by default)
+            MsProduct.product_name.op('%')(text)
+        ))
+        return query, [-rank, MsProduct.product_id]
+
+    def search(self, base_query, text, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        query, order_by = self._ranked_query(base_query, text)
+        rows, next_cursor = paginate(query, order_by, lambda row: [-row[1], row[0].product_id], cursor, limit)
+        return [product for product, _ in rows], next_cursor
+
+    def iter_search(self, base_query, text, cursor=None):
+        query, order_by = self._ranked_query(base_query, text)
+        query = apply_cursor(query, order_by, cursor)
+        return (product for product, _ in query.order_by(*order_by).yield_per(STREAM_BATCH_SIZE))
+
+    def invalidate(self):
+        # The database keeps its own index up to date
+        pass
+
+# In-process inverted index used when the database is not Postgres (e.g.
+# SQLite in development). It supports the same prefix and typo-tolerant
+# matching, but the index lives in memory and is rebuilt after product
+# names or descriptions change.
+class LocalSearchEngine:
+    name = 'local'
+
+    # Score weights for how a query term matched an indexed term
+    EXACT, PREFIX, FUZZY = 1.0, 0.8, 0.5
+    NAME_BOOST = 2.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = None  # term -> {product id: weight}
+        self._terms = []    # sorted vocabulary for prefix lookups
+
+    def invalidate(self):
+        with self._lock:
+            self._index = None
+
+    def _build(self):
+        index = {}
+        rows = db.session.query(
+            MsProduct.product_id, MsProduct.product_name, MsProduct.product_description
+        ).yield_per(STREAM_BATCH_SIZE)
+        for product_id, name, description in rows:
+            for token in tokenize(description):
+                postings = index.setdefault(token, {})
+                postings[product_id] = max(postings.get(product_id, 0), 1.0)
+            for token in tokenize(name):
+                index.setdefault(token, {})[product_id] = self.NAME_BOOST
+        return index
+
+    def _ensure_index(self):
+        with self._lock:
+            if self._index is None:
+                self._index = self._build()
+                self._terms = sorted(self._index)
+            return self._index, self._terms
+
+    def _expand(self, token, terms):
+        # Map a query token to the indexed terms it matches and how well
+        matches = {}
+        start = bisect.bisect_left(terms, token)
+        for term in terms[start:]:
+            if not term.startswith(token):
+                break
+            matches[term] = self.EXACT if term == token else self.PREFIX
+        for term in difflib.get_close_matches(token, terms, n=5, cutoff=0.75):
+            matches.setdefault(term, self.FUZZY)
+        return matches
+
+    def _score(self, text):
+        index, terms = self._ensure_index()
+        scores = None
+        # Every query token must match, like the Postgres "&" query
+        for token in tokenize(text):
+            token_scores = {}
+            for term, quality in self._expand(token, terms).items():
+                for key, weight in index[term].items():
+                    token_scores[key] = max(token_scores.get(key, 0), quality * weight)
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {key: scores[key] + score for key, score in token_scores.items() if key in scores}
+            if not scores:
+                break
+        return scores or {}
+
+    # Rank matching ids in memory, best first, after the cursor if any
+    def _ranked(self, text, cursor):
+        ranked = sorted((-score, str(key), key) for key, score in self._score(text).items())
+        if cursor:
+            after = tuple(decode_cursor(cursor))
+            if len(after) != 2 or not isinstance(after[0], (int, float)) or not isinstance(after[1], str):
+                raise ValueError('Invalid cursor')
+            ranked = [item for item in ranked if item[:2] > after]
+        return ranked
+
+    # Load ranked products in chunks, skipping ids the base query filters out
+    # (e.g. out of stock), so only as many rows as the caller consumes are read
+    def _load(self, base_query, ranked, chunk_size):
+        for start in range(0, len(ranked), chunk_size):
+            chunk = ranked[start:start + chunk_size]
+            products = {
+                product.product_id: product
+                for product in base_query.filter(MsProduct.product_id.in_([key for _, _, key in chunk]))
+            }
+            for score, key_text, key in chunk:
+                product = products.get(key)
+                if product is not None:
+                    yield score, key_text, product
+
+    def search(self, base_query, text, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        ranked = self._ranked(text, cursor)
+        page = list(itertools.islice(self._load(base_query, ranked, limit + 1), limit + 1))
+        next_cursor = encode_cursor(page[limit - 1][:2]) if len(page) > limit else None
+        return [product for _, _, product in page[:limit]], next_cursor
+
+    def iter_search(self, base_query, text, cursor=None):
+        ranked = self._ranked(text, cursor)
+        return (product for _, _, product in self._load(base_query, ranked, STREAM_BATCH_SIZE))
+
+_postgres_engine = PostgresSearchEngine()
+_local_engine = LocalSearchEngine()
+
+# Pick the engine from SEARCH_BACKEND, or from the database dialect when it
+# is not set
+def get_search_engine():
+    backend = current_app.config.get('SEARCH_BACKEND')
+    if backend is None:
+        backend = 'postgres' if db.engine.dialect.name == 'postgresql' else 'local'
+    return _postgres_engine if backend == 'postgres' else _local_engine
+
+# Keep the local index in step with product writes
+@event.listens_for(MsProduct, 'after_insert')
+@event.listens_for(MsProduct, 'after_delete')
+def _product_added_or_removed(mapper, connection, target):
+    _local_engine.invalidate()
+
+@event.listens_for(MsProduct, 'after_update')
+def _product_updated(mapper, connection, target):
+    state = inspect(target)
+    if state.attrs.product_name.history.has_changes() or \
+            state.attrs.product_description.history.has_changes():
+        _local_engine.invalidate()
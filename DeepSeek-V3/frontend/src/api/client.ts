@@ -10,4 +10,58 @@ const apiClient = axios.create({
     },
 });
 
+// When the access token has expired, get a new one with the refresh token
+// and retry the request once. Concurrent failures share one refresh request.
+let refreshRequest: Promise<string> | null = null;
+
+const refreshAccessToken = async (): Promise<string> => {
+    const refreshToken = localStorage.getItem("refreshToken");
+    if (!refreshToken) {
+        throw new Error("No refresh token");
+    }
+    const response = await axios.post<{ token: string }>(
+        `${apiClient.defaults.baseURL}/refresh`,
+        null,
+        { headers: { Authorization: `Bearer ${refreshToken}` } }
+    );
+    localStorage.setItem("token", response.data.token);
+    return response.data.token;
+};
+
+// A 401 from these means wrong credentials or a refresh token that is no
+// longer valid, so it goes straight back to the caller instead of
+// triggering another refresh
+const AUTH_PATHS = ["/login", "/register", "/refresh"];
+
+const isAuthRequest = (url = ""): boolean =>
+    AUTH_PATHS.includes(url.split("?")[0]);
+
+apiClient.interceptors.response.use(
+    (response) => response,
+    async (error) => {
+        const original = error.config;
+        if (
+            error.response?.status !== 401 ||
+            !original ||
+            original._retried ||
+            isAuthRequest(original.url)
+        ) {
+            return Promise.reject(error);
+        }
+        original._retried = true;
+        try {
+            refreshRequest =
+                refreshRequest ??
+                refreshAccessToken().finally(() => {
+                    refreshRequest = null;
+                });
+            const token = await refreshRequest;
+            original.headers["Authorization"] = `Bearer ${token}`;
+            return apiClient(original);
+        } catch {
+            return Promise.reject(error);
+        }
+    }
+);
+
 export default apiClient;
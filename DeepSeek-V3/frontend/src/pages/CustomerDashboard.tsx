@@ -7,6 +7,8 @@ export default function CustomerDashboard() {
     const [products, setProducts] = useState<Product[]>([]);
     const [searchQuery, setSearchQuery] = useState("");
     const [isLoading, setIsLoading] = useState(false);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [isLoadingMore, setIsLoadingMore] = useState(false);
     const [error, setError] = useState("");
     const [message, setMessage] = useState("");
     const navigate = useNavigate();
@@ -19,9 +21,10 @@ export default function CustomerDashboard() {
         try {
             setIsLoading(true);
             setError("");
-            const { products, message } = await searchProducts(searchQuery);
-            setProducts(products);
-            setMessage(message || "");
+            const page = await searchProducts(searchQuery);
+            setProducts(page.products);
+            setNextCursor(page.next_cursor);
+            setMessage(page.message || "");
         } catch (err) {
             setError("Failed to fetch products");
             console.error(err);
@@ -30,6 +33,21 @@ export default function CustomerDashboard() {
         }
     };
 
+    const handleLoadMore = async () => {
+        if (!nextCursor) return;
+        try {
+            setIsLoadingMore(true);
+            const page = await searchProducts(searchQuery, nextCursor);
+            setProducts((prev) => [...prev, ...page.products]);
+            setNextCursor(page.next_cursor);
+        } catch (err) {
+            setError("Failed to fetch products");
+            console.error(err);
+        } finally {
+            setIsLoadingMore(false);
+        }
+    };
+
     const handleSearch = (e: React.FormEvent) => {
         e.preventDefault();
         fetchProducts();
@@ -133,6 +151,18 @@ export default function CustomerDashboard() {
                     ))}
                 </div>
             )}
+
+            {/* Load More */}
+            {!isLoading && nextCursor && (
+                <div className="flex justify-center mt-8">
+                    <button
+                        onClick={handleLoadMore}
+                        disabled={isLoadingMore}
+                        className="bg-blue-500 hover:bg-blue-600 text-white px-6 py-2 rounded-lg transition duration-200 disabled:opacity-50">
+                        {isLoadingMore ? "Loading..." : "Load More"}
+                    </button>
+                </div>
+            )}
         </div>
     );
 }
@@ -12,10 +12,11 @@ export default function Login() {
     const handleSubmit = async (e: React.FormEvent) => {
         e.preventDefault();
         try {
-            const { token, role } = await login(email, password);
+            const { token, refresh_token, role } = await login(email, password);
 
             // Store auth data
             localStorage.setItem("token", token);
+            localStorage.setItem("refreshToken", refresh_token);
             localStorage.setItem("user", JSON.stringify({ email, role }));
 
             // Redirect based on role
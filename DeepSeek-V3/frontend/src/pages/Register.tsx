@@ -13,10 +13,11 @@ export default function Register() {
     const handleSubmit = async (e: React.FormEvent) => {
         e.preventDefault();
         try {
-            const { token } = await register(email, password, role);
+            const { token, refresh_token } = await register(email, password, role);
 
             // Store auth data
             localStorage.setItem("token", token);
+            localStorage.setItem("refreshToken", refresh_token);
             localStorage.setItem("user", JSON.stringify({ email, role }));
 
             // Redirect based on role
@@ -10,6 +10,8 @@ import type { Product, ProductFormData } from "../types/product";
 export default function SellerDashboard() {
     const [products, setProducts] = useState<Product[]>([]);
     const [isLoading, setIsLoading] = useState(true);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [isLoadingMore, setIsLoadingMore] = useState(false);
     const [error, setError] = useState("");
     const [success, setSuccess] = useState("");
     const [editingProduct, setEditingProduct] = useState<Product | null>(null);
@@ -32,8 +34,9 @@ export default function SellerDashboard() {
     const fetchProducts = async () => {
         try {
             setIsLoading(true);
-            const data = await getProducts();
-            setProducts(data);
+            const page = await getProducts();
+            setProducts(page.products);
+            setNextCursor(page.next_cursor);
             setError("");
         } catch (err) {
             setError("Failed to fetch products");
@@ -43,6 +46,21 @@ export default function SellerDashboard() {
         }
     };
 
+    const handleLoadMore = async () => {
+        if (!nextCursor) return;
+        try {
+            setIsLoadingMore(true);
+            const page = await getProducts(nextCursor);
+            setProducts((prev) => [...prev, ...page.products]);
+            setNextCursor(page.next_cursor);
+        } catch (err) {
+            setError("Failed to fetch products");
+            console.error(err);
+        } finally {
+            setIsLoadingMore(false);
+        }
+    };
+
     const handleInputChange = (
         e: React.ChangeEvent<HTMLInputElement | HTMLTextAreaElement>
     ) => {
@@ -295,6 +313,17 @@ export default function SellerDashboard() {
                     ))}
                 </div>
             )}
+
+            {!isLoading && nextCursor && (
+                <div className="flex justify-center mt-6">
+                    <button
+                        onClick={handleLoadMore}
+                        disabled={isLoadingMore}
+                        className="bg-blue-500 hover:bg-blue-700 text-white font-bold py-2 px-4 rounded disabled:opacity-50">
+                        {isLoadingMore ? "Loading..." : "Load More"}
+                    </button>
+                </div>
+            )}
         </div>
     );
 }
@@ -42,5 +42,6 @@ export const login = async (email: string, password: string) => {
 
 export const logout = () => {
     localStorage.removeItem("token");
+    localStorage.removeItem("refreshToken");
     localStorage.removeItem("user");
 };
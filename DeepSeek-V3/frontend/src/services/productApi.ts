@@ -1,13 +1,26 @@
 import apiClient from "../api/client";
-import type { Product, ProductFormData, ProductSearchResponse } from "../types/product";
+import type {
+    Product,
+    ProductFormData,
+    ProductPage,
+    ProductSearchResponse,
+} from "../types/product";
 
-export const getProducts = async (): Promise<Product[]> => {
+// The listing is served in keyset pages with the next page's cursor in the
+// X-Next-Cursor header; fetch the page after `cursor`, or the first page
+export const getProducts = async (
+    cursor?: string | null
+): Promise<ProductPage> => {
     const response = await apiClient.get("/product", {
+        params: cursor ? { cursor } : {},
         headers: {
             Authorization: `Bearer ${localStorage.getItem("token")}`,
         },
     });
-    return response.data;
+    return {
+        products: response.data,
+        next_cursor: response.headers["x-next-cursor"] ?? null,
+    };
 };
 
 export const createProduct = async (
@@ -42,18 +55,25 @@ export const deleteProduct = async (productId: string): Promise<void> => {
 };
 
 export const searchProducts = async (
-    query: string = ""
+    query: string = "",
+    cursor?: string | null
 ): Promise<ProductSearchResponse> => {
     try {
+        // Results come in pages; pass next_cursor back to load the next one
         const response = await apiClient.get(`/product/search`, {
             params: {
                 q: query,
                 min_stock: 1,
+                ...(cursor ? { cursor } : {}),
             },
         });
-        return response.data;
+        return {
+            products: response.data.products,
+            message: response.data.message,
+            next_cursor: response.data.next_cursor ?? null,
+        };
     } catch (error) {
         console.error("Error searching products:", error);
         throw error;
     }
-};
\ No newline at end of file
+};
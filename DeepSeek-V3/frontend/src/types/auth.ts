@@ -6,6 +6,7 @@ export interface User {
 export interface AuthResponse {
     message: string;
     token: string;
+    refresh_token: string;
     role?: "Customer" | "Seller";
 }
 
@@ -8,8 +8,12 @@ export interface Product {
     product_owner: string;
 }
 
-export interface ProductSearchResponse {
+export interface ProductPage {
     products: Product[];
+    next_cursor: string | null;
+}
+
+export interface ProductSearchResponse extends ProductPage {
     message?: string;
 }
 
@@ -0,0 +1,44 @@
+"""Time werkzeug password hashing for candidate PASSWORD_HASH_METHOD values.
+
+Login cost is dominated by the password hash, so this shows how many logins
+per second one core can verify with each method before changing the setting:
+
+    python tools/hashbench.py scrypt:32768:8:1 pbkdf2:sha256:600000 \\
+        pbkdf2:sha256:260000 --rounds 20
+
+Existing users are rehashed with the new method on their next login.
+"""
+import argparse
+import statistics
+import time
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+DEFAULT_METHODS = ["scrypt:32768:8:1", "pbkdf2:sha256:600000", "pbkdf2:sha256:260000"]
+
+
+def bench(method, rounds):
+    password_hash = generate_password_hash("correct horse battery staple", method=method)
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        check_password_hash(password_hash, "correct horse battery staple")
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("methods", nargs="*", default=DEFAULT_METHODS)
+    parser.add_argument("--rounds", "-n", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'method':<28}{'mean ms':>10}{'max ms':>10}{'logins/s/core':>16}")
+    for method in args.methods:
+        ms = [t * 1000 for t in bench(method, args.rounds)]
+        mean = statistics.fmean(ms)
+        print(f"{method:<28}{mean:>10.1f}{max(ms):>10.1f}{1000 / mean:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
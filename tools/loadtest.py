@@ -0,0 +1,147 @@
+"""Minimal asyncio HTTP load generator for the Flask backends.
+
+Opens ``--concurrency`` keep-alive connections and sends requests to the
+given paths round-robin for ``--duration`` seconds, then prints throughput and
+latency percentiles. Run it once per server configuration (pool size, workers,
+threads, cache on/off, ...) and use ``--label`` to tell the results apart:
+
+    python tools/loadtest.py http://localhost:5000 /api/products \
+        --concurrency 64 --duration 30 --label "4 workers x 8 threads"
+
+Login and authenticated-request throughput are measured the same way:
+
+    python tools/loadtest.py http://localhost:5000 /api/auth/login \
+        --method POST --data '{"email": "a@b.c", "password": "secret"}'
+    python tools/loadtest.py http://localhost:5000 /api/auth/me \
+        -H "Authorization: Bearer <token>"
+
+Only the standard library is used, so it runs anywhere the backends do.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+async def _read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed by server")
+    status = int(status_line.split()[1])
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(int(headers.get("content-length", 0)))
+
+    return status, headers.get("connection", "").lower() != "close"
+
+
+async def _worker(host, port, paths, deadline, latencies, errors, offset, method, extra_headers, body):
+    reader = writer = None
+    i = offset
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        request = (
+            f"{method} {path} HTTP/1.1\r\nHost: {host}:{port}\r\n{extra_headers}\r\n"
+        ).encode("latin-1") + body
+        started = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            writer.write(request)
+            await writer.drain()
+            status, keep_alive = await _read_response(reader)
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError):
+            errors["connection"] += 1
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+            continue
+
+        latencies.append(time.perf_counter() - started)
+        if status >= 400:
+            errors[f"http {status}"] = errors.get(f"http {status}", 0) + 1
+        if not keep_alive:
+            writer.close()
+            reader = writer = None
+
+    if writer is not None:
+        writer.close()
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run(base_url, paths, concurrency, duration, headers, method="GET", data=None):
+    url = urlsplit(base_url)
+    host, port = url.hostname, url.port or 80
+    prefix = url.path.rstrip("/")
+    paths = [prefix + p for p in paths]
+    body = data.encode("utf-8") if data is not None else b""
+    if data is not None:
+        headers = ["Content-Type: application/json", f"Content-Length: {len(body)}", *headers]
+    extra_headers = "".join(f"{h}\r\n" for h in headers)
+
+    latencies = []
+    errors = {"connection": 0}
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(
+        _worker(host, port, paths, deadline, latencies, errors, n, method, extra_headers, body)
+        for n in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base_url", help="e.g. http://localhost:5000")
+    parser.add_argument("paths", nargs="+", help="request paths, used round-robin")
+    parser.add_argument("--concurrency", "-c", type=int, default=32)
+    parser.add_argument("--duration", "-d", type=float, default=15.0, help="seconds")
+    parser.add_argument("--header", "-H", action="append", default=[],
+                        help="extra request header, e.g. 'Authorization: Bearer ...'")
+    parser.add_argument("--method", "-X", default="GET")
+    parser.add_argument("--data", help="JSON request body, sent with every request")
+    parser.add_argument("--label", default="", help="name of the configuration under test")
+    args = parser.parse_args()
+
+    latencies, errors, elapsed = asyncio.run(
+        run(args.base_url, args.paths, args.concurrency, args.duration, args.header,
+            args.method.upper(), args.data)
+    )
+    latencies.sort()
+    ms = [v * 1000 for v in latencies]
+
+    print(f"config:      {args.label or '-'}")
+    print(f"requests:    {len(ms)} in {elapsed:.1f}s, concurrency {args.concurrency}")
+    print(f"throughput:  {len(ms) / elapsed:.1f} req/s")
+    if ms:
+        print(f"latency ms:  mean {statistics.fmean(ms):.2f}  p50 {_percentile(ms, 50):.2f}  "
+              f"p90 {_percentile(ms, 90):.2f}  p99 {_percentile(ms, 99):.2f}  max {ms[-1]:.2f}")
+    failed = {k: v for k, v in errors.items() if v}
+    print(f"errors:      {failed or 'none'}")
+
+
+if __name__ == "__main__":
+    main()